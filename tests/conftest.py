@@ -230,3 +230,13 @@ def tetodl_debug(request: pytest.FixtureRequest):
             set_debug(prev_mode)
         else:
             set_debug(False)
+
+
+@pytest.fixture(autouse=True)
+def _unpaced_youtube() -> Iterator[None]:
+    """Keep the process-wide YouTube token bucket from pacing tests."""
+    from tetodl.utils.ratelimit import youtube_bucket
+
+    youtube_bucket.configure(0, 1)
+    yield
+    youtube_bucket.configure(0, 1)
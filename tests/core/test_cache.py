@@ -20,6 +20,16 @@ class TestCache:
 
         reset_cache()
 
+    def test_cache_metadata_keyed_by_video_id(self):
+        """Different URL forms of one video share a single metadata entry."""
+        from tetodl.core.domain.cache import cache_metadata, get_cached_metadata
+
+        cache_metadata("https://youtu.be/dQw4w9WgXcQ", {"title": "Song"})
+
+        assert get_cached_metadata("dQw4w9WgXcQ") == {"title": "Song"}
+        assert get_cached_metadata("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == {"title": "Song"}
+        assert get_cached_metadata("https://music.youtube.com/watch?v=dQw4w9WgXcQ&si=x") == {"title": "Song"}
+
     def test_get_cached_metadata_missing(self):
         """get_cached_metadata returns None for an unknown URL."""
         from tetodl.core.domain.cache import get_cached_metadata, reset_cache
@@ -153,3 +163,349 @@ class TestCache:
         import shutil
         shutil.rmtree(str(dc._base), ignore_errors=True)
         reset_cache()
+
+    def test_packed_disk_cache_stats_and_evict(self):
+        """The packed backend keeps running totals and evicts expired rows by range."""
+        from tetodl.core.domain.cache import _DiskCache, reset_cache
+        reset_cache()
+
+        dc = _DiskCache("test_packed", 86400)
+        dc.set_many([("a", {"n": 1}, None), ("b", "x" * 2000, None), ("c", [1, 2], 0)])
+        dc.set("a", {"n": 2})
+
+        stats = dc.stats
+        assert stats.disk_entries == 3
+        assert stats.disk_bytes > 0
+        assert dc.get("a") == {"n": 2}
+        assert dc.get("b") == "x" * 2000
+
+        assert dc.evict() == 1
+        assert dc.stats.disk_entries == 2
+        assert list(dc._base.iterdir()) and not list(dc._base.glob("*.json"))
+
+        dc.close()
+        reset_cache()
+
+    def test_value_encoding_round_trip(self):
+        """Values survive the compact JSON encoding, compressed or not."""
+        from tetodl.core.domain.cache import MISS, _decode_value, _encode_value
+
+        small = {"y": "https://music.youtube.com/watch?v=abc", "c": ""}
+        large = {"lines": ["la"] * 1000, "synced": True, "n": None}
+
+        assert _encode_value(small)[1:2] == b"J"
+        assert _encode_value(large)[1:2] == b"Z"
+        assert _decode_value(_encode_value(small)) == small
+        assert _decode_value(_encode_value(large)) == large
+        assert _decode_value(_encode_value(MISS)) is MISS
+
+    def test_foreign_value_format_is_a_miss(self):
+        """Blobs from another encoding are dropped instead of decoded."""
+        import marshal
+
+        from tetodl.core.domain.cache import _DiskCache, reset_cache
+        reset_cache()
+
+        dc = _DiskCache("test_format", 3600)
+        dc.set("k", {"a": 1})
+        with dc._conn:
+            dc._conn.execute(
+                "UPDATE entries SET value = ? WHERE key = 'k'",
+                (b"M" + marshal.dumps({"a": 1}),),
+            )
+        assert dc.get("k") is None
+        assert dc.get("k") is None
+
+        dc.close()
+        reset_cache()
+
+    def test_file_backend_selectable(self):
+        """A namespace can still opt into the file-per-key backend."""
+        from tetodl.core.domain.cache import Cache, _FileDiskCache, reset_cache
+        reset_cache()
+
+        cache = Cache(namespace="test_files", backend="files")
+        assert isinstance(cache._disk, _FileDiskCache)
+        cache.set("k", "v")
+        cache.flush()
+        assert len(list(cache._disk._base.glob("*.json"))) == 1
+
+        reset_cache()
+
+    def test_set_applies_backpressure(self, monkeypatch):
+        """set() flushes inline once the dirty set reaches MAX_DIRTY."""
+        import tetodl.core.domain.cache as cache_mod
+        cache_mod.reset_cache()
+        monkeypatch.setattr(cache_mod, "MAX_DIRTY", 3)
+
+        cache = cache_mod.get_cache("yt_match")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.dirty_count == 2
+        assert cache.stats.disk_entries == 0
+
+        cache.set("c", 3)
+        assert cache.dirty_count == 0
+        assert cache.stats.disk_entries == 3
+
+        cache_mod.reset_cache()
+
+    def test_flush_keeps_entries_evicted_from_memory(self):
+        """Dirty entries pushed out of the memory LRU are still read and flushed."""
+        from tetodl.core.domain.cache import Cache, reset_cache
+        reset_cache()
+
+        cache = Cache(namespace="test_overflow", max_mem=2)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+        assert len(cache._mem) == 2
+        assert cache.get("k0") == 0
+
+        cache.flush()
+
+        assert cache.dirty_count == 0
+        assert cache.stats.disk_entries == 5
+        cache._mem.clear()
+        assert [cache.get(f"k{i}") for i in range(5)] == [0, 1, 2, 3, 4]
+
+        reset_cache()
+
+    def test_failed_flush_stays_dirty(self, monkeypatch):
+        """A batch that fails to write is retried on the next flush."""
+        import pytest
+
+        from tetodl.core.domain.cache import Cache, reset_cache
+        reset_cache()
+
+        cache = Cache(namespace="test_flush_fail", max_mem=1)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        real = cache._disk.set_many
+        monkeypatch.setattr(cache._disk, "set_many", lambda items: (_ for _ in ()).throw(OSError()))
+        with pytest.raises(OSError):
+            cache.flush()
+        assert cache.dirty_count == 2
+
+        monkeypatch.setattr(cache._disk, "set_many", real)
+        cache.flush()
+        assert cache.dirty_count == 0
+        assert cache.stats.disk_entries == 2
+
+        reset_cache()
+
+    def test_background_flusher_persists_dirty_entries(self, monkeypatch):
+        """The flusher wakes on the dirty threshold and writes entries to disk."""
+        import time
+
+        import tetodl.core.domain.cache as cache_mod
+        cache_mod.reset_cache()
+        monkeypatch.setattr(cache_mod, "FLUSH_THRESHOLD", 2)
+
+        cache_mod.start_flusher(interval=60)
+        try:
+            cache = cache_mod.get_cache("lyrics")
+            cache.set("k1", "v1")
+            cache.set("k2", "v2")
+
+            deadline = time.time() + 5
+            while cache.stats.disk_entries < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            assert cache.stats.disk_entries == 2
+            assert cache.dirty_count == 0
+        finally:
+            cache_mod.stop_flusher()
+            cache_mod.reset_cache()
+
+    def test_set_miss_is_distinct_from_absent(self):
+        """A negative entry reads back as MISS, from memory and from disk."""
+        from tetodl.core.domain.cache import MISS, get_cache, reset_cache
+        reset_cache()
+
+        cache = get_cache("lyrics")
+        cache.set_miss("no-lyrics")
+        assert cache.get("no-lyrics") is MISS
+        assert not cache.get("no-lyrics")
+        assert cache.get("never-looked-up") is None
+
+        cache.flush()
+        cache._mem.clear()
+        assert cache.get("no-lyrics") is MISS
+        assert cache._mem._data["no-lyrics"].ttl == cache._miss_ttl
+
+        reset_cache()
+
+    def test_search_lyrics_skips_providers_on_known_miss(self, mocker):
+        """search_lyrics answers a cached miss without calling any provider."""
+        from tetodl.core.domain.cache import MISS, get_cache
+        from tetodl.core.lyrics import engine
+
+        providers = mocker.patch.object(engine, "get_lyrics_providers", return_value=[])
+
+        assert engine.search_lyrics("Nobody", "Nothing") is None
+        assert get_cache("lyrics").get("lyr:Nobody||Nothing") is MISS
+        assert providers.call_count == 1
+
+        assert engine.search_lyrics("Nobody", "Nothing") is None
+        assert providers.call_count == 1
+
+    def test_search_lyrics_failure_not_cached(self, mocker):
+        """A provider error is not recorded as a miss; the next call retries."""
+        from tetodl.core.domain.cache import get_cache
+        from tetodl.core.lyrics import engine
+
+        failing = mocker.MagicMock()
+        failing.search.side_effect = ConnectionError("timeout")
+        empty = mocker.MagicMock()
+        empty.search.return_value = []
+        mocker.patch.object(engine, "get_lyrics_providers", return_value=[failing, empty])
+
+        assert engine.search_lyrics("Someone", "Something") is None
+        assert get_cache("lyrics").get("lyr:Someone||Something") is None
+
+        assert engine.search_lyrics("Someone", "Something") is None
+        assert failing.search.call_count == 2
+
+    def test_cover_search_failure_not_cached(self, mocker):
+        """Covers are only cached as missing when every provider answered."""
+        from tetodl import core
+        from tetodl.core.cover import CoverQuery, CoverService
+        from tetodl.core.domain.cache import MISS, get_cache
+
+        provider = mocker.MagicMock()
+        provider.search.side_effect = ConnectionError("HTTP 429")
+        mocker.patch.object(core.cover, "get_cover_providers", return_value=[provider])
+        query = CoverQuery(artist="A", title="T")
+        key = "cov:A||T||"
+
+        assert CoverService().search(query) is None
+        assert get_cache("cover").get(key) is None
+
+        provider.search.side_effect = None
+        provider.search.return_value = None
+        assert CoverService().search(query) is None
+        assert get_cache("cover").get(key) is MISS
+
+    def test_disk_budget_evicts_least_recently_used(self, monkeypatch):
+        """Writes past the namespace budget evict the least recently read entries."""
+        import tetodl.core.domain.cache as cache_mod
+        cache_mod.reset_cache()
+        monkeypatch.setattr(cache_mod, "namespace_budget", lambda ns: 1500)
+
+        dc = cache_mod._DiskCache("test_budget", 86400)
+        for key in ("a", "b", "c"):
+            dc.set(key, key * 400)
+        assert dc.get("a") == "a" * 400
+
+        dc.set("d", "d" * 400)
+
+        assert dc.stats.disk_bytes <= 1500
+        assert dc.get("a") is not None
+        assert dc.get("b") is None
+
+        dc.close()
+        cache_mod.reset_cache()
+
+    def test_disk_budget_lfu_keeps_frequent_entries(self, monkeypatch):
+        """The LFU policy evicts the least frequently read entry first."""
+        import tetodl.core.domain.cache as cache_mod
+        cache_mod.reset_cache()
+        monkeypatch.setattr(cache_mod, "namespace_budget", lambda ns: 1500)
+
+        dc = cache_mod._DiskCache("test_lfu", 86400, policy="lfu")
+        for key in ("a", "b", "c"):
+            dc.set(key, key * 400)
+        for _ in range(3):
+            dc.get("a")
+        dc.get("b")
+        dc.get("c")
+        dc.get("c")
+
+        dc.set("d", "d" * 400)
+
+        assert dc.get("b") is None
+        assert dc.get("a") is not None and dc.get("c") is not None
+
+        dc.close()
+        cache_mod.reset_cache()
+
+    def test_image_cache_respects_budget(self, monkeypatch, tmp_path, mocker):
+        """fetch_image evicts the least recently used images once over budget."""
+        import tetodl.core.cover.image as image
+
+        monkeypatch.setattr(image, "_IMG_DIR", tmp_path)
+        monkeypatch.setattr(image, "_img_bytes", None)
+        monkeypatch.setattr(image, "namespace_budget", lambda ns: 2500)
+        session = mocker.patch.object(image, "get_session").return_value
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b"x" * 1000
+
+        image.fetch_image("https://img/1")
+        image.fetch_image("https://img/2")
+        image.fetch_image("https://img/1")
+        image.fetch_image("https://img/3")
+
+        assert image.img_cache_bytes() <= 2500
+        assert (tmp_path / f"{image._url_key('https://img/1')}.img").exists()
+        assert not (tmp_path / f"{image._url_key('https://img/2')}.img").exists()
+
+    def test_cache_usage_reports_every_namespace(self):
+        """cache_usage lists used/budget bytes for each namespace and images."""
+        from tetodl.core.domain.cache import _CACHE_CFG, CACHE_BUDGET, cache_usage
+
+        usage = cache_usage()
+        assert set(usage) == set(_CACHE_CFG) | {"images"}
+        assert sum(b for _, b in usage.values()) <= CACHE_BUDGET
+
+    def test_get_or_load_coalesces_concurrent_misses(self):
+        """Concurrent get_or_load calls for one key run the loader once."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tetodl.core.domain.cache import get_cache
+
+        cache = get_cache("cover")
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(5)
+            return {"url": "https://img/1"}
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(cache.get_or_load, "album", loader) for _ in range(4)]
+            while not calls:
+                pass
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r == {"url": "https://img/1"} for r in results)
+        assert cache.get("album") == {"url": "https://img/1"}
+
+    def test_single_flight_propagates_errors_to_waiters(self):
+        """An exception from the leader reaches every waiting caller."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        import pytest
+
+        from tetodl.core.domain.cache import SingleFlight
+
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def boom():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("provider down")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            leader = pool.submit(flight.do, "k", boom)
+            started.wait(5)
+            waiters = [pool.submit(flight.do, "k", boom) for _ in range(2)]
+            release.set()
+            for f in [leader, *waiters]:
+                with pytest.raises(RuntimeError, match="provider down"):
+                    f.result()
@@ -73,6 +73,24 @@ class TestConfigSave:
         assert saved["max_video_resolution"] == "1080p"
         assert saved["language"] == "en"
 
+    def test_cache_flush_settings_round_trip(self, monkeypatch, mocker, tmp_path):
+        """The flusher interval and threshold are read from and saved to config.json."""
+        import tetodl.core.domain.config as cfg
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"cache_flush_interval": 5.0, "cache_flush_threshold": 8}))
+        monkeypatch.setattr(cfg, "CONFIG_PATH", str(config_file))
+        mocker.patch("tetodl.core.domain.config.set_language")
+        monkeypatch.setattr(cfg, "cache_flush_interval", cfg.cache_flush_interval)
+        monkeypatch.setattr(cfg, "cache_flush_threshold", cfg.cache_flush_threshold)
+
+        cfg.load_config()
+        assert (cfg.cache_flush_interval, cfg.cache_flush_threshold) == (5.0, 8)
+
+        cfg.save_config()
+        saved = json.loads(config_file.read_text())
+        assert saved["cache_flush_interval"] == 5.0
+        assert saved["cache_flush_threshold"] == 8
+
     def test_save_config_handles_write_error(self, mocker):
         """save_config does not raise when the file cannot be written."""
         mocker.patch("builtins.open", side_effect=OSError("permission denied"))
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from tetodl.core.cover import CoverService  # noqa: E402
+from tetodl.core.cover import processor  # noqa: E402
+from tetodl.core.cover.processor import PillowThumbnailProcessor, render_image  # noqa: E402
+
+
+def _image_bytes(size=(160, 90), fmt="PNG", mode="RGBA") -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size, (200, 10, 10, 255) if mode == "RGBA" else (200, 10, 10)).save(buf, fmt)
+    return buf.getvalue()
+
+
+def _open(data: bytes):
+    return Image.open(io.BytesIO(data))
+
+
+class TestRenderImage:
+    """Tests for the in-memory Pillow image pipeline."""
+
+    def test_crop_to_centered_square(self):
+        """Cropping keeps the shorter side and re-encodes to the target format."""
+        out = render_image(_image_bytes((160, 90)), crop=True, target_format="jpg")
+
+        img = _open(out)
+        assert img.size == (90, 90)
+        assert img.format == "JPEG"
+
+    def test_same_format_passes_through(self):
+        """Nothing to crop or convert returns the original bytes untouched."""
+        data = _image_bytes(fmt="JPEG", mode="RGB")
+
+        assert render_image(data, target_format="jpeg") is data
+
+    def test_alpha_flattened_for_jpeg(self):
+        """RGBA sources are converted so they can be written as JPEG."""
+        out = render_image(_image_bytes(mode="RGBA"), target_format="jpg")
+
+        assert _open(out).mode == "RGB"
+
+    def test_undecodable_returns_none(self):
+        """Data Pillow cannot read is left to the fallback processor."""
+        assert render_image(b"not an image", target_format="jpg") is None
+
+    def test_without_pillow_returns_none(self, monkeypatch):
+        """With Pillow missing the caller always falls back."""
+        monkeypatch.setattr(processor, "Image", None)
+
+        assert render_image(_image_bytes(), crop=True) is None
+
+
+class TestPillowThumbnailProcessor:
+    """Tests for the file-based API on top of render_image."""
+
+    def test_convert_writes_without_temp_file(self, tmp_path):
+        """Conversion writes the target extension directly and removes the source."""
+        src = tmp_path / "abc.png"
+        src.write_bytes(_image_bytes())
+
+        out = PillowThumbnailProcessor(MagicMock()).convert_format(str(src), "jpg")
+
+        assert out == str(tmp_path / "abc.jpg")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["abc.jpg"]
+
+    def test_crop_in_place(self, tmp_path):
+        """Cropping rewrites the file in place."""
+        src = tmp_path / "abc.jpg"
+        src.write_bytes(_image_bytes(fmt="JPEG", mode="RGB"))
+
+        assert PillowThumbnailProcessor(MagicMock()).crop_to_square(str(src))
+        assert _open(src.read_bytes()).size == (90, 90)
+
+    def test_falls_back_on_undecodable(self, tmp_path):
+        """Files Pillow cannot decode are handed to the fallback processor."""
+        src = tmp_path / "abc.jpg"
+        src.write_bytes(b"garbage")
+        fallback = MagicMock()
+        fallback.crop_to_square.return_value = True
+
+        assert PillowThumbnailProcessor(fallback).crop_to_square(str(src))
+        fallback.crop_to_square.assert_called_once_with(str(src))
+
+
+class TestCoverServiceSave:
+    """Tests for CoverService.save."""
+
+    def test_renders_before_writing(self, tmp_path, mocker):
+        """Rendered bytes are written and the subprocess path is not used."""
+        process = mocker.patch.object(CoverService, "process")
+        path = tmp_path / "abc.jpg"
+
+        assert CoverService().save(_image_bytes(), str(path), crop=True) == str(path)
+        assert _open(path.read_bytes()).size == (90, 90)
+        process.assert_not_called()
+
+    def test_fallback_processes_file(self, tmp_path, mocker):
+        """When rendering fails the raw bytes go through process()."""
+        process = mocker.patch.object(CoverService, "process", return_value="converted.jpg")
+
+        out = CoverService().save(b"raw", str(tmp_path / "abc.jpg"))
+
+        assert out == "converted.jpg"
+        assert (tmp_path / "abc.jpg").read_bytes() == b"raw"
+        process.assert_called_once()
+
+    def test_fallback_disabled_keeps_raw(self, tmp_path, mocker):
+        """With fallback off the raw bytes are kept as-is."""
+        process = mocker.patch.object(CoverService, "process")
+        path = tmp_path / "abc.jpg"
+
+        assert CoverService().save(b"raw", str(path), fallback=False) == str(path)
+        process.assert_not_called()
+
+
+class TestCoverServiceBatch:
+    """Tests for thumbnail-only playlist runs."""
+
+    def test_duplicate_entries_use_separate_files(self, tmp_path, mocker):
+        """Entries sharing a video id, or without one, never share a temp file."""
+        from tetodl import core
+
+        entries = [
+            {"id": "dup", "title": "First", "uploader": "U", "thumbnail": "https://img/1"},
+            {"id": "dup", "title": "Second", "uploader": "U", "thumbnail": "https://img/1"},
+            {"title": "Third", "uploader": "U", "thumbnail": "https://img/3"},
+        ]
+        ydl = mocker.MagicMock()
+        ydl.__enter__.return_value.extract_info.return_value = {"title": "PL", "entries": entries}
+        mocker.patch.object(core.cover, "check_internet", return_value=True)
+        mocker.patch.object(core.cover.yt, "YoutubeDL", return_value=ydl)
+        mocker.patch.object(CoverService, "fetch", return_value=_image_bytes())
+        save = mocker.spy(CoverService, "save")
+
+        result = CoverService().download("https://x/list", str(tmp_path), smart_cover_mode=False)
+
+        temp_paths = [call.args[2] for call in save.call_args_list]
+        assert len(set(temp_paths)) == 3
+        assert result.file_count == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["U - First.jpg", "U - Second.jpg", "U - Third.jpg"]
@@ -125,7 +125,7 @@ class TestHistory:
         import tetodl.core.domain.history as hist
 
         hist.add_to_history("v1", "/tmp/v1.mp3", True, "T1", "audio", "YT", "audio", 100)
-        assert history_file.exists()
+        assert list((tmp_path / "history").glob("*.jsonl"))
 
         hist._download_history.clear()
 
@@ -143,3 +143,54 @@ class TestHistory:
         stats = hist.get_history_stats()
         assert stats["yt_video"] == 1
         assert stats["total_duration"] == 120
+
+    def test_add_appends_tombstone_instead_of_rewriting(self, tmp_path):
+        """A re-download appends a tombstone and the new record to the monthly log."""
+        import tetodl.core.domain.history as hist
+
+        hist.add_to_history("v1", "/tmp/a.mp3", True, "A", "audio", "YT", "audio", 1)
+        hist.add_to_history("v2", "/tmp/b.mp3", True, "B", "audio", "YT", "audio", 1)
+        hist.add_to_history("v1", "/tmp/c.mp3", True, "C", "audio", "YT", "audio", 1)
+
+        (log,) = (tmp_path / "history").glob("*.jsonl")
+        lines = log.read_text().splitlines()
+        assert len(lines) == 4
+        assert '"_del":"v1"' in lines[2]
+
+        hist.load_history()
+        assert [e["id"] for e in hist._download_history] == ["v2", "v1"]
+        assert hist._download_history[1]["file_path"] == "/tmp/c.mp3"
+
+    def test_compact_history_drops_dead_records(self, tmp_path):
+        """compact_history rewrites the log with live records only."""
+        import tetodl.core.domain.history as hist
+
+        for path in ("/tmp/1.mp3", "/tmp/2.mp3", "/tmp/3.mp3"):
+            hist.add_to_history("v1", path, True, "T", "audio", "YT", "audio", 1)
+        hist.add_to_history("", "/tmp/x.mp3", False, "X", "audio", "YT", "audio", 1)
+
+        hist.compact_history()
+
+        (log,) = (tmp_path / "history").glob("*.jsonl")
+        assert len(log.read_text().splitlines()) == 2
+
+        hist.add_to_history("v1", "/tmp/4.mp3", True, "T", "audio", "YT", "audio", 1)
+        hist.load_history()
+        assert [e["file_path"] for e in hist._download_history] == ["/tmp/x.mp3", "/tmp/4.mp3"]
+
+    def test_legacy_json_imported(self, tmp_path):
+        """A legacy history.json is moved into the monthly logs on load."""
+        import json
+
+        import tetodl.core.domain.history as hist
+
+        legacy = tmp_path / "history.json"
+        legacy.write_text(json.dumps([
+            {"id": "old", "success": True, "timestamp": "2024-01-02T03:04:05"},
+        ]))
+
+        hist.load_history()
+
+        assert [e["id"] for e in hist._download_history] == ["old"]
+        assert (tmp_path / "history" / "2024-01.jsonl").exists()
+        assert not legacy.exists()
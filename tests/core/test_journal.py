@@ -0,0 +1,69 @@
+from tetodl.core.domain import journal as journal_mod
+from tetodl.core.domain.journal import DONE, DOWNLOADED, FAILED, PENDING, JobJournal
+
+
+class TestJobJournal:
+    """Tests for the playlist job journal."""
+
+    def test_item_states_survive_reopen(self, tmp_path):
+        """Marks are persisted and merged; a new handle sees them."""
+        path = str(tmp_path / "jobs.db")
+        job = JobJournal(path).open("https://x/list", str(tmp_path), title="Mix")
+        job.mark(1, "https://x/1", PENDING, spotify_title="One")
+        job.mark(1, "https://x/1", DOWNLOADED, file={"path": "/a.m4a"})
+        job.mark(2, "https://x/2", PENDING)
+        job.mark_listed()
+
+        again = JobJournal(path).find("https://x/list", str(tmp_path))
+        assert again is not None and again.listed and again.title == "Mix"
+        assert again.items[1]["state"] == DOWNLOADED
+        assert again.items[1]["data"] == {"spotify_title": "One", "file": {"path": "/a.m4a"}}
+        assert again.entries() == [(1, "https://x/1"), (2, "https://x/2")]
+        assert again.unfinished() == 2
+
+    def test_other_selection_starts_fresh(self, tmp_path):
+        """A job journalled for different --items is not resumed."""
+        journal = JobJournal(str(tmp_path / "jobs.db"))
+        journal.open("https://x/list", str(tmp_path), selection="1-3").mark(1, "https://x/1", DONE)
+
+        assert journal.find("https://x/list", str(tmp_path), selection="5") is None
+        assert journal.open("https://x/list", str(tmp_path), selection="5").items == {}
+
+    def test_close_drops_only_finished_jobs(self, tmp_path):
+        """A job stays until it is fully listed and every item is done."""
+        journal = JobJournal(str(tmp_path / "jobs.db"))
+        job = journal.open("https://x/list", str(tmp_path))
+        job.mark(1, "https://x/1", DONE)
+        assert job.close() is False  # listing not finished
+
+        job.record_listing([(2, "https://x/2", {})])
+        assert job.close() is False  # item 2 pending
+
+        job.mark(2, "https://x/2", DONE)
+        assert job.close() is True
+        assert journal.find("https://x/list", str(tmp_path)) is None
+
+    def test_close_treats_failed_as_final(self, tmp_path):
+        """A finished run with failed items drops the job, so the next run re-expands."""
+        journal = JobJournal(str(tmp_path / "jobs.db"))
+        job = journal.open("https://x/list", str(tmp_path))
+        job.record_listing([(1, "https://x/1", {}), (2, "https://x/2", {})])
+        job.mark(1, "https://x/1", DONE)
+        job.mark(2, "https://x/2", FAILED, error="Private video")
+
+        assert job.pending() == 0
+        assert job.close() is True
+        assert journal.find("https://x/list", str(tmp_path)) is None
+
+    def test_stale_jobs_are_not_resumed(self, tmp_path, monkeypatch):
+        """A job not updated for JOB_TTL is ignored and replaced on open."""
+        journal = JobJournal(str(tmp_path / "jobs.db"))
+        job = journal.open("https://x/list", str(tmp_path))
+        job.mark(1, "https://x/1", PENDING)
+        job.mark_listed()
+
+        now = journal_mod.time.time()
+        monkeypatch.setattr(journal_mod.time, "time", lambda: now + journal_mod.JOB_TTL + 1)
+
+        assert journal.find("https://x/list", str(tmp_path)) is None
+        assert journal.open("https://x/list", str(tmp_path)).items == {}
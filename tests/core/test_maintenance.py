@@ -37,6 +37,7 @@ class TestMaintenance:
         mock_reset_history = mocker.patch("tetodl.core.maintenance.reset_history")
         mock_reset_config = mocker.patch("tetodl.core.maintenance.reset_config")
         mock_registry_reset = mocker.patch("tetodl.core.maintenance.registry.reset")
+        mocker.patch("tetodl.core.maintenance.registry.has_entries", return_value=True)
 
         from tetodl.core.maintenance import reset_data
         reset_data(targets=["all"])
@@ -49,12 +50,27 @@ class TestMaintenance:
     def test_reset_data_all_confirm_no(self, mocker):
         """reset_data with ['all'] warns about empty targets when nothing exists."""
         mocker.patch("tetodl.core.maintenance.os.path.exists", return_value=False)
+        mocker.patch("tetodl.core.maintenance.registry.has_entries", return_value=False)
         mocker.patch("tetodl.core.maintenance.console.warn")
         mocker.patch("tetodl.core.maintenance.console.ok")
 
         from tetodl.core.maintenance import reset_data
         reset_data(targets=["all"])
 
+    def test_reset_data_empty_registry_has_nothing_to_clean(self, mocker):
+        """An empty registry is skipped even though its database file exists."""
+        mocker.patch("tetodl.core.maintenance.registry.has_entries", return_value=False)
+        mock_warn = mocker.patch("tetodl.core.maintenance.console.warn")
+        mock_input = mocker.patch("builtins.input")
+        mock_registry_reset = mocker.patch("tetodl.core.maintenance.registry.reset")
+
+        from tetodl.core.maintenance import reset_data
+        reset_data(targets=["registry"])
+
+        mock_warn.assert_called_once()
+        mock_input.assert_not_called()
+        mock_registry_reset.assert_not_called()
+
     def test_reset_data_empty_targets(self, mocker):
         """reset_data with empty targets list does nothing."""
         mocker.patch("tetodl.core.maintenance.console.warn")
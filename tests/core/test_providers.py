@@ -0,0 +1,57 @@
+import pytest
+
+
+class TestProviderFailures:
+    """Tests for how lyrics and cover providers report failed requests."""
+
+    def test_lrclib_keeps_candidates_when_a_strategy_fails(self, mocker):
+        """A failed later strategy does not discard earlier candidates."""
+        from tetodl.core.lyrics.models import LyricsQuery
+        from tetodl.core.lyrics.providers.lrclib import LRCLIBProvider
+
+        hit = {"artistName": "Band", "trackName": "Song", "plainLyrics": "la la"}
+        mocker.patch.object(
+            LRCLIBProvider, "_fetch",
+            side_effect=[[hit], ConnectionError("timeout"), [], []],
+        )
+
+        results = LRCLIBProvider().search(LyricsQuery(artist="Band", title="Song"))
+
+        assert [r.title for r in results] == ["Song"]
+
+    def test_lrclib_raises_when_nothing_found_and_a_strategy_failed(self, mocker):
+        """An empty result with a failed strategy is not reported as a miss."""
+        from tetodl.core.lyrics.models import LyricsQuery
+        from tetodl.core.lyrics.providers.lrclib import LRCLIBProvider
+
+        mocker.patch.object(
+            LRCLIBProvider, "_fetch", side_effect=[[], ConnectionError("timeout"), [], []],
+        )
+
+        with pytest.raises(ConnectionError):
+            LRCLIBProvider().search(LyricsQuery(artist="Band", title="Song"))
+
+    def test_cover_providers_try_remaining_terms(self, mocker):
+        """A failed search term falls through to the next one."""
+        from tetodl.core.cover.models import CoverData, CoverQuery
+        from tetodl.core.cover.providers.deezer import DeezerProvider
+        from tetodl.core.cover.providers.genius import GeniusCoverProvider
+
+        found = CoverData(url="https://img", source="test")
+        query = CoverQuery(artist="Band", title="Song (Live)")
+        for provider, method in (
+            (DeezerProvider, "_search_deezer"),
+            (GeniusCoverProvider, "_search_genius_cover"),
+        ):
+            mocker.patch.object(provider, method, side_effect=[ConnectionError("429"), found])
+            assert provider().search(query) is found
+
+    def test_cover_provider_raises_when_every_term_fails(self, mocker):
+        """With no result and failed terms, the error reaches the caller."""
+        from tetodl.core.cover.models import CoverQuery
+        from tetodl.core.cover.providers.deezer import DeezerProvider
+
+        mocker.patch.object(DeezerProvider, "_search_deezer", side_effect=ConnectionError("429"))
+
+        with pytest.raises(ConnectionError):
+            DeezerProvider().search(CoverQuery(artist="Band", title="Song"))
@@ -210,3 +210,114 @@ class TestRegistry:
         fresh = RegistryManager()
 
         assert fresh.data == new_data
+
+    def test_persists_across_instances(self, fresh_registry, tmp_path):
+        """Registrations are committed to SQLite and visible to a new manager."""
+        fresh_registry.register_download("vid1", str(tmp_path / "s.mp3"), "audio", {"title": "S1"})
+
+        from tetodl.core.domain.registry import RegistryManager
+        reopened = RegistryManager()
+        assert reopened.db_path == fresh_registry.db_path
+        assert reopened.data["youtube"]["vid1"]["audio"]["t"] == "S1"
+
+    def test_legacy_json_renamed_after_import(self, monkeypatch, tmp_path):
+        """load imports registry.json once and renames it to .migrated."""
+        import json
+        reg_path = tmp_path / "registry.json"
+        reg_path.write_text(json.dumps({"youtube": {}, "spotify": {"sp1": "vid1"}}))
+        reg_module = sys.modules["tetodl.core.domain.registry"]
+        monkeypatch.setattr(reg_module, "REGISTRY_PATH", str(reg_path))
+
+        from tetodl.core.domain.registry import RegistryManager
+        fresh = RegistryManager()
+
+        assert not reg_path.exists()
+        assert (tmp_path / "registry.json.migrated").exists()
+        assert (tmp_path / "registry.db").exists()
+        assert fresh.data["spotify"] == {"sp1": "vid1"}
+
+    def test_check_existing_prunes_missing_paths(self, fresh_registry, tmp_path):
+        """check_existing drops stale paths and removes entries left empty."""
+        fresh_registry.register_download("vid1", str(tmp_path / "gone.mp3"), "audio", {"title": "S1"})
+
+        found, meta = fresh_registry.check_existing("vid1", "audio", str(tmp_path))
+        assert found is False
+        assert "vid1" not in fresh_registry.data["youtube"]
+
+    def test_check_existing_many(self, fresh_registry, tmp_path):
+        """check_existing_many answers a batch, preferring the earliest dir."""
+        music_dir = tmp_path / "music"
+        group_dir = music_dir / "group"
+        group_dir.mkdir(parents=True)
+        for d, name in ((music_dir, "a.mp3"), (group_dir, "a.mp3"), (group_dir, "b.mp3")):
+            (d / name).write_text("content")
+
+        fresh_registry.register_download("vid1", str(group_dir / "a.mp3"), "audio", {"title": "A"})
+        fresh_registry.register_download("vid1", str(music_dir / "a.mp3"), "audio", {"title": "A"})
+        fresh_registry.register_download("vid2", str(group_dir / "b.mp3"), "audio", {"title": "B"})
+
+        found = fresh_registry.check_existing_many(
+            ["vid1", "vid2", "vid3", None], "audio", [str(music_dir), str(group_dir)],
+        )
+        assert set(found) == {"vid1", "vid2"}
+        assert found["vid1"]["file_path"] == str(music_dir / "a.mp3")
+        assert found["vid2"]["title"] == "B"
+        assert fresh_registry.check_existing_many(["vid1"], "video", [str(music_dir)]) == {}
+
+    def test_check_existing_many_by_spotify_id(self, fresh_registry, tmp_path):
+        """check_existing_many resolves Spotify IDs and prunes stale paths."""
+        (tmp_path / "s.mp3").write_text("content")
+        fresh_registry.register_download("vid1", str(tmp_path / "s.mp3"), "audio", {"title": "S"}, "sp1")
+        fresh_registry.register_download("vid2", str(tmp_path / "gone.mp3"), "audio", {"title": "G"}, "sp2")
+
+        found = fresh_registry.check_existing_many(["sp1", "sp2"], "audio", [str(tmp_path)], by_spotify=True)
+
+        assert list(found) == ["sp1"]
+        assert "vid2" not in fresh_registry.data["youtube"]
+
+    def test_check_existing_many_by_spotify_id_chunked(self, fresh_registry, tmp_path, monkeypatch):
+        """Spotify IDs are looked up in chunks and unrelated rows are ignored."""
+        from tetodl.core.domain import registry
+        monkeypatch.setattr(registry, "_IN_CHUNK", 2)
+        for n in range(5):
+            (tmp_path / f"{n}.mp3").write_text("content")
+            fresh_registry.register_download(f"vid{n}", str(tmp_path / f"{n}.mp3"), "audio", {"title": str(n)}, f"sp{n}")
+
+        found = fresh_registry.check_existing_many(["sp0", "sp2", "sp3", "sp9"], "audio", [str(tmp_path)], by_spotify=True)
+
+        assert set(found) == {"sp0", "sp2", "sp3"}
+        assert found["sp3"]["file_path"] == str(tmp_path / "3.mp3")
+
+    def test_has_entries(self, fresh_registry, tmp_path):
+        """has_entries reflects registered rows, not the database file."""
+        assert fresh_registry.has_entries() is False
+        fresh_registry.register_download("vid1", str(tmp_path / "a.mp3"), "audio", {"title": "A"})
+        assert fresh_registry.has_entries() is True
+
+    def test_relocate_moves_directory_tree(self, fresh_registry, tmp_path):
+        """relocate rewrites every path under the old dir and keeps the reverse index in sync."""
+        old_dir = tmp_path / "staging"
+        new_dir = tmp_path / "music"
+        fresh_registry.register_download("vid1", str(old_dir / "a.mp3"), "audio", {"title": "A"})
+        fresh_registry.register_download("vid2", str(old_dir / "sub" / "b.mp3"), "audio", {"title": "B"})
+        fresh_registry.register_download("vid3", str(tmp_path / "staging2" / "c.mp3"), "audio", {"title": "C"})
+
+        assert fresh_registry.relocate(str(old_dir), str(new_dir)) == 2
+
+        assert fresh_registry.lookup_path(str(new_dir / "a.mp3")) == ("vid1", "audio")
+        assert fresh_registry.lookup_path(str(new_dir / "sub" / "b.mp3")) == ("vid2", "audio")
+        assert fresh_registry.lookup_path(str(old_dir / "a.mp3")) is None
+        assert fresh_registry.data["youtube"]["vid3"]["audio"]["paths"] == [str(tmp_path / "staging2" / "c.mp3")]
+
+    def test_relocate_only_named_files(self, fresh_registry, tmp_path):
+        """relocate with filenames leaves unmoved files in place and merges duplicates."""
+        old_dir = tmp_path / "staging"
+        new_dir = tmp_path / "music"
+        fresh_registry.register_download("vid1", str(old_dir / "a.mp3"), "audio", {"title": "A"})
+        fresh_registry.register_download("vid1", str(new_dir / "a.mp3"), "audio", {"title": "A"})
+        fresh_registry.register_download("vid2", str(old_dir / "b.mp3"), "audio", {"title": "B"})
+
+        assert fresh_registry.relocate(str(old_dir), str(new_dir), filenames=["a.mp3"]) == 1
+
+        assert fresh_registry.data["youtube"]["vid1"]["audio"]["paths"] == [str(new_dir / "a.mp3")]
+        assert fresh_registry.lookup_path(str(old_dir / "b.mp3")) == ("vid2", "audio")
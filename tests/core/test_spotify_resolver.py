@@ -279,3 +279,68 @@ class TestSpotifyClient:
 
         with pytest.raises(SpotifyParseError, match="Invalid JSON"):
             client.get_track("x")
+
+    def test_entity_cached_between_calls(self, mocker):
+        """Fetching the same entity twice hits Spotify once."""
+        from tetodl.core.clients.spotify.auth import SpotifyAuth
+        from tetodl.core.clients.spotify.client import SpotifyClient
+
+        client = SpotifyClient(SpotifyAuth())
+        mock_get = mocker.patch.object(client._session, "get")
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.text = _fake_embed_html(
+            '{"type":"track","id":"abc","name":"Test","artists":[{"name":"Art"}],"duration":1000}'
+        )
+
+        assert client.get_track("abc") == client.get_track("abc")
+        mock_get.assert_called_once()
+
+    def test_429_retried_then_gives_up(self, mocker):
+        """Rate-limited responses are retried up to max_retries, then raise."""
+        from tetodl.core.clients.spotify.auth import SpotifyAuth
+        from tetodl.core.clients.spotify.client import SpotifyClient
+
+        mocker.patch("tetodl.core.clients.spotify.ratelimit.time.sleep")
+        client = SpotifyClient(SpotifyAuth())
+        mock_get = mocker.patch.object(client._session, "get")
+        mock_get.return_value.status_code = 429
+
+        with pytest.raises(SpotifyParseError, match="Rate limited"):
+            client.get_track("x")
+        assert mock_get.call_count == 4
+
+    def test_resolvers_share_one_client(self):
+        """Resolvers built without a client reuse the process-wide one."""
+        assert SpotifyResolver()._client is SpotifyResolver()._client
+
+
+class TestSpotifyRateLimiter:
+    def test_window_spaces_concurrent_callers(self, mocker):
+        """Callers over the per-minute budget wait for their own slot."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tetodl.core.clients.spotify.ratelimit import SpotifyRateLimiter
+
+        mocker.patch("tetodl.core.clients.spotify.ratelimit.time.monotonic", return_value=100.0)
+        sleep = mocker.patch("tetodl.core.clients.spotify.ratelimit.time.sleep")
+        limiter = SpotifyRateLimiter(max_per_minute=2)
+
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(lambda _: limiter.wait(), range(6)))
+
+        assert sorted(c.args[0] for c in sleep.call_args_list) == [60.0, 60.0, 120.0, 120.0]
+
+    def test_backoff_after_429(self, mocker):
+        """Each consecutive 429 doubles the delay; a success resets it."""
+        from tetodl.core.clients.spotify.ratelimit import SpotifyRateLimiter
+
+        sleep = mocker.patch("tetodl.core.clients.spotify.ratelimit.time.sleep")
+        limiter = SpotifyRateLimiter(base_delay=1.0, backoff=2.0)
+
+        limiter.report_429()
+        limiter.report_429()
+        limiter.wait()
+        limiter.report_success()
+        limiter.wait()
+
+        sleep.assert_called_once_with(2.0)
@@ -0,0 +1,77 @@
+import os
+
+from mutagen.id3 import ID3
+
+from tetodl.core.domain.tagger import TagTransaction
+
+
+def _fake_mp3(path) -> str:
+    path.write_bytes(b"\xff\xfb\x90\x00" * 1000)
+    return str(path)
+
+
+def _fake_jpg(path) -> str:
+    path.write_bytes(b"\xff\xd8" + b"x" * 4000)
+    return str(path)
+
+
+class TestTagTransaction:
+    """Tests for the single-save tag writer."""
+
+    def test_commit_writes_everything_in_one_save(self, tmp_path, mocker):
+        """Cover, text tags and lyrics land in the file with one ID3 save."""
+        audio = _fake_mp3(tmp_path / "song.mp3")
+        cover = _fake_jpg(tmp_path / "cover.jpg")
+        save = mocker.spy(ID3, "save")
+
+        tx = TagTransaction(audio, "mp3")
+        assert tx.set_cover(cover)
+        os.remove(cover)  # image is read at staging time
+        tx.set_tags({"title": "Basic", "artist": "Someone"})
+        tx.set_tags({"title": "Rich Title", "album": "", "genre": "Pop"})
+        tx.set_lyrics("la la la")
+        assert tx.commit() is True
+
+        assert save.call_count == 1
+        tags = ID3(audio)
+        assert tags.getall("TIT2")[0].text == ["Rich Title"]
+        assert tags.getall("TPE1")[0].text == ["Someone"]
+        assert tags.getall("TCON")[0].text == ["Pop"]
+        assert not tags.getall("TALB")
+        assert len(tags.getall("APIC")) == 1
+        assert tags.getall("USLT")[0].text == "la la la"
+        assert tx.pending is False
+
+    def test_retag_happens_in_place(self, tmp_path):
+        """Reserved padding absorbs a later re-tag without growing the file."""
+        audio = _fake_mp3(tmp_path / "song.mp3")
+        tx = TagTransaction(audio, "mp3")
+        tx.set_tags({"title": "Short"})
+        tx.commit()
+        size = os.path.getsize(audio)
+
+        tx.set_tags({"title": "A considerably longer corrected title", "composer": "Someone Else"})
+        tx.commit()
+
+        assert os.path.getsize(audio) == size
+        assert ID3(audio).getall("TIT2")[0].text == ["A considerably longer corrected title"]
+
+    def test_tight_padding_is_grown(self):
+        """Padding too small for a later re-tag is resized; ample padding is kept."""
+        from types import SimpleNamespace
+
+        from tetodl.core.domain.tagger import TAG_PADDING, TAG_PADDING_MIN, _reserve_padding
+
+        assert _reserve_padding(SimpleNamespace(padding=0)) == TAG_PADDING
+        assert _reserve_padding(SimpleNamespace(padding=100)) == TAG_PADDING
+        assert _reserve_padding(SimpleNamespace(padding=-50)) == TAG_PADDING
+        assert _reserve_padding(SimpleNamespace(padding=TAG_PADDING - 100)) == TAG_PADDING - 100
+        assert _reserve_padding(SimpleNamespace(padding=TAG_PADDING_MIN - 1)) == TAG_PADDING
+        assert _reserve_padding(SimpleNamespace(padding=2 * TAG_PADDING)) == 2 * TAG_PADDING
+        assert _reserve_padding(SimpleNamespace(padding=5 * TAG_PADDING)) == TAG_PADDING
+
+    def test_nothing_pending_is_a_noop(self, tmp_path):
+        """Committing an empty transaction succeeds without touching the file."""
+        missing = str(tmp_path / "missing.mp3")
+        assert TagTransaction(missing, "mp3").commit() is True
+        assert not os.path.exists(missing)
@@ -70,3 +70,80 @@ class TestYouTubeExtractor:
         assert result.album == "Test Album"
         assert result.is_playlist is False
         assert result.entries is None
+
+    def test_youtube_extractor_serves_cached_metadata(self):
+        """A fresh cached record is returned for any URL form of the same video."""
+        from tetodl.core.domain.cache import reset_cache
+        reset_cache()
+
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            "id": "dQw4w9WgXcQ",
+            "title": "Never Gonna Give You Up",
+            "webpage_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "duration": 212,
+            "uploader": "Rick Astley",
+        }
+        mock_ydl.__enter__.return_value = mock_ydl
+
+        try:
+            with patch("tetodl.core.sources.youtube.yt") as mock_yt:
+                mock_yt.YoutubeDL = MagicMock(return_value=mock_ydl)
+                extractor = YouTubeExtractor()
+                first = extractor.extract("https://youtu.be/dQw4w9WgXcQ")
+                second = extractor.extract("https://music.youtube.com/watch?v=dQw4w9WgXcQ")
+                third = extractor.extract("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10")
+
+            assert mock_ydl.extract_info.call_count == 1
+            assert second == first
+            assert third.title == "Never Gonna Give You Up"
+            assert third.duration == 212
+        finally:
+            reset_cache()
+
+    def test_youtube_extractor_playlist_bypasses_cache(self):
+        """Playlist URLs are always extracted, even when the video id is cached."""
+        from tetodl.core.domain.cache import cache_metadata, reset_cache
+        reset_cache()
+        cache_metadata("dQw4w9WgXcQ", {"id": "dQw4w9WgXcQ", "title": "Cached"})
+
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = {
+            "_type": "playlist",
+            "id": "PLtest",
+            "title": "Mix",
+            "entries": [{"id": "dQw4w9WgXcQ", "title": "Fresh"}],
+        }
+        mock_ydl.__enter__.return_value = mock_ydl
+
+        try:
+            with patch("tetodl.core.sources.youtube.yt") as mock_yt:
+                mock_yt.YoutubeDL = MagicMock(return_value=mock_ydl)
+                result = YouTubeExtractor().extract(
+                    "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLtest"
+                )
+
+            mock_ydl.extract_info.assert_called_once()
+            assert result.is_playlist is True
+            assert result.entries[0].title == "Fresh"
+        finally:
+            reset_cache()
+
+    def test_youtube_extractor_keeps_raw_info(self):
+        """The raw info dict of a single video is exposed for the download step."""
+        from tetodl.core.domain.cache import reset_cache
+        reset_cache()
+
+        raw = {"id": "9bZkp7q19f0", "title": "Gangnam Style", "formats": [{"url": "https://x"}]}
+        mock_ydl = MagicMock()
+        mock_ydl.extract_info.return_value = raw
+
+        try:
+            with patch("tetodl.core.sources.youtube.yt") as mock_yt:
+                mock_yt.YoutubeDL = MagicMock(return_value=mock_ydl)
+                extractor = YouTubeExtractor()
+                extractor.extract("https://youtu.be/9bZkp7q19f0")
+
+            assert extractor.raw_info is raw
+        finally:
+            reset_cache()
@@ -9,6 +9,16 @@ from typing import Any
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _isolated_journal(monkeypatch: Any, tmp_path: Any) -> Any:
+    """Point the playlist job journal at a per-test database."""
+    from tetodl.core.domain.journal import JobJournal
+
+    journal = JobJournal(str(tmp_path / "jobs.db"))
+    monkeypatch.setattr("tetodl.core.pipeline.handlers.journal", journal)
+    return journal
+
+
 @pytest.fixture
 def mock_download_handler(mocker: Any) -> Any:
     """Mock ``pipeline.handlers.download_audio_youtube``.
@@ -37,6 +47,39 @@ def mock_yt_dlp_extract(mocker: Any) -> Any:
     )
 
 
+@pytest.fixture
+def fake_pooled_ydl(mocker: Any) -> Any:
+    """Replace ``handlers.pooled_ydl`` with a fake whose ``extract_info``
+    answers from a callable.
+
+    Usage::
+
+        requested = fake_pooled_ydl(lambda url: {"entries": [...]})
+
+    Returns the list of URLs passed to ``extract_info``, in call order.
+    """
+    from contextlib import contextmanager
+
+    def _install(respond: Any) -> list[str]:
+        requested: list[str] = []
+        ydl = mocker.MagicMock()
+
+        def _extract(url: str, download: bool = False, **kwargs: Any) -> Any:
+            requested.append(url)
+            return respond(url)
+
+        ydl.extract_info.side_effect = _extract
+
+        @contextmanager
+        def _pooled(profile: Any, opts: Any, factory: Any) -> Any:
+            yield ydl
+
+        mocker.patch("tetodl.core.pipeline.handlers.pooled_ydl", _pooled)
+        return requested
+
+    return _install
+
+
 @pytest.fixture
 def step_ctx_factory() -> Any:
     """Return a factory function that builds a minimal PipelineContext.
@@ -54,7 +54,7 @@ class TestDownloadStep:
 
         with patch("tetodl.core.pipeline.stages.download.yt") as mock_yt:
             mock_ydl = MagicMock()
-            mock_yt.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+            mock_yt.YoutubeDL.return_value = mock_ydl
             mock_ydl.download.return_value = None
 
             fake_path = os.path.join(str(target), "Test Song.m4a")
@@ -93,10 +93,60 @@ class TestDownloadStep:
 
         with patch("tetodl.core.pipeline.stages.download.yt") as mock_yt:
             mock_ydl = MagicMock()
-            mock_yt.YoutubeDL.return_value.__enter__.return_value = mock_ydl
+            mock_yt.YoutubeDL.return_value = mock_ydl
             mock_ydl.download.side_effect = Exception("download failed")
 
             result = step(ctx)
 
         assert result.error is not None
         assert not part_file.exists()
+
+    def _raw_ctx(self, tmp_path, app_config, expire: int) -> PipelineContext:
+        return PipelineContext(
+            config=app_config,
+            url="https://youtube.com/watch?v=abc123",
+            target_dir=str(tmp_path),
+            media_info=MediaInfo(id="abc123", title="Test Song", url="https://youtube.com/watch?v=abc123"),
+            media_type="audio",
+            raw_info={
+                "id": "abc123",
+                "formats": [{"url": f"https://rr1.googlevideo.com/videoplayback?expire={expire}&id=x"}],
+            },
+        )
+
+    def test_download_reuses_fresh_info_dict(self, tmp_path, app_config: AppConfig):
+        """Fresh format URLs are downloaded from the info dict without re-extraction."""
+        import time
+        ctx = self._raw_ctx(tmp_path, app_config, int(time.time()) + 6 * 3600)
+
+        with patch("tetodl.core.pipeline.stages.download.yt") as mock_yt:
+            mock_ydl = MagicMock()
+            mock_yt.YoutubeDL.return_value = mock_ydl
+            mock_ydl.sanitize_info.side_effect = lambda info, remove_private_keys: info
+            result = DownloadStep()(ctx)
+
+        mock_ydl.process_ie_result.assert_called_once()
+        assert mock_ydl.process_ie_result.call_args.args[0]["id"] == "abc123"
+        mock_ydl.download.assert_not_called()
+        assert result.raw_info is None
+
+    def test_download_reextracts_expired_or_rejected_info(self, tmp_path, app_config: AppConfig):
+        """Expired or rejected format URLs fall back to a download by URL."""
+        import time
+
+        from yt_dlp.utils import DownloadError
+
+        stale = self._raw_ctx(tmp_path, app_config, int(time.time()) + 60)
+        rejected = self._raw_ctx(tmp_path, app_config, int(time.time()) + 6 * 3600)
+
+        with patch("tetodl.core.pipeline.stages.download.yt") as mock_yt:
+            mock_ydl = MagicMock()
+            mock_yt.YoutubeDL.return_value = mock_ydl
+            DownloadStep()(stale)
+            mock_ydl.process_ie_result.assert_not_called()
+            mock_ydl.download.assert_called_once_with(["https://youtube.com/watch?v=abc123"])
+
+            mock_ydl.download.reset_mock()
+            mock_ydl.process_ie_result.side_effect = DownloadError("HTTP Error 403")
+            DownloadStep()(rejected)
+            mock_ydl.download.assert_called_once_with(["https://youtube.com/watch?v=abc123"])
@@ -62,18 +62,19 @@ class TestFinalizeStep:
         result = step(ctx)
 
         assert result is ctx
-        mock_cache.assert_called_once_with(
-            "https://youtube.com/watch?v=abc123",
-            {
-                "title": "Test Song",
-                "duration": 240,
-                "uploader": "Test Artist",
-                "artist": "Test Artist",
-                "album": "Test Album",
-                "track": "Test Song",
-                "thumbnails": [{"url": "https://img.youtube.com/vi/abc123/default.jpg"}],
-            },
-        )
+        mock_cache.assert_called_once()
+        key, record = mock_cache.call_args.args
+        assert key == "abc123"
+        assert record["id"] == "abc123"
+        assert record["title"] == "Test Song"
+        assert record["url"] == "https://youtube.com/watch?v=abc123"
+        assert record["duration"] == 240
+        assert record["uploader"] == "Test Artist"
+        assert record["album"] == "Test Album"
+        assert record["resolved_artist"] == "Test Artist"
+        assert record["resolved_track"] == "Test Song"
+        assert record["thumbnails"] == [{"url": "https://img.youtube.com/vi/abc123/default.jpg"}]
+        assert "entries" not in record
         mock_history.assert_called_once()
         mock_scanner.assert_called_once()
 
@@ -117,3 +118,36 @@ class TestFinalizeStep:
         assert call_kwargs["content_type"] == "video"
         assert call_kwargs["title"] == "Test Video"
         assert call_kwargs["duration"] == 300
+
+    def test_embed_messages_follow_commit(self, mocker, tmp_path):
+        """Cover and lyrics are reported only once the tag write succeeds."""
+        from tetodl.core.domain.tagger import TagTransaction
+
+        mock_console = mocker.patch("tetodl.core.pipeline.stages.finalize.console")
+        cover = tmp_path / "cover.jpg"
+        cover.write_bytes(b"jpg")
+        ctx = PipelineContext(
+            config=AppConfig(),
+            url="https://youtube.com/watch?v=abc123",
+            target_dir=str(tmp_path),
+        )
+
+        tags = TagTransaction(str(tmp_path / "song.mp3"))
+        tags.set_cover(str(cover))
+        tags.set_lyrics("la la")
+        ctx.tag_transaction = tags
+        mocker.patch.object(tags, "commit", return_value=True)
+        FinalizeStep._write_tags(ctx)
+        assert mock_console.ok.call_count == 2
+        mock_console.err.assert_not_called()
+        assert ctx.lyrics_embedded is True
+
+        mock_console.reset_mock()
+        tags = TagTransaction(str(tmp_path / "missing.mp3"))
+        tags.set_cover(str(cover))
+        tags.set_lyrics("la la")
+        ctx.tag_transaction = tags
+        FinalizeStep._write_tags(ctx)
+        mock_console.ok.assert_not_called()
+        assert mock_console.err.call_count == 2
+        assert ctx.lyrics_embedded is False
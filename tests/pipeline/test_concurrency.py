@@ -0,0 +1,217 @@
+import threading
+
+from tetodl.core.pipeline.concurrency import (
+    AdaptiveLimiter,
+    DiskBudget,
+    estimate_size,
+    is_throttled,
+)
+from tetodl.core.pipeline.stages.download import DownloadStep
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run(limiter, clock, nbytes, seconds=1.0, error=None):
+    with limiter.slot() as outcome:
+        clock.now += seconds
+        outcome.nbytes = nbytes
+        outcome.error = error
+
+
+class TestAdaptiveLimiter:
+    """Tests for the AIMD download concurrency controller."""
+
+    def test_grows_while_throughput_rises(self):
+        """Each window that beats the last one adds a slot, up to the cap."""
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial=2, maximum=4, clock=clock)
+
+        for _ in range(2):
+            _run(limiter, clock, 1000)
+        assert limiter.limit == 3  # first window probes upwards
+
+        for _ in range(3):
+            _run(limiter, clock, 3000)
+        assert limiter.limit == 4
+
+        for _ in range(4):
+            _run(limiter, clock, 9000)
+        assert limiter.limit == 4
+
+    def test_holds_when_throughput_plateaus(self):
+        """No more slots are added once extra parallelism stops paying off."""
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial=2, maximum=8, clock=clock)
+        for _ in range(2):
+            _run(limiter, clock, 1000)
+        for _ in range(3):
+            _run(limiter, clock, 1000)
+        assert limiter.limit == 3
+
+    def test_throttling_halves_immediately(self):
+        """An HTTP 429 cuts the limit without waiting for the window."""
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial=6, maximum=8, clock=clock)
+        _run(limiter, clock, 0, error="ERROR: HTTP Error 429: Too Many Requests")
+        assert limiter.limit == 3
+        _run(limiter, clock, 0, error="HTTP Error 403: Forbidden")
+        assert limiter.limit == 1
+        _run(limiter, clock, 0, error="HTTP Error 429")
+        assert limiter.limit == 1
+
+    def test_error_burst_and_collapse_back_off(self):
+        """Mostly failing windows or a throughput collapse shrink the limit."""
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial=4, maximum=8, clock=clock)
+        for n in range(4):
+            _run(limiter, clock, 1000, error="Video unavailable" if n < 2 else None)
+        assert limiter.limit == 2
+
+        limiter = AdaptiveLimiter(initial=2, maximum=2, clock=clock)
+        for _ in range(2):
+            _run(limiter, clock, 10_000)
+        for _ in range(2):
+            _run(limiter, clock, 1_000)
+        assert limiter.limit == 1
+
+    def test_slots_block_beyond_limit(self):
+        """No more than ``limit`` blocks run at the same time."""
+        limiter = AdaptiveLimiter(initial=2, maximum=2)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def _work():
+            nonlocal active, peak
+            with limiter.slot():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                release.wait(1)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=_work) for _ in range(5)]
+        for t in threads:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join()
+        assert peak <= 2
+
+    def test_early_release_frees_slot_once(self):
+        """A released slot admits the next block while the first keeps running."""
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial=1, maximum=1, clock=clock)
+        entered = threading.Event()
+
+        with limiter.slot() as outcome:
+            outcome.nbytes = 100
+            outcome.release()
+
+            def _next():
+                with limiter.slot():
+                    entered.set()
+
+            t = threading.Thread(target=_next)
+            t.start()
+            t.join(2)
+            outcome.release()
+
+        assert entered.is_set()
+        assert limiter._active == 0
+
+    def test_throttle_detection(self):
+        """Rate-limit and bot-check errors count as throttling, others do not."""
+        assert is_throttled("Sign in to confirm you're not a bot")
+        assert is_throttled("HTTP Error 429: Too Many Requests")
+        assert not is_throttled("Video unavailable")
+        assert not is_throttled(None)
+
+
+class TestDiskBudget:
+    """Tests for reserving download sizes against free disk space."""
+
+    def test_reservations_share_free_space(self):
+        """Reservations fit while their sum stays below free space minus headroom."""
+        budget = DiskBudget("/x", headroom=10, free=lambda path: 110)
+
+        with budget.reserve(60) as first:
+            assert first
+            waited = threading.Event()
+
+            def _second():
+                with budget.reserve(60) as fits:
+                    assert fits
+                waited.set()
+
+            t = threading.Thread(target=_second)
+            t.start()
+            t.join(0.2)
+            assert not waited.is_set()
+        t.join(2)
+        assert waited.is_set()
+
+    def test_refuses_what_can_never_fit(self):
+        """With nothing else reserved, an oversized download is refused."""
+        budget = DiskBudget("/x", headroom=10, free=lambda path: 50)
+
+        with budget.reserve(60) as fits:
+            assert not fits
+        with budget.reserve(0) as fits:
+            assert fits
+
+    def test_unknown_free_space_never_blocks(self):
+        """Free space that cannot be read does not hold downloads back."""
+        budget = DiskBudget("/x", free=lambda path: None)
+
+        with budget.reserve(10**12) as fits:
+            assert fits
+
+
+class TestEstimateSize:
+    """Tests for estimating a download's size from its info dict."""
+
+    def test_merged_formats_count_twice(self):
+        """Parts and merged output coexist until the merge finishes."""
+        raw = {"requested_formats": [{"filesize": 300}, {"filesize_approx": 100}]}
+        assert estimate_size(raw) == 800
+
+    def test_bitrate_fallback(self):
+        """Without a size, bitrate times duration is used."""
+        assert estimate_size({"tbr": 128, "duration": 10}) == 160_000
+        assert estimate_size(None) == 0
+
+
+class TestWatchTransfer:
+    """Tests for signalling the end of a transfer before post-processing."""
+
+    def test_fires_once_when_postprocessing_starts(self):
+        """The callback gets the finished byte count at the first post-processor."""
+        calls = []
+        opts = {"progress_hooks": [lambda d: None]}
+        fire = DownloadStep._watch_transfer(opts, calls.append)
+
+        progress = opts["progress_hooks"][-1]
+        progress({"status": "downloading", "downloaded_bytes": 10})
+        progress({"status": "finished", "total_bytes": 300})
+        progress({"status": "finished", "downloaded_bytes": 100})
+        for status in ("started", "finished", "started"):
+            opts["postprocessor_hooks"][-1]({"status": status})
+        fire()
+
+        assert calls == [400]
+        assert len(opts["progress_hooks"]) == 2
+
+    def test_no_callback_leaves_opts_alone(self):
+        """Without a callback nothing is hooked."""
+        opts = {}
+        assert DownloadStep._watch_transfer(opts, None) is None
+        assert opts == {}
@@ -1,3 +1,4 @@
+import pytest
 
 from tetodl.core.domain.models import AppConfig, DownloadResult, DownloadSession
 
@@ -182,9 +183,9 @@ class TestDownloadSpotify:
 
         call_kwargs = mock_playlist.call_args.kwargs
         assert call_kwargs["content_title"] == "My Mix"
-        assert call_kwargs["urls"] == [
-            "https://music.youtube.com/watch?v=a1",
-            "https://music.youtube.com/watch?v=b2",
+        assert [(i, u) for i, u, _ in call_kwargs["urls"]] == [
+            (1, "https://music.youtube.com/watch?v=a1"),
+            (2, "https://music.youtube.com/watch?v=b2"),
         ]
 
     def test_download_spotify_no_results_returns_failure(self, mocker):
@@ -208,3 +209,265 @@ class TestDownloadSpotify:
         result = download_spotify(url="https://open.spotify.com/track/x", session=session, config=config)
         assert result.success is False
         assert result.file_path is None
+
+
+class TestMatchTracks:
+    """Tests for the parallel Spotify → YouTube Music matcher."""
+
+    def test_streams_matches_in_track_order(self, mocker):
+        """Slow early searches still come out first; misses are dropped and cached."""
+        import threading
+        import time
+
+        from tetodl.core.clients.spotify import SpotifyTrack
+        from tetodl.core.domain.cache import MISS, get_cache, reset_cache
+        from tetodl.core.pipeline.handlers import _match_tracks
+
+        reset_cache()
+        tracks = [
+            SpotifyTrack(title=name, artist="Art", spotify_id=f"sp{name}", cover_url="c")
+            for name in ("A", "B", "C", "D")
+        ]
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _search(query, target_duration_ms=None):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep({"A": 0.2, "B": 0.0, "C": 0.05, "D": 0.0}[query[0]])
+            with lock:
+                running -= 1
+            return None if query.startswith("C") else f"https://music.youtube.com/watch?v={query[0]}"
+
+        mocker.patch("tetodl.core.pipeline.handlers._search_ytmusic", side_effect=_search)
+
+        matches = list(_match_tracks(tracks, mocker.MagicMock(), workers=3))
+
+        assert [(i, url[-1]) for i, url, _ in matches] == [(1, "A"), (2, "B"), (4, "D")]
+        assert matches[0][2] == {
+            "cover_url": "c", "spotify_title": "A", "spotify_artist": "Art", "spotify_id": "spA",
+        }
+        assert 1 < peak <= 3
+        cache = get_cache("yt_match")
+        assert cache.get("spA")["y"].endswith("A")
+        assert cache.get("spC") is MISS
+
+
+class TestMatchAlbum:
+    """Tests for album-level Spotify → YouTube Music matching."""
+
+    @staticmethod
+    def _tracks():
+        from tetodl.core.clients.spotify import SpotifyTrack
+
+        return [
+            SpotifyTrack(title="Intro", artist="Band", duration_ms=60_000, spotify_id="s1"),
+            SpotifyTrack(title="Second Song", artist="Band", duration_ms=200_000, spotify_id="s2"),
+            SpotifyTrack(title="Bonus", artist="Band", duration_ms=150_000, spotify_id="s3"),
+            SpotifyTrack(title="Closer", artist="Band", duration_ms=300_000, spotify_id="s4"),
+        ]
+
+    @staticmethod
+    def _pages(pages):
+        """Answer each request with the entries keyed by its last path segment."""
+        return lambda url: {"entries": pages.get(url.split("?", 1)[0].split("/")[-1], [])}
+
+    def test_maps_by_position_duration_and_title(self, mocker):
+        """Same-position tracks map on duration; moved tracks map on title."""
+        from tetodl.core.pipeline.handlers import _map_album_tracks
+
+        entries = [
+            {"url": "https://music.youtube.com/watch?v=i", "title": "Intro", "duration": 61},
+            {"url": "https://music.youtube.com/watch?v=c", "title": "Closer", "duration": 300},
+            {"url": "https://music.youtube.com/watch?v=x", "title": "Other", "duration": 150},
+            {"url": "https://music.youtube.com/watch?v=s", "title": "Second Song", "duration": 199},
+        ]
+
+        mapped = _map_album_tracks(self._tracks(), entries)
+
+        assert mapped == {
+            "s1": "https://music.youtube.com/watch?v=i",
+            "s2": "https://music.youtube.com/watch?v=s",
+            "s3": "https://music.youtube.com/watch?v=x",
+            "s4": "https://music.youtube.com/watch?v=c",
+        }
+
+    def test_one_album_lookup_for_the_whole_tracklist(self, fake_pooled_ydl):
+        """A well-titled album candidate is opened once and its tracks mapped."""
+        from tetodl.core.pipeline.handlers import _match_album
+
+        album = [
+            {"url": f"https://music.youtube.com/watch?v={n}", "title": t.title, "duration": t.duration_ms // 1000}
+            for n, t in enumerate(self._tracks())
+        ]
+        requested = fake_pooled_ydl(self._pages({
+            "search": [
+                {"url": "https://music.youtube.com/browse/wrong", "title": "Live At Somewhere"},
+                {"url": "https://music.youtube.com/browse/right", "title": "Great Album (Deluxe)"},
+            ],
+            "right": album,
+        }))
+
+        mapped = _match_album("Great Album", self._tracks())
+
+        assert len(mapped) == 4
+        assert requested[1] == "https://music.youtube.com/browse/right"
+        assert len(requested) == 2
+
+    def test_gives_up_when_nothing_maps(self, fake_pooled_ydl):
+        """Candidates that map under half the tracks are rejected."""
+        from tetodl.core.pipeline.handlers import _match_album
+
+        requested = fake_pooled_ydl(self._pages({
+            "search": [{"url": "https://music.youtube.com/browse/a", "title": "Great Album"}],
+            "results": [{"url": "https://www.youtube.com/playlist?list=b", "title": "Great Album"}],
+            "a": [], "playlist": [],
+        }))
+
+        assert _match_album("Great Album", self._tracks()) == {}
+        assert len(requested) == 4
+
+    def test_spotify_album_searches_only_unmapped_tracks(self, mocker):
+        """Per-track search runs only for tracks the album did not map."""
+        from tetodl.core.domain.cache import reset_cache
+        from tetodl.core.pipeline.handlers import download_spotify
+
+        reset_cache()
+        tracks = self._tracks()
+        mock_resolver = mocker.patch("tetodl.core.clients.spotify.SpotifyResolver", autospec=True)
+        mock_resolver.return_value.resolve_meta.return_value = ("Great Album", tracks)
+        mock_resolver.return_value.url_type.return_value = "album"
+        match_album = mocker.patch(
+            "tetodl.core.pipeline.handlers._match_album",
+            return_value={f"s{n}": f"https://music.youtube.com/watch?v={n}" for n in (1, 2, 4)},
+        )
+        search = mocker.patch(
+            "tetodl.core.pipeline.handlers._search_ytmusic",
+            return_value="https://music.youtube.com/watch?v=3",
+        )
+        playlist = mocker.patch(
+            "tetodl.core.pipeline.handlers._handle_playlist",
+            return_value=DownloadResult(success=True),
+        )
+
+        download_spotify(
+            url="https://open.spotify.com/album/al",
+            session=DownloadSession(url="https://open.spotify.com/album/al"),
+            config=AppConfig(music_root="/music"),
+        )
+
+        match_album.assert_called_once_with("Great Album", tracks)
+        search.assert_called_once_with("Bonus - Band", target_duration_ms=150_000)
+        urls = [u for _, u, _ in playlist.call_args.kwargs["urls"]]
+        assert [u[-1] for u in urls] == ["1", "2", "3", "4"]
+
+
+class TestSearchYtmusic:
+    """Tests for single-pass candidate scoring in _search_ytmusic."""
+
+    @pytest.fixture(autouse=True)
+    def _phase1_reliable(self, mocker):
+        mocker.patch("tetodl.core.pipeline.handlers._phase1_hit_rate", 1.0)
+
+    @staticmethod
+    def _by_phase(results):
+        """Answer Topic (phase 1) queries from results[True], others from results[False]."""
+        return lambda url: {"entries": results.get(url.endswith(" topic"), [])}
+
+    @staticmethod
+    def _entry(vid, title, uploader="Someone", duration=200):
+        return {
+            "url": f"https://music.youtube.com/watch?v={vid}",
+            "title": title, "uploader": uploader, "duration": duration,
+        }
+
+    def test_best_tier_wins_over_earlier_results(self, fake_pooled_ydl):
+        """A later clean Topic upload beats an earlier lyrics video."""
+        from tetodl.core.pipeline.handlers import _search_ytmusic
+
+        queries = fake_pooled_ydl(self._by_phase({True: [
+            self._entry("lyr", "Song (Lyrics)", "Lyric Channel"),
+            self._entry("top", "Song", "Band - Topic"),
+        ]}))
+
+        url = _search_ytmusic("Song - Band", target_duration_ms=200_000)
+
+        assert url.endswith("top")
+        assert len(queries) == 1
+
+    def test_falls_through_to_general_search_and_last_resort(self, fake_pooled_ydl):
+        """Phase 2 runs only when phase 1 has no tier; phase 3 takes the first left."""
+        from tetodl.core.pipeline.handlers import _search_ytmusic
+
+        queries = fake_pooled_ydl(self._by_phase({
+            True: [self._entry("a", "Unrelated", duration=10)],
+            False: [self._entry("b", "Also Unrelated", duration=10)],
+        }))
+
+        url = _search_ytmusic("Song - Band", target_duration_ms=200_000)
+
+        assert url.endswith("a")
+        assert queries == ["ytsearch10:Song - Band topic", "ytsearch10:Song - Band"]
+
+    def test_speculates_phase_two_when_phase_one_keeps_failing(self, mocker, fake_pooled_ydl):
+        """A low phase 1 hit rate sends the general query up front."""
+        from tetodl.core.pipeline.handlers import _search_ytmusic
+
+        queries = fake_pooled_ydl(self._by_phase({False: [self._entry("g", "Song", "Band")]}))
+        mocker.patch("tetodl.core.pipeline.handlers._phase1_hit_rate", 0.1)
+
+        url = _search_ytmusic("Song - Band", target_duration_ms=200_000)
+
+        assert url.endswith("g")
+        assert sorted(queries) == ["ytsearch10:Song - Band", "ytsearch10:Song - Band topic"]
+
+    def test_rank_reproduces_tier_walk(self):
+        """The single ranking function picks what the tier-by-tier walk picked."""
+        import random
+
+        from tetodl.core.pipeline.handlers import _Candidate, _best
+
+        phase = [
+            lambda c: c.topic and c.dur_ok and c.overlap >= 0.5 and c.clean,
+            lambda c: c.topic and c.dur_ok and c.overlap >= 0.3,
+            lambda c: c.topic and c.dur_ok and c.artist_uploader,
+            lambda c: c.dur_ok and c.artist_uploader and c.artist_title,
+            lambda c: c.dur_ok and c.overlap >= 0.5,
+            lambda c: c.dur_ok and c.overlap >= 0.3,
+            lambda c: c.dur_wide and c.overlap >= 0.5,
+            lambda c: c.dur_wide and c.artist_uploader and c.artist_title,
+        ]
+        final = [
+            lambda c: c.dur_ok and c.artist_uploader and c.artist_title,
+            lambda c: c.dur_wide and c.lyrics_kw,
+            lambda c: c.dur_ok and c.artist_uploader,
+            lambda c: c.dur_ok and c.artist_title,
+            lambda c: c.clean and c.overlap >= 0.5,
+            lambda c: c.overlap >= 0.5,
+            lambda c: c.overlap >= 0.3,
+            lambda c: True,
+        ]
+
+        def _walk(candidates, tiers):
+            for tier, test in enumerate(tiers, 1):
+                for c in candidates:
+                    if test(c):
+                        return tier, c
+            return None
+
+        rng = random.Random(7)
+        for _ in range(500):
+            candidates = []
+            for n in range(rng.randint(0, 6)):
+                dur_ok = rng.random() < 0.5
+                flags = [rng.random() < 0.5 for _ in range(5)]
+                candidates.append(_Candidate(
+                    f"u{n}", "t", "up", 1, flags[0], dur_ok, dur_ok or flags[1],
+                    rng.choice([0.0, 0.3, 0.5, 1.0]), flags[2], flags[3], flags[4],
+                    rng.random() < 0.3,
+                ))
+            assert _best(candidates) == _walk(candidates, phase)
+            assert _best(candidates, final=True) == _walk(candidates, final)
@@ -0,0 +1,74 @@
+import threading
+
+from tetodl.core.cover import CoverData
+from tetodl.core.domain.models import AppConfig, MediaInfo, PipelineContext
+from tetodl.core.pipeline.prefetch import start_enrichment
+from tetodl.core.pipeline.stages.resolve_enrichment import ResolveEnrichmentStep
+
+
+def _ctx(**kw) -> PipelineContext:
+    return PipelineContext(
+        config=AppConfig(),
+        url="https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+        target_dir="/tmp",
+        media_info=MediaInfo(
+            id="dQw4w9WgXcQ", title="Never Gonna Give You Up",
+            url="https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+            artist="Rick Astley", track="Never Gonna Give You Up",
+            duration=212, thumbnail="https://i.ytimg.com/vi/dQw4w9WgXcQ/hq.jpg",
+        ),
+        **kw,
+    )
+
+
+class TestEnrichmentPrefetch:
+    """Tests for enrichment lookups started alongside the download."""
+
+    def test_nothing_started_without_enrichment_modes(self, mocker):
+        """No lookups are launched when cover, metadata and lyrics are off."""
+        search = mocker.patch("tetodl.core.pipeline.prefetch._cover_service.search")
+        ctx = _ctx()
+        assert start_enrichment(ctx) is None
+        assert ctx.enrichment_future is None
+        search.assert_not_called()
+
+    def test_lookups_run_during_download_and_are_joined(self, mocker):
+        """Search, image and lyrics start before the download ends; the step joins them."""
+        download_done = threading.Event()
+        lookups: list[str] = []
+        all_started = threading.Barrier(3, timeout=2)
+
+        cover = CoverData(
+            url="https://covers.example/a.jpg", source="itunes",
+            artist="Rick Astley", title="Never Gonna Give You Up",
+        )
+
+        def _search(query):
+            lookups.append("search")
+            return cover
+
+        def _fetch(url):
+            lookups.append(f"image:{url}")
+            assert not download_done.is_set()
+            all_started.wait()
+
+        def _lyrics(artist, title, duration):
+            lookups.append(f"lyrics:{artist}/{title}")
+            assert not download_done.is_set()
+            all_started.wait()
+
+        search = mocker.patch("tetodl.core.pipeline.prefetch._cover_service.search", side_effect=_search)
+        mocker.patch("tetodl.core.pipeline.prefetch._cover_service.fetch", side_effect=_fetch)
+        mocker.patch("tetodl.core.pipeline.prefetch.search_lyrics", side_effect=_lyrics)
+
+        ctx = _ctx(cover_mode=True, lyrics_mode=True)
+        start_enrichment(ctx)
+        all_started.wait()  # the "download" is still running here
+        download_done.set()
+
+        ctx = ResolveEnrichmentStep()(ctx)
+
+        assert ctx.enrichment_data is cover
+        assert search.call_count == 1
+        assert "image:https://covers.example/a.jpg" in lookups
+        assert "lyrics:Rick Astley/Never Gonna Give You Up" in lookups
@@ -0,0 +1,250 @@
+import threading
+
+from tetodl.core.domain.models import AppConfig, DownloadedFile, MediaInfo
+from tetodl.core.pipeline.staged import Stage, StagedExecutor
+
+
+class TestStagedExecutor:
+    """Tests for the staged playlist executor."""
+
+    def test_results_keep_input_order(self):
+        """Values flow through every stage and come back in input order."""
+        executor = StagedExecutor(
+            [
+                Stage("double", lambda v: v * 2, workers=3),
+                Stage("inc", lambda v: v + 1, workers=2),
+            ],
+            queue_size=2,
+        )
+        results = executor.run(range(10))
+
+        assert [r.index for r in results] == list(range(10))
+        assert [r.value for r in results] == [v * 2 + 1 for v in range(10)]
+        assert all(r.stage == "inc" and r.error is None for r in results)
+
+    def test_none_finishes_item_early(self):
+        """A stage returning None stops the item there with its last value."""
+        seen: list[int] = []
+
+        def _second(v):
+            seen.append(v)
+            return v
+
+        executor = StagedExecutor([
+            Stage("filter", lambda v: None if v % 2 else v),
+            Stage("collect", _second),
+        ])
+        results = executor.run([1, 2, 3, 4])
+
+        assert sorted(seen) == [2, 4]
+        assert [r.stage for r in results] == ["filter", "collect", "filter", "collect"]
+        assert [r.value for r in results] == [1, 2, 3, 4]
+
+    def test_stage_errors_are_recorded(self):
+        """An exception fails only its item and is kept on the result."""
+        def _boom(v):
+            if v == 1:
+                raise RuntimeError("bad item")
+            return v
+
+        results = StagedExecutor([Stage("a", _boom), Stage("b", lambda v: v)]).run([0, 1, 2])
+
+        assert results[1].stage == "a"
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[0].error is None and results[2].error is None
+
+    def test_stages_overlap_across_items(self):
+        """Item 2 enters the first stage while item 1 is still in the second."""
+        second_started = threading.Event()
+        first_stage_ran_meanwhile = threading.Event()
+
+        def _fetch(v):
+            if v == 1:
+                second_started.wait(2)
+                first_stage_ran_meanwhile.set()
+            return v
+
+        def _tag(v):
+            if v == 0:
+                second_started.set()
+                first_stage_ran_meanwhile.wait(2)
+            return v
+
+        StagedExecutor([Stage("fetch", _fetch), Stage("tag", _tag)]).run([0, 1])
+        assert first_stage_ran_meanwhile.is_set()
+
+
+class TestPlaylistStaged:
+    """Tests for the staged playlist handler."""
+
+    def test_sequential_playlist_counts_and_order(self, mocker, tmp_path):
+        """Registry hits skip the pipeline; failures and successes are tallied."""
+        from tetodl.core.pipeline import handlers
+
+        mocker.patch(
+            "tetodl.core.pipeline.handlers._registry_precheck",
+            return_value={"bbbbbbbbbbb": {"file_path": str(tmp_path / "b.m4a")}},
+        )
+
+        def _acquire(self, ctx):
+            if "ccccccccccc" in ctx.url:
+                ctx.error = "unavailable"
+                return ctx
+            info = MediaInfo(id="aaaaaaaaaaa", title="A", url=ctx.url)
+            ctx.media_info = info
+            ctx.downloaded_file = DownloadedFile(
+                path=str(tmp_path / "a.m4a"), container="m4a", title="A", info=info,
+            )
+            return ctx
+
+        enrich = mocker.patch.object(handlers.MediaPipeline, "enrich", side_effect=lambda ctx: ctx)
+        post = mocker.patch.object(handlers.MediaPipeline, "postprocess", side_effect=lambda ctx: ctx)
+        mocker.patch.object(handlers.MediaPipeline, "acquire", _acquire)
+
+        urls = [
+            "https://youtube.com/watch?v=aaaaaaaaaaa",
+            "https://youtube.com/watch?v=bbbbbbbbbbb",
+            "https://youtube.com/watch?v=ccccccccccc",
+        ]
+        config = AppConfig(create_m3u=False, download_workers=1, postprocess_workers=2)
+        counts = handlers._playlist_sequential(
+            urls=urls, target_dir=str(tmp_path), config=config,
+            media_type="audio", registry_media_type="audio",
+            is_youtube_music=True, ui=mocker.MagicMock(),
+        )
+
+        assert counts == (1, 1, 1)
+        assert enrich.call_count == 1
+        assert post.call_count == 1
+
+    def test_streamed_entries_prefiltered_in_chunks(self, mocker, tmp_path):
+        """Registry lookups run per chunk as (index, url) entries arrive."""
+        from tetodl.core.pipeline import handlers
+
+        mocker.patch("tetodl.core.pipeline.handlers._PRECHECK_CHUNK", 2)
+        precheck = mocker.patch(
+            "tetodl.core.pipeline.handlers._registry_precheck",
+            side_effect=lambda urls, *_: (
+                {"bbbbbbbbbbb": {"file_path": str(tmp_path / "b.m4a")}}
+                if any("bbbbbbbbbbb" in u for u in urls) else {}
+            ),
+        )
+
+        acquired: list[str] = []
+
+        def _acquire(self, ctx):
+            acquired.append(ctx.url)
+            ctx.error = "offline"
+            return ctx
+
+        mocker.patch.object(handlers.MediaPipeline, "acquire", _acquire)
+
+        def _entries():
+            yield 3, "https://youtube.com/watch?v=aaaaaaaaaaa"
+            yield 5, "https://youtube.com/watch?v=bbbbbbbbbbb"
+            yield 8, "https://youtube.com/watch?v=ccccccccccc"
+
+        records = handlers._playlist_staged(
+            urls=_entries(), target_dir=str(tmp_path), config=AppConfig(),
+            media_type="audio", is_youtube_music=False,
+            registry_media_type="audio", dirs_to_check=[str(tmp_path)],
+            download_workers=1, announce=False,
+        )
+
+        assert precheck.call_count == 2
+        assert [r.get("skipped") for r in records] == [None, True, None]
+        assert acquired == [
+            "https://youtube.com/watch?v=aaaaaaaaaaa",
+            "https://youtube.com/watch?v=ccccccccccc",
+        ]
+
+    def test_resumes_from_journal(self, mocker, tmp_path, _isolated_journal):
+        """Done items are skipped, downloaded items skip the download stage."""
+        from tetodl.core.domain.journal import DONE, DOWNLOADED, PENDING
+        from tetodl.core.pipeline import handlers
+
+        mocker.patch("tetodl.core.pipeline.handlers._registry_precheck", return_value={})
+
+        urls = [f"https://youtube.com/watch?v={c * 11}" for c in "abc"]
+        done_file = tmp_path / "a.m4a"
+        done_file.write_bytes(b"a")
+        half_file = tmp_path / "b.m4a"
+        half_file.write_bytes(b"b")
+        half_info = MediaInfo(id="b" * 11, title="B", url=urls[1])
+
+        job = _isolated_journal.open("https://youtube.com/playlist?list=PL", str(tmp_path))
+        job.mark(1, urls[0], DONE, file_path=str(done_file))
+        job.mark(2, urls[1], DOWNLOADED, file=DownloadedFile(
+            path=str(half_file), container="m4a", title="B", info=half_info,
+        ).model_dump(mode="json"))
+        job.mark(3, urls[2], PENDING)
+
+        acquired: list[str] = []
+
+        def _acquire(self, ctx):
+            acquired.append(ctx.url)
+            info = MediaInfo(id="c" * 11, title="C", url=ctx.url)
+            ctx.media_info = info
+            ctx.downloaded_file = DownloadedFile(
+                path=str(tmp_path / "c.m4a"), container="m4a", title="C", info=info,
+            )
+            return ctx
+
+        mocker.patch.object(handlers.MediaPipeline, "acquire", _acquire)
+        enrich = mocker.patch.object(handlers.MediaPipeline, "enrich", side_effect=lambda ctx: ctx)
+        mocker.patch.object(handlers.MediaPipeline, "postprocess", side_effect=lambda ctx: ctx)
+
+        records = handlers._playlist_staged(
+            urls=job.entries(), target_dir=str(tmp_path), config=AppConfig(),
+            media_type="audio", is_youtube_music=False,
+            registry_media_type="audio", dirs_to_check=[str(tmp_path)],
+            download_workers=1, announce=False, job=job,
+        )
+
+        assert acquired == [urls[2]]
+        assert enrich.call_count == 2
+        assert [r["skipped"] for r in records] == [True, False, False]
+        assert records[1]["file_path"] == str(half_file)
+        assert {i["state"] for i in job.items.values()} == {DONE}
+        assert job.close() is True
+
+    def test_concurrent_video_playlist_keeps_m3u_order(self, mocker, tmp_path):
+        """Videos finishing out of order still land in the m3u in playlist order."""
+        import time
+
+        from tetodl.core.pipeline import handlers
+
+        mocker.patch("tetodl.core.pipeline.handlers._registry_precheck", return_value={})
+        mocker.patch("tetodl.core.pipeline.handlers.remembered_limit", return_value=None)
+        mocker.patch("tetodl.core.pipeline.handlers.remember_limit")
+        m3u = mocker.patch("tetodl.utils.files.create_m3u8_playlist")
+
+        seen: list[tuple] = []
+
+        def _acquire(self, ctx):
+            seen.append((ctx.media_type, ctx.disk_budget is not None, ctx.transfer_done is not None))
+            time.sleep({"a": 0.15, "b": 0.05, "c": 0.0}[ctx.url[-1]])
+            ctx.transfer_done(1000)
+            name = ctx.url[-1]
+            info = MediaInfo(id=name * 11, title=name, url=ctx.url)
+            ctx.media_info = info
+            ctx.downloaded_file = DownloadedFile(
+                path=str(tmp_path / f"{name}.mp4"), container="mp4", title=name, info=info,
+            )
+            return ctx
+
+        mocker.patch.object(handlers.MediaPipeline, "acquire", _acquire)
+        mocker.patch.object(handlers.MediaPipeline, "enrich", side_effect=lambda ctx: ctx)
+        mocker.patch.object(handlers.MediaPipeline, "postprocess", side_effect=lambda ctx: ctx)
+
+        urls = [f"https://youtube.com/watch?v={c * 11}" for c in "abc"]
+        config = AppConfig(create_m3u=True, async_workers=3)
+        counts = handlers._playlist_concurrent(
+            urls=urls, target_dir=str(tmp_path), alt_dirs=[], config=config,
+            media_type="video", registry_media_type="video",
+            is_youtube_music=False, ui=mocker.MagicMock(),
+        )
+
+        assert counts == (3, 0, 0)
+        assert seen == [("video", True, True)] * 3
+        assert m3u.call_args.args[2] == ["a.mp4", "b.mp4", "c.mp4"]
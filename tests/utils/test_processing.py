@@ -80,3 +80,92 @@ class TestParsePlaylistItems:
     def test_invalid_input_raises(self, parse):
         with pytest.raises(ValueError, match="Invalid item format"):
             parse("abc")
+
+
+class TestFormatPlaylistItems:
+    def test_collapses_ranges(self):
+        from tetodl.utils.processing import format_playlist_items
+        assert format_playlist_items({7, 1, 2, 3, 9, 10}) == "1-3,7,9-10"
+
+    def test_round_trips_through_parse(self):
+        from tetodl.utils.processing import format_playlist_items, parse_playlist_items
+        assert parse_playlist_items(format_playlist_items({2, 4, 5, 6})) == {2, 4, 5, 6}
+
+
+def _paged_ydl(pages_fetched: list[int], page_size: int = 3, pages: int = 4):
+    import yt_dlp
+
+    class _PagedYDL(yt_dlp.YoutubeDL):
+        def extract_info(self, url, download=True, process=True, **kwargs):
+            def _entries():
+                for page in range(pages):
+                    pages_fetched.append(page)
+                    for n in range(page * page_size, (page + 1) * page_size):
+                        yield {"_type": "url", "id": f"vid{n:08d}"}
+            return {"_type": "playlist", "title": "Mix", "entries": _entries()}
+
+    return _PagedYDL
+
+
+class TestExpandContent:
+    """Tests for the streaming playlist expander."""
+
+    def test_entries_stream_page_by_page(self, mocker):
+        """Later pages are fetched only as entries are consumed."""
+        from tetodl.utils.processing import expand_content
+
+        fetched: list[int] = []
+        mocker.patch("tetodl.utils.processing.yt.YoutubeDL", _paged_ydl(fetched))
+
+        listing = expand_content("https://www.youtube.com/playlist?list=PLx")
+        assert listing.is_playlist and listing.title == "Mix"
+
+        first = next(listing.entries)
+        assert first == (1, "https://www.youtube.com/watch?v=vid00000000")
+        assert fetched == [0]
+
+        rest = list(listing.entries)
+        assert len(rest) == 11
+        assert fetched == [0, 1, 2, 3]
+
+    def test_selected_items_limit_pages(self, mocker):
+        """--items is pushed down so pages past the selection are never fetched."""
+        from tetodl.utils.processing import expand_content
+
+        fetched: list[int] = []
+        mocker.patch("tetodl.utils.processing.yt.YoutubeDL", _paged_ydl(fetched))
+
+        listing = expand_content(
+            "https://music.youtube.com/playlist?list=PLx", playlist_items={2, 4, 5},
+        )
+        entries = list(listing.entries)
+
+        assert [i for i, _ in entries] == [2, 4, 5]
+        assert entries[0][1] == "https://music.youtube.com/watch?v=vid00000001"
+        assert fetched == [0, 1]
+
+    def test_follows_url_results(self, mocker):
+        """Redirects to a playlist are followed before the listing is read."""
+        import yt_dlp
+        from yt_dlp.extractor.common import InfoExtractor
+
+        from tetodl.utils.processing import expand_content
+
+        album = "https://www.youtube.com/playlist?list=OLAK5uy_album"
+        requested: list[str] = []
+
+        class _RedirectYDL(yt_dlp.YoutubeDL):
+            def extract_info(self, url, download=True, ie_key=None, process=True, **kwargs):
+                requested.append(url)
+                if url != album:
+                    return InfoExtractor.url_result(album, ie="YoutubeTab")
+                entries = ({"_type": "url", "id": f"vid{n:08d}"} for n in range(2))
+                return {"_type": "playlist", "title": "Album", "entries": entries}
+
+        mocker.patch("tetodl.utils.processing.yt.YoutubeDL", _RedirectYDL)
+
+        listing = expand_content("https://music.youtube.com/browse/MPREb_album")
+
+        assert requested == ["https://music.youtube.com/browse/MPREb_album", album]
+        assert listing.is_playlist and listing.title == "Album"
+        assert [i for i, _ in listing.entries] == [1, 2]
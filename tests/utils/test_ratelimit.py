@@ -0,0 +1,72 @@
+from tetodl.utils.ratelimit import TokenBucket, configure_youtube_pacing, youtube_bucket
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Tests for the shared request token bucket."""
+
+    def test_burst_passes_without_waiting(self):
+        """Requests up to the burst size go out back to back."""
+        clock = _Clock()
+        bucket = TokenBucket(rate=0.5, burst=3, clock=clock, sleep=clock.sleep)
+
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.slept == []
+
+    def test_deficit_waits_for_refill(self):
+        """Past the burst, each request waits 1/rate plus at most the jitter."""
+        clock = _Clock()
+        bucket = TokenBucket(rate=0.5, burst=1, jitter=1.0, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        waited = bucket.acquire()
+
+        assert 2.0 <= waited <= 3.0
+        assert clock.slept == [waited]
+
+    def test_reservations_queue_up(self):
+        """Concurrent callers are spaced out instead of all waiting the same delay."""
+        clock = _Clock()
+        bucket = TokenBucket(rate=1.0, burst=1, clock=clock)
+
+        delays = [bucket.reserve() for _ in range(3)]
+
+        assert delays == [0.0, 1.0, 2.0]
+
+    def test_idle_time_refills(self):
+        """Time spent not making requests is credited to the bucket."""
+        clock = _Clock()
+        bucket = TokenBucket(rate=1.0, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 5.0
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+
+    def test_zero_rate_never_waits(self):
+        """A rate of 0 disables pacing entirely."""
+        bucket = TokenBucket(rate=0.0, burst=1)
+
+        assert all(bucket.reserve() == 0.0 for _ in range(10))
+
+    def test_configure_youtube_pacing(self):
+        """Jitter settings map to one request per jitter_min seconds."""
+        configure_youtube_pacing(2.0, 5.0, 3)
+
+        assert youtube_bucket.rate == 0.5
+        assert youtube_bucket.burst == 3
+        assert youtube_bucket.jitter == 3.0
@@ -0,0 +1,72 @@
+import threading
+
+import yt_dlp
+
+from tetodl.utils.ydl_pool import close_thread_pool, pooled_ydl
+
+_BASE = {"quiet": True, "no_warnings": True}
+
+
+class TestYdlPool:
+    """Tests for the per-thread YoutubeDL pool."""
+
+    def teardown_method(self):
+        close_thread_pool()
+
+    def test_instance_reused_per_profile(self):
+        """One thread gets the same instance back for the same profile and options."""
+        with pooled_ydl("flat", {**_BASE, "extract_flat": True}, yt_dlp.YoutubeDL) as a:
+            pass
+        with pooled_ydl("flat", {**_BASE, "extract_flat": True}, yt_dlp.YoutubeDL) as b:
+            pass
+        with pooled_ydl("full", {**_BASE, "extract_flat": False}, yt_dlp.YoutubeDL) as c:
+            pass
+
+        assert a is b
+        assert c is not a
+
+    def test_threads_get_their_own_instance(self):
+        """Instances are never shared between threads."""
+        seen = []
+
+        def _grab():
+            with pooled_ydl("flat", _BASE, yt_dlp.YoutubeDL) as ydl:
+                seen.append(ydl)
+            close_thread_pool()
+
+        with pooled_ydl("flat", _BASE, yt_dlp.YoutubeDL) as mine:
+            t = threading.Thread(target=_grab)
+            t.start()
+            t.join()
+
+        assert seen and seen[0] is not mine
+
+    def test_per_item_options_swapped_and_reset(self):
+        """outtmpl, cut ranges and hooks apply to one block only."""
+        hook = lambda d: None  # noqa: E731
+        ranges = lambda info, ydl: []  # noqa: E731
+        opts = {
+            **_BASE,
+            "format": "bestaudio",
+            "outtmpl": "/tmp/one/%(title)s.%(ext)s",
+            "download_ranges": ranges,
+            "progress_hooks": [hook],
+        }
+
+        with pooled_ydl("audio", opts, yt_dlp.YoutubeDL) as ydl:
+            assert ydl.params["outtmpl"]["default"] == "/tmp/one/%(title)s.%(ext)s"
+            assert ydl.params["download_ranges"] is ranges
+            assert ydl._progress_hooks == [hook]
+
+        second = {**_BASE, "format": "bestaudio", "outtmpl": "/tmp/two/%(title)s.%(ext)s"}
+        with pooled_ydl("audio", second, yt_dlp.YoutubeDL) as again:
+            assert again is ydl
+            assert again.params["outtmpl"]["default"] == "/tmp/two/%(title)s.%(ext)s"
+            assert "download_ranges" not in again.params
+            assert again._progress_hooks == []
+
+    def test_nested_block_gets_separate_instance(self):
+        """A busy instance is not handed out again on the same thread."""
+        with pooled_ydl("full", _BASE, yt_dlp.YoutubeDL) as outer:
+            with pooled_ydl("full", _BASE, yt_dlp.YoutubeDL) as inner:
+                assert inner is not outer
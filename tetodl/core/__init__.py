@@ -8,11 +8,14 @@ from .domain.cache import (
     CacheStats,
     cache_metadata,
     evict_cache,
+    flush_all,
     get_cache,
     get_cache_size,
     get_cached_metadata,
     get_url_hash,
     reset_cache,
+    start_flusher,
+    stop_flusher,
 )
 from .domain.config import (
     cleanup_ghost_subfolders,
@@ -40,6 +43,7 @@ __all__ = [
     'cache_metadata',
     'cleanup_ghost_subfolders',
     'evict_cache',
+    'flush_all',
     'get_cache',
     'get_cache_size',
     'get_cached_metadata',
@@ -58,6 +62,8 @@ __all__ = [
     'save_history',
     'set_progress_style',
     'set_video_resolution',
+    'start_flusher',
+    'stop_flusher',
     'toggle_simple_mode',
     'toggle_skip_existing',
     'update_language',
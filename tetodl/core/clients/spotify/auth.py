@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import requests
+from requests.adapters import HTTPAdapter
 
 _USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -15,6 +16,8 @@ class SpotifyAuth:
         self._session.headers.update({
             "User-Agent": _USER_AGENT,
         })
+        # Shared by every thread matching or resolving tracks at once.
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
     @property
     def session(self) -> requests.Session:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 from typing import Any
 
 from .auth import SpotifyAuth
@@ -16,6 +17,11 @@ _NEXT_DATA_RE = re.compile(
 )
 
 
+# Parsed embed entities are cached this long, so a preview followed by the
+# download (or a rerun) does not fetch the same page again.
+ENTITY_TTL = 900
+
+
 class SpotifyClient:
     def __init__(self, auth: SpotifyAuth) -> None:
         self._auth = auth
@@ -25,13 +31,18 @@ class SpotifyClient:
     def _session(self):
         return self._auth.session
 
+    def _entity(self, path: str) -> dict[str, Any]:
+        from tetodl.core.domain.cache import get_cache
+        return get_cache("spotify").get_or_load(path, lambda: self._fetch_embed(path), ENTITY_TTL)
+
     def _fetch_embed(self, path: str) -> dict[str, Any]:
-        self._rate_limiter.wait()
-        resp = self._session.get(f"{EMBED_BASE}/{path}", timeout=15)
-        if resp.status_code == 429:
-            if self._rate_limiter.report_429():
-                return self._fetch_embed(path)
-            raise SpotifyParseError("Rate limited by Spotify")
+        while True:
+            self._rate_limiter.wait()
+            resp = self._session.get(f"{EMBED_BASE}/{path}", timeout=15)
+            if resp.status_code != 429:
+                break
+            if not self._rate_limiter.report_429():
+                raise SpotifyParseError("Rate limited by Spotify")
         self._rate_limiter.report_success()
         if resp.status_code != 200:
             raise SpotifyParseError(
@@ -68,10 +79,24 @@ class SpotifyClient:
         return entity
 
     def get_track(self, track_id: str) -> dict[str, Any]:
-        return self._fetch_embed(f"track/{track_id}")
+        return self._entity(f"track/{track_id}")
 
     def get_playlist(self, playlist_id: str) -> dict[str, Any]:
-        return self._fetch_embed(f"playlist/{playlist_id}")
+        return self._entity(f"playlist/{playlist_id}")
 
     def get_album(self, album_id: str) -> dict[str, Any]:
-        return self._fetch_embed(f"album/{album_id}")
+        return self._entity(f"album/{album_id}")
+
+
+_shared: SpotifyClient | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> SpotifyClient:
+    """The process-wide client: one connection pool and one rate limit
+    for every resolver, extractor and daemon request."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = SpotifyClient(SpotifyAuth())
+        return _shared
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import threading
 import time
+from collections import deque
 
 
 class SpotifyRateLimiter:
+    """Sliding one-minute request window plus exponential backoff after
+    429s.  Safe to share between threads: each caller reserves its slot
+    under the lock and sleeps outside it."""
+
     def __init__(
         self,
         max_per_minute: int = 30,
@@ -16,29 +22,37 @@ class SpotifyRateLimiter:
         self._backoff = backoff
         self._max_retries = max_retries
 
-        self._request_times: list[float] = []
+        self._lock = threading.Lock()
+        self._request_times: deque[float] = deque()
         self._consecutive_429 = 0
 
-    def _enforce_minute_window(self) -> None:
+    def _reserve(self) -> float:
         now = time.monotonic()
         cutoff = now - 60.0
-        self._request_times = [t for t in self._request_times if t > cutoff]
-        if len(self._request_times) >= self._max_per_minute:
-            sleep_for = self._request_times[0] + 60.0 - now
-            if sleep_for > 0:
-                time.sleep(sleep_for)
-        self._request_times.append(time.monotonic())
-
-    def wait(self) -> None:
-        self._enforce_minute_window()
+        times = self._request_times
+        while times and times[0] <= cutoff:
+            times.popleft()
+        sleep_for = 0.0
+        if len(times) >= self._max_per_minute:
+            sleep_for = max(0.0, times[-self._max_per_minute] + 60.0 - now)
+        times.append(now + sleep_for)
 
         if self._consecutive_429 > 0:
             delay = self._base_delay * (self._backoff ** (self._consecutive_429 - 1))
-            time.sleep(min(delay, 30.0))
+            sleep_for += min(delay, 30.0)
+        return sleep_for
+
+    def wait(self) -> None:
+        with self._lock:
+            sleep_for = self._reserve()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
 
     def report_success(self) -> None:
-        self._consecutive_429 = 0
+        with self._lock:
+            self._consecutive_429 = 0
 
     def report_429(self) -> bool:
-        self._consecutive_429 += 1
-        return self._consecutive_429 <= self._max_retries
+        with self._lock:
+            self._consecutive_429 += 1
+            return self._consecutive_429 <= self._max_retries
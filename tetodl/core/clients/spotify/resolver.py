@@ -3,8 +3,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from .auth import SpotifyAuth
-from .client import SpotifyClient
+from .client import SpotifyClient, shared_client
 from .errors import SpotifyParseError
 from .models import SpotifyTrack
 
@@ -17,9 +16,14 @@ _URL_PATTERN = re.compile(
 
 
 class SpotifyResolver:
-    def __init__(self) -> None:
-        self._auth = SpotifyAuth()
-        self._client = SpotifyClient(self._auth)
+    def __init__(self, client: SpotifyClient | None = None) -> None:
+        self._client = client or shared_client()
+
+    @staticmethod
+    def url_type(url: str) -> str | None:
+        """``'track'``, ``'album'`` or ``'playlist'`` for a Spotify URL."""
+        m = _URL_PATTERN.search(url)
+        return m.group(1).lower() if m else None
 
     def resolve(self, url: str) -> list[SpotifyTrack]:
         _, tracks = self.resolve_meta(url)
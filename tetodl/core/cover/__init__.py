@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import os
+from dataclasses import asdict
+from typing import Any
 
+from tetodl.core.domain.cache import MISS, get_cache
 from tetodl.core.domain.models import DownloadResult
 from tetodl.core.cover.image import fetch_image
 from tetodl.core.cover.models import CoverData, CoverQuery
 from tetodl.core.cover.processor import (
     convert_thumbnail_format,
     crop_thumbnail_to_square,
+    image_executor,
+    render_image,
 )
 from tetodl.core.cover.providers import get_cover_providers
 from tetodl.utils.console import console
@@ -24,14 +29,27 @@ except Exception:
 
 class CoverService:
     def search(self, query: CoverQuery) -> CoverData | None:
+        cache = get_cache("cover")
+        cache_key = f"cov:{query.artist}||{query.title}||{query.album}"
+        cached = cache.get_or_load(cache_key, lambda: self._search_providers(query))
+        if cached is None or cached is MISS:
+            return None
+        return CoverData(**cached)
+
+    @staticmethod
+    def _search_providers(query: CoverQuery) -> Any:
+        """First provider hit; :data:`MISS` only when every provider
+        answered, ``None`` (not cached) when any of them failed."""
+        failed = False
         for provider in get_cover_providers():
             try:
                 result = provider.search(query)
             except Exception:
+                failed = True
                 continue
             if result is not None and result.url:
-                return result
-        return None
+                return asdict(result)
+        return None if failed else MISS
 
     def fetch(self, url: str) -> bytes | None:
         return fetch_image(url)
@@ -44,6 +62,18 @@ class CoverService:
         result = convert_thumbnail_format(filepath, target_format)
         return result or filepath
 
+    def save(self, data: bytes, filepath: str, crop: bool = False,
+             target_format: str = "jpg", fallback: bool = True) -> str:
+        """Write fetched image *data* to *filepath*, cropped and converted
+        in memory when Pillow can; otherwise through :meth:`process`, or
+        as-is when *fallback* is off."""
+        rendered = render_image(data, crop=crop, target_format=target_format)
+        with open(filepath, 'wb') as f:
+            f.write(rendered if rendered is not None else data)
+        if rendered is not None or not fallback:
+            return filepath
+        return self.process(filepath, crop=crop, target_format=target_format) or filepath
+
     @trace
     def _process_entry(
         self,
@@ -52,9 +82,24 @@ class CoverService:
         target_format: str = "jpg",
         smart_cover_mode: bool = True,
     ) -> str | None:
-        title = info.get('title', 'Unknown')
-        console.proc(Keys.media.processing_cover_for(title=title))
+        console.proc(Keys.media.processing_cover_for(title=info.get('title', 'Unknown')))
+        thumb_path, metadata = self._fetch_entry(info, target_dir, target_format, smart_cover_mode)
+        return self._finish_entry(info, target_dir, target_format, thumb_path, metadata)
 
+    def _fetch_entry(
+        self,
+        info: dict,
+        target_dir: str,
+        target_format: str = "jpg",
+        smart_cover_mode: bool = True,
+        index: int | None = None,
+    ) -> tuple[str | None, CoverData | None]:
+        """Find, fetch and render the cover for *info*; safe to run on a
+        worker thread as it prints nothing itself.
+
+        Batches pass the playlist *index* so entries sharing a video id
+        (or lacking one) never write the same temporary file.
+        """
         uploader = info.get('uploader', '')
         description = info.get('description', '')
 
@@ -70,7 +115,8 @@ class CoverService:
         thumb_path = None
         metadata = None
 
-        thumbnail_filename = f"{info.get('id', 'unknown')}.jpg"
+        stem = info.get('id', 'unknown') if index is None else f"{info.get('id', 'unknown')}.{index}"
+        thumbnail_filename = f"{stem}.jpg"
         thumbnail_path = os.path.join(target_dir, thumbnail_filename)
 
         if smart_search:
@@ -82,12 +128,8 @@ class CoverService:
                 if cover_data and cover_data.url:
                     img_data = self.fetch(cover_data.url)
                     if img_data is not None:
-                        with open(thumbnail_path, 'wb') as f:
-                            f.write(img_data)
-                        source = cover_data.source
-                        console.ok(Keys.download.youtube.fetch_success)
-                        console.ok(Keys.media.cover_art_found_via(source=source))
-                        thumb_path = thumbnail_path
+                        thumb_path = self.save(img_data, thumbnail_path, crop=should_crop,
+                                               target_format=target_format)
                         metadata = cover_data
 
         if thumb_path is None:
@@ -102,15 +144,26 @@ class CoverService:
             for url in candidate_urls:
                 img_data = self.fetch(url)
                 if img_data is not None:
-                    with open(thumbnail_path, 'wb') as f:
-                        f.write(img_data)
-                    thumb_path = thumbnail_path
+                    thumb_path = self.save(img_data, thumbnail_path, crop=should_crop,
+                                           target_format=target_format)
                     break
 
-        if thumb_path and os.path.exists(thumb_path):
-            processed = self.process(thumb_path, crop=should_crop, target_format=target_format)
-            thumb_path = processed or thumb_path
+        return thumb_path, metadata
 
+    def _finish_entry(
+        self,
+        info: dict,
+        target_dir: str,
+        target_format: str,
+        thumb_path: str | None,
+        metadata: CoverData | None,
+    ) -> str | None:
+        title = info.get('title', 'Unknown')
+        if metadata is not None:
+            console.ok(Keys.download.youtube.fetch_success)
+            console.ok(Keys.media.cover_art_found_via(source=metadata.source))
+
+        if thumb_path and os.path.exists(thumb_path):
             final_path = thumb_path
 
             try:
@@ -185,18 +238,32 @@ class CoverService:
             console.proc(Keys.media.found_items_processing(count=total))
             success_count = 0
             first_path = None
-            for i, entry in enumerate(entries, 1):
-                console.proc(Keys.media.processing_entry(
-                    current=i, total=total, title=entry.get('title') or ""))
-                fpath = self._process_entry(
-                    entry, target_dir,
-                    target_format=target_format,
-                    smart_cover_mode=smart_cover_mode,
-                )
-                if fpath:
-                    success_count += 1
-                    if not first_path:
-                        first_path = fpath
+            # Lookups, fetches and rendering run ahead on the image pool;
+            # messages and the final renames stay here, in playlist order.
+            futures = [
+                image_executor().submit(self._fetch_entry, entry, target_dir,
+                                        target_format, smart_cover_mode, index)
+                for index, entry in enumerate(entries, 1)
+            ]
+            try:
+                for i, (entry, future) in enumerate(zip(entries, futures), 1):
+                    entry_title = entry.get('title') or ""
+                    console.proc(Keys.media.processing_entry(
+                        current=i, total=total, title=entry_title))
+                    console.proc(Keys.media.processing_cover_for(title=entry_title or 'Unknown'))
+                    try:
+                        thumb_path, metadata = future.result()
+                    except Exception:
+                        thumb_path, metadata = None, None
+                    fpath = self._finish_entry(entry, target_dir, target_format,
+                                               thumb_path, metadata)
+                    if fpath:
+                        success_count += 1
+                        if not first_path:
+                            first_path = fpath
+            finally:
+                for future in futures:
+                    future.cancel()
             console.ok(Keys.media.processed_thumbnails(
                 success=success_count, total=total))
             target_dir_abs = os.path.abspath(target_dir)
@@ -2,15 +2,27 @@ from __future__ import annotations
 
 import hashlib
 import os
+import threading
 import time
 from pathlib import Path
 
+from tetodl.core.domain.cache import BUDGET_LOW_WATER, SingleFlight, namespace_budget
 from tetodl.core.domain.env import env
 from tetodl.utils.network import get_session
 
 IMG_TTL = 604800
 _IMG_DIR = Path(env.get('cache_dir')) / "cache" / "images"
 
+# Running byte total of _IMG_DIR, computed once per process then kept in
+# step with writes and evictions.  Access recency is stored in each
+# file's atime (set explicitly, so noatime mounts don't matter) while
+# mtime keeps marking the fetch time used for the TTL.
+_img_bytes: int | None = None
+_img_lock = threading.Lock()
+
+# Album tracks share artwork; concurrent fetches of one URL hit the network once.
+_flight = SingleFlight()
+
 
 def _url_key(url: str) -> str:
     return hashlib.md5(url.encode()).hexdigest()
@@ -27,18 +39,102 @@ def _fresh(path: str, ttl: float) -> bool:
         return False
 
 
+def _scan_bytes() -> int:
+    total = 0
+    for f in _IMG_DIR.glob("*.img"):
+        try:
+            total += f.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _touch(path: str) -> None:
+    try:
+        os.utime(path, (time.time(), os.path.getmtime(path)))
+    except OSError:
+        pass
+
+
+def _evict_to_budget() -> int:
+    """Drop least recently used images until under the low-water mark."""
+    global _img_bytes
+    budget = namespace_budget("images")
+    if _img_bytes is None or _img_bytes <= budget:
+        return 0
+    files = []
+    for f in _IMG_DIR.glob("*.img"):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        files.append((st.st_atime, st.st_size, f))
+    files.sort(key=lambda item: item[0])
+
+    target = int(budget * BUDGET_LOW_WATER)
+    n = 0
+    for _, size, f in files:
+        if _img_bytes <= target:
+            break
+        try:
+            f.unlink()
+        except OSError:
+            continue
+        _img_bytes -= size
+        n += 1
+    return n
+
+
+def _store(path: str, data: bytes) -> None:
+    global _img_bytes
+    with _img_lock:
+        if _img_bytes is None:
+            _img_bytes = _scan_bytes()
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+        except OSError:
+            return
+        _img_bytes += len(data) - old_size
+        _evict_to_budget()
+
+
+def img_cache_bytes() -> int:
+    global _img_bytes
+    with _img_lock:
+        if _img_bytes is None:
+            _img_bytes = _scan_bytes()
+        return _img_bytes
+
+
 def fetch_image(url: str, ttl: float = IMG_TTL) -> bytes | None:
     _IMG_DIR.mkdir(parents=True, exist_ok=True)
     key = _url_key(url)
     path = _data_path(key)
 
-    if _fresh(path, ttl):
-        try:
-            with open(path, "rb") as f:
-                return f.read()
-        except OSError:
-            pass
+    data = _read_fresh(path, ttl)
+    if data is not None:
+        return data
+    return _flight.do(key, lambda: _read_fresh(path, ttl) or _download(url, path))
 
+
+def _read_fresh(path: str, ttl: float) -> bytes | None:
+    if not _fresh(path, ttl):
+        return None
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    _touch(path)
+    return data
+
+
+def _download(url: str, path: str) -> bytes | None:
     try:
         resp = get_session().get(url, timeout=10)
         if resp.status_code != 200:
@@ -47,16 +143,13 @@ def fetch_image(url: str, ttl: float = IMG_TTL) -> bytes | None:
     except Exception:
         return None
 
-    try:
-        with open(path, "wb") as f:
-            f.write(data)
-    except OSError:
-        pass
-
+    _store(path, data)
     return data
 
 
 def clear_img_cache() -> int:
+    global _img_bytes
+    _img_bytes = None
     n = 0
     for f in _IMG_DIR.glob("*"):
         try:
@@ -68,6 +161,8 @@ def clear_img_cache() -> int:
 
 
 def evict_img_cache(max_age: float | None = None) -> int:
+    global _img_bytes
+    _img_bytes = None
     cutoff = time.time() - (max_age if max_age is not None else IMG_TTL)
     n = 0
     for f in _IMG_DIR.glob("*.img"):
@@ -81,12 +176,7 @@ def evict_img_cache(max_age: float | None = None) -> int:
 
 
 def img_cache_size() -> str:
-    total = 0
-    for f in _IMG_DIR.glob("*.img"):
-        try:
-            total += f.stat().st_size
-        except OSError:
-            pass
+    total = img_cache_bytes()
     if total < 1024:
         return f"{total} B"
     if total < 1024 * 1024:
@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import abc
 import importlib.util
+import io
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # type: ignore[assignment]
 
 from tetodl.core.domain.env import env
 from tetodl.utils.console import console
@@ -20,6 +28,84 @@ class ThumbnailProcessor(abc.ABC):
         ...
 
 
+_PIL_FORMATS = {"jpg": "JPEG", "jpeg": "JPEG", "png": "PNG", "webp": "WEBP"}
+
+
+def render_image(data: bytes, crop: bool = False, target_format: str = "jpg") -> bytes | None:
+    """Centre-crop *data* to a square and/or re-encode it as *target_format*,
+    entirely in memory.
+
+    Returns ``None`` when Pillow is not installed or cannot handle the
+    image; callers then fall back to the file-based processor.
+    """
+    fmt = _PIL_FORMATS.get(target_format.lower())
+    if Image is None or fmt is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if not crop and img.format == fmt:
+                return data
+            out_img: Image.Image = img
+            if crop:
+                w, h = img.size
+                size = min(w, h)
+                left, top = (w - size) // 2, (h - size) // 2
+                out_img = img.crop((left, top, left + size, top + size))
+            if fmt == "JPEG" and out_img.mode not in ("RGB", "L"):
+                out_img = out_img.convert("RGB")
+            buf = io.BytesIO()
+            out_img.save(buf, fmt, quality=95)
+            return buf.getvalue()
+    except Exception:
+        return None
+
+
+class PillowThumbnailProcessor(ThumbnailProcessor):
+    """In-process processor: no subprocess and no temporary files.
+    Images Pillow cannot decode go to *fallback*."""
+
+    def __init__(self, fallback: ThumbnailProcessor) -> None:
+        self._fallback = fallback
+
+    @staticmethod
+    def _read(path: str) -> bytes | None:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def crop_to_square(self, thumbnail_path: str) -> bool:
+        data = self._read(thumbnail_path)
+        ext = os.path.splitext(thumbnail_path)[1].lstrip(".") or "jpg"
+        out = render_image(data, crop=True, target_format=ext) if data else None
+        if out is None:
+            return self._fallback.crop_to_square(thumbnail_path)
+        try:
+            with open(thumbnail_path, "wb") as f:
+                f.write(out)
+            return True
+        except OSError as e:
+            console.err(Keys.media.crop_error(error=str(e)))
+            return False
+
+    def convert_format(self, thumbnail_path: str, target_format: str = "jpg") -> str | None:
+        data = self._read(thumbnail_path)
+        out = render_image(data, target_format=target_format) if data else None
+        if out is None:
+            return self._fallback.convert_format(thumbnail_path, target_format)
+        ext = target_format.lower().replace('jpeg', 'jpg')
+        output_path = f"{os.path.splitext(thumbnail_path)[0]}.{ext}"
+        try:
+            with open(output_path, "wb") as f:
+                f.write(out)
+            if output_path != thumbnail_path:
+                os.remove(thumbnail_path)
+            return output_path
+        except OSError:
+            return None
+
+
 class FFmpegThumbnailProcessor(ThumbnailProcessor):
 
     def crop_to_square(self, thumbnail_path: str) -> bool:
@@ -89,10 +175,13 @@ class PyAVThumbnailProcessor(ThumbnailProcessor):
 
 
 def get_thumbnail_processor() -> ThumbnailProcessor:
+    fallback: ThumbnailProcessor = FFmpegThumbnailProcessor()
     if env.get('is_windows') and env.get('is_binary'):
         if importlib.util.find_spec("av") is not None:
-            return PyAVThumbnailProcessor()
-    return FFmpegThumbnailProcessor()
+            fallback = PyAVThumbnailProcessor()
+    if Image is not None:
+        return PillowThumbnailProcessor(fallback)
+    return fallback
 
 
 _processor = None
@@ -111,3 +200,19 @@ def crop_thumbnail_to_square(thumbnail_path: str) -> bool:
 
 def convert_thumbnail_format(thumbnail_path: str, target_format: str = "jpg") -> str | None:
     return _get_processor().convert_format(thumbnail_path, target_format)
+
+
+# Fetching and rendering the covers of a playlist is network- and
+# Pillow-bound (Pillow releases the GIL while coding), so batches run here.
+IMAGE_WORKERS = 4
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def image_executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image")
+        return _pool
@@ -15,11 +15,19 @@ class DeezerProvider(CoverProvider):
         artist = query.artist.strip()
         title = query.title.strip()
 
+        error: Exception | None = None
         for search_term in self._get_search_terms(artist, title):
-            result = self._search_deezer(search_term, artist, title)
+            try:
+                result = self._search_deezer(search_term, artist, title)
+            except Exception as e:
+                error = e
+                continue
             if result:
                 return result
 
+        # No match, but a term failed: that is not a definite miss.
+        if error is not None:
+            raise error
         return None
 
     def _get_search_terms(self, artist: str, title: str) -> list[str]:
@@ -44,15 +52,16 @@ class DeezerProvider(CoverProvider):
         return unique
 
     def _search_deezer(self, search_term: str, orig_artist: str, orig_title: str) -> CoverData | None:
-        try:
-            resp = get_session().get(
-                "https://api.deezer.com/search",
-                params={"q": search_term, "limit": "10", "output": "json"},
-                timeout=8,
-            )
-            data = resp.json()
-        except Exception:
-            return None
+        resp = get_session().get(
+            "https://api.deezer.com/search",
+            params={"q": search_term, "limit": "10", "output": "json"},
+            timeout=8,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        # Quota and other API errors come back as HTTP 200.
+        if data.get("error"):
+            raise RuntimeError(f"Deezer API error: {data['error']}")
 
         results = data.get("data") or []
         if not results:
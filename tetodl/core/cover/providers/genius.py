@@ -16,26 +16,32 @@ class GeniusCoverProvider(CoverProvider):
         artist = query.artist.strip()
         title = query.title.strip()
 
+        error: Exception | None = None
         for search_query in get_search_queries(artist, title):
-            result = self._search_genius_cover(search_query, artist, title)
+            try:
+                result = self._search_genius_cover(search_query, artist, title)
+            except Exception as e:
+                error = e
+                continue
             if result:
                 return result
 
+        # No match, but a query failed: that is not a definite miss.
+        if error is not None:
+            raise error
         return None
 
     def _search_genius_cover(
         self, search_query: str, orig_artist: str, orig_title: str,
     ) -> CoverData | None:
-        try:
-            resp = get_session().get(
-                "https://genius.com/api/search/multi",
-                params={"per_page": "5", "q": search_query},
-                headers=_GENIUS_HEADERS,
-                timeout=10,
-            )
-            data = resp.json()
-        except Exception:
-            return None
+        resp = get_session().get(
+            "https://genius.com/api/search/multi",
+            params={"per_page": "5", "q": search_query},
+            headers=_GENIUS_HEADERS,
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         hits = self._extract_song_hits(data)
         if not hits:
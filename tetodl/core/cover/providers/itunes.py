@@ -10,11 +10,7 @@ class ITunesProvider(CoverProvider):
         if not query.artist and not query.title:
             return None
 
-        try:
-            result = itunes_search(query.artist, query.title)
-        except Exception:
-            return None
-
+        result = itunes_search(query.artist, query.title)
         if not result or not result.get("url"):
             return None
 
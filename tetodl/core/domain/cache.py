@@ -1,5 +1,9 @@
 """
-Multi-layer cache system: in-memory LRU + disk file-per-key with TTL.
+Multi-layer cache system: in-memory LRU + packed disk store with TTL.
+
+Each namespace persists to a single SQLite file by default; the legacy
+file-per-key JSON layout is still available per namespace via the
+``backend`` setting in ``_CACHE_CFG``.
 """
 
 import atexit
@@ -7,9 +11,13 @@ import gc
 import hashlib
 import json
 import shutil
+import sqlite3
 import threading
 import time
+import zlib
 from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -17,6 +25,7 @@ from typing import Any
 from ...core.domain.env import env
 from ...utils.console import console
 from ...utils.i18n_keys import Keys
+from ...utils.processing import extract_video_id
 
 CACHE_DIR = env.get('cache_dir')
 
@@ -27,6 +36,21 @@ class CacheStats:
     mem_entries: int = 0
     disk_entries: int = 0
     disk_bytes: int = 0
+    budget_bytes: int = 0
+
+
+class _Miss:
+    """Negative-cache sentinel: the lookup was done and found nothing."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISS"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISS = _Miss()
 
 
 class _MemEntry:
@@ -39,16 +63,92 @@ class _MemEntry:
 
 # ── per-namespace configuration ─────────────────────────────────────────
 
+# ``miss_ttl`` bounds how long a negative (MISS) entry is trusted.
+# ``weight`` is the namespace's share of CACHE_BUDGET; ``policy`` picks
+# which entries go first once that share is exceeded (``lru`` / ``lfu``).
 _CACHE_CFG: dict[str, dict[str, Any]] = {
-    "yt_metadata": {"default_ttl": 604800, "max_mem": 256},
-    "yt_match":    {"default_ttl": 2592000, "max_mem": 128},
-    "lyrics":      {"default_ttl": 2592000, "max_mem": 64},
-    "cover":       {"default_ttl": 604800, "max_mem": 64},
+    "yt_metadata": {"default_ttl": 604800, "max_mem": 256, "backend": "sqlite", "miss_ttl": 3600,
+                    "weight": 2, "policy": "lru"},
+    "yt_match":    {"default_ttl": 2592000, "max_mem": 128, "backend": "sqlite", "miss_ttl": 86400,
+                    "weight": 1, "policy": "lfu"},
+    "lyrics":      {"default_ttl": 2592000, "max_mem": 64, "backend": "sqlite", "miss_ttl": 259200,
+                    "weight": 1, "policy": "lfu"},
+    "cover":       {"default_ttl": 604800, "max_mem": 64, "backend": "sqlite", "miss_ttl": 86400,
+                    "weight": 1, "policy": "lru"},
+    "concurrency": {"default_ttl": 604800, "max_mem": 16, "backend": "sqlite", "miss_ttl": 3600,
+                    "weight": 1, "policy": "lru"},
+    "spotify":     {"default_ttl": 900, "max_mem": 32, "backend": "sqlite", "miss_ttl": 300,
+                    "weight": 1, "policy": "lru"},
 }
 
+# ── disk budget ─────────────────────────────────────────────────────────
+
+CACHE_BUDGET = 512 * 1024 * 1024   # bytes shared by all namespaces + images
+IMG_WEIGHT = 11                    # cover art dominates the footprint
+BUDGET_LOW_WATER = 0.9             # evict down to this fraction of a share
+
+
+def set_cache_budget(nbytes: int) -> None:
+    """Set the global disk-cache budget in bytes."""
+    global CACHE_BUDGET
+    CACHE_BUDGET = max(0, int(nbytes))
+
+
+def namespace_budget(namespace: str) -> int:
+    """Bytes of CACHE_BUDGET allotted to ``namespace`` (``"images"`` included)."""
+    total = IMG_WEIGHT + sum(cfg.get("weight", 1) for cfg in _CACHE_CFG.values())
+    if namespace == "images":
+        weight = IMG_WEIGHT
+    else:
+        weight = _CACHE_CFG.get(namespace, {}).get("weight", 1)
+    return CACHE_BUDGET * weight // total
+
+
 _caches: dict[str, "Cache"] = {}
 _caches_lock = threading.Lock()
 
+# ── write-behind settings ───────────────────────────────────────────────
+
+FLUSH_INTERVAL = 30.0   # seconds between background flushes
+FLUSH_THRESHOLD = 64    # dirty keys that wake the flusher early
+FLUSH_BATCH = 256       # entries written per disk transaction
+MAX_DIRTY = 4096        # beyond this, set() flushes inline (backpressure)
+
+
+# ── single-flight ───────────────────────────────────────────────────────
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller runs ``fn``; callers arriving while it is in flight
+    block on its future and receive the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            inflight = self._calls.get(key)
+            if inflight is None:
+                fut: Future = Future()
+                self._calls[key] = fut
+        if inflight is not None:
+            return inflight.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
 
 # ── memory layer (LRU + TTL) ────────────────────────────────────────────
 
@@ -70,16 +170,18 @@ class _MemoryCache:
             self._data.move_to_end(key)
             return entry.value
 
-    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+    def set(self, key: str, value: Any, ttl: float | None = None) -> _MemEntry:
+        entry = _MemEntry(
+            value=value,
+            created=time.time(),
+            ttl=ttl if ttl is not None else self._default_ttl,
+        )
         with self._lock:
             if len(self._data) >= self._maxsize:
                 self._data.popitem(last=False)
-            self._data[key] = _MemEntry(
-                value=value,
-                created=time.time(),
-                ttl=ttl if ttl is not None else self._default_ttl,
-            )
+            self._data[key] = entry
             self._data.move_to_end(key)
+        return entry
 
     def __len__(self) -> int:
         with self._lock:
@@ -90,10 +192,242 @@ class _MemoryCache:
             self._data.clear()
 
 
-# ── disk layer (file-per-key, atomic write, TTL) ────────────────────────
+# ── disk layer: packed SQLite backend (default) ─────────────────────────
+
+_PACKED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key      TEXT PRIMARY KEY,
+    value    BLOB NOT NULL,
+    created  REAL NOT NULL,
+    expires  REAL NOT NULL,
+    size     INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    hits     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries (expires);
+CREATE INDEX IF NOT EXISTS idx_entries_created ON entries (created);
+CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (accessed);
+CREATE INDEX IF NOT EXISTS idx_entries_lfu ON entries (hits, accessed);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id      INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes   INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_ins AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + new.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_entries_del AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - old.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_entries_upd AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET bytes = bytes - old.size + new.size WHERE id = 0;
+END;
+"""
+
+# Leading byte of every stored value; blobs written in any other format
+# fail to decode and are dropped as a miss.
+_VALUE_FORMAT = b"\x01"
+# Values at or above this many JSON bytes are zlib-compressed.
+_COMPRESS_MIN = 512
+
+
+def _encode_value(value: Any) -> bytes:
+    if value is MISS:
+        return _VALUE_FORMAT + b"N"
+    raw = json.dumps(value, separators=(",", ":")).encode()
+    if len(raw) >= _COMPRESS_MIN:
+        return _VALUE_FORMAT + b"Z" + zlib.compress(raw)
+    return _VALUE_FORMAT + b"J" + raw
+
+
+def _decode_value(blob: bytes) -> Any:
+    fmt, tag, body = blob[:1], blob[1:2], blob[2:]
+    if fmt != _VALUE_FORMAT:
+        raise ValueError(f"unknown cache value format {fmt!r}")
+    if tag == b"N":
+        return MISS
+    if tag == b"Z":
+        body = zlib.decompress(body)
+    elif tag != b"J":
+        raise ValueError(f"unknown cache value tag {tag!r}")
+    return json.loads(body)
+
 
 class _DiskCache:
-    def __init__(self, namespace: str, default_ttl: float) -> None:
+    """One SQLite file per namespace; expiry lives in an indexed column.
+
+    Eviction is a range delete on ``expires``/``created`` and ``stats``
+    reads trigger-maintained totals instead of walking the store.  Reads
+    are buffered as touches and written with the next batch; once the
+    namespace exceeds its byte budget, each write evicts the least
+    recently (``lru``) or least frequently (``lfu``) used entries.
+    """
+
+    _MAX_TOUCHES = 256
+
+    def __init__(self, namespace: str, default_ttl: float, policy: str = "lru") -> None:
+        self._namespace = namespace
+        self._base = Path(CACHE_DIR) / "cache" / namespace
+        self._default_ttl = default_ttl
+        self._order = "hits, accessed" if policy == "lfu" else "accessed"
+        self._touched: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self._base.mkdir(parents=True, exist_ok=True)
+        self._drop_legacy_files()
+        self._conn = self._connect(self._base / "packed.db")
+
+    # ─ helpers ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def _connect(db_path: Path) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(str(db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_PACKED_SCHEMA)
+        except sqlite3.Error:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.executescript(_PACKED_SCHEMA)
+        return conn
+
+    def _drop_legacy_files(self) -> None:
+        # md5-named files cannot be mapped back to their keys; they are only cache.
+        for path in self._base.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _row(self, key: str, value: Any, ttl: float | None, now: float) -> tuple:
+        blob = _encode_value(value)
+        ttl = ttl if ttl is not None else self._default_ttl
+        return (key, blob, now, now + ttl, len(blob), now)
+
+    def _apply_touches(self) -> None:
+        touched, self._touched = self._touched, {}
+        if touched:
+            self._conn.executemany(
+                "UPDATE entries SET accessed = ?, hits = hits + ? WHERE key = ?",
+                [(at, n, key) for key, (at, n) in touched.items()],
+            )
+
+    def _enforce_budget(self, protect: set[str]) -> int:
+        budget = namespace_budget(self._namespace)
+        (used,) = self._conn.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()
+        if used <= budget:
+            return 0
+        excess = used - int(budget * BUDGET_LOW_WATER)
+        victims = []
+        for key, size in self._conn.execute(
+            f"SELECT key, size FROM entries ORDER BY {self._order}"
+        ):
+            if key in protect:
+                continue
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        return len(victims)
+
+    # ─ public api ───────────────────────────────────────────────────
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM entries WHERE key = ?", (key,)
+            ).fetchone() is not None
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now >= row[1]:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._touched[key] = (now, self._touched.get(key, (0, 0))[1] + 1)
+            if len(self._touched) >= self._MAX_TOUCHES:
+                with self._conn:
+                    self._apply_touches()
+        try:
+            return _decode_value(row[0])
+        except (ValueError, EOFError, TypeError, zlib.error):
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.set_many([(key, value, ttl)])
+
+    def set_many(self, items: list[tuple[str, Any, float | None]]) -> None:
+        now = time.time()
+        rows = []
+        for key, value, ttl in items:
+            try:
+                rows.append(self._row(key, value, ttl, now))
+            except (TypeError, ValueError):
+                continue
+        with self._lock, self._conn:
+            self._apply_touches()
+            self._conn.executemany(
+                "INSERT INTO entries (key, value, created, expires, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, created = excluded.created, "
+                "expires = excluded.expires, size = excluded.size, "
+                "accessed = excluded.accessed",
+                rows,
+            )
+            self._enforce_budget({row[0] for row in rows})
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def evict(self, max_age: float | None = None) -> int:
+        now = time.time()
+        with self._lock, self._conn:
+            if max_age is None:
+                cur = self._conn.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+            else:
+                cur = self._conn.execute(
+                    "DELETE FROM entries WHERE expires <= ? OR created < ?",
+                    (now, now - max_age),
+                )
+            return cur.rowcount
+
+    def clear(self) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM entries").rowcount
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT entries, bytes FROM totals WHERE id = 0"
+            ).fetchone()
+        return CacheStats(
+            disk_entries=entries, disk_bytes=total,
+            budget_bytes=namespace_budget(self._namespace),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._apply_touches()
+            except sqlite3.Error:
+                pass
+            self._conn.close()
+
+
+# ── disk layer: legacy file-per-key backend ─────────────────────────────
+
+class _FileDiskCache:
+    def __init__(self, namespace: str, default_ttl: float, policy: str = "lru") -> None:
         self._base = Path(CACHE_DIR) / "cache" / namespace
         self._default_ttl = default_ttl
         self._lock = threading.Lock()
@@ -141,18 +475,26 @@ class _DiskCache:
         if self._is_stale(entry):
             path.unlink(missing_ok=True)
             return None
+        if entry.get("m"):
+            return MISS
         return entry["v"]
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
         path = self._key_to_path(self._base, key)
         payload = {
-            "v": value,
+            "v": None if value is MISS else value,
             "c": time.time(),
             "t": ttl if ttl is not None else self._default_ttl,
         }
+        if value is MISS:
+            payload["m"] = 1
         with self._lock:
             self._write_atomic(path, payload)
 
+    def set_many(self, items: list[tuple[str, Any, float | None]]) -> None:
+        for key, value, ttl in items:
+            self.set(key, value, ttl)
+
     def delete(self, key: str) -> None:
         self._key_to_path(self._base, key).unlink(missing_ok=True)
 
@@ -191,15 +533,30 @@ class _DiskCache:
                 pass
         return CacheStats(disk_entries=entries, disk_bytes=total)
 
+    def close(self) -> None:
+        pass
+
+
+_DISK_BACKENDS: dict[str, type] = {
+    "sqlite": _DiskCache,
+    "files": _FileDiskCache,
+}
+
 
 # ── unified facade ──────────────────────────────────────────────────────
 
 class Cache:
     """Hybrid memory + disk cache with TTL.
 
-    Reads hit memory first (O(1)), fall back to disk (O(1) file read),
-    then warm memory for subsequent lookups.
-    Writes go to memory immediately and mark dirty for lazy disk flush.
+    Reads hit memory first (O(1)), fall back to disk (one indexed
+    lookup), then warm memory for subsequent lookups.
+    Writes go to memory immediately and mark dirty; the background
+    flusher persists them in batches (see :func:`start_flusher`).
+    Dirty entries are held until flushed, even once the memory LRU has
+    evicted them.
+
+    ``set_miss`` records a known miss under its own short TTL; ``get``
+    then returns :data:`MISS` (falsy, but not ``None``) for that key.
     """
 
     def __init__(
@@ -208,11 +565,18 @@ class Cache:
         namespace: str,
         max_mem: int = 128,
         default_ttl: float = 86400,
+        backend: str = "sqlite",
+        miss_ttl: float = 3600,
+        policy: str = "lru",
     ) -> None:
         self._namespace = namespace
-        self._disk = _DiskCache(namespace, default_ttl)
+        self._miss_ttl = miss_ttl
+        self._disk = _DISK_BACKENDS.get(backend, _DiskCache)(namespace, default_ttl, policy)
         self._mem = _MemoryCache(max_mem, default_ttl)
-        self._dirty: set[str] = set()
+        self._dirty: dict[str, _MemEntry] = {}
+        self._dirty_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flight = SingleFlight()
 
     # ─ public api ───────────────────────────────────────────────────
 
@@ -220,21 +584,87 @@ class Cache:
         val = self._mem.get(key)
         if val is not None:
             return val
+        with self._dirty_lock:
+            entry = self._dirty.get(key)
+        if entry is not None and (time.time() - entry.created) < entry.ttl:
+            return entry.value
         val = self._disk.get(key)
         if val is not None:
-            self._mem.set(key, val)
+            self._mem.set(key, val, self._miss_ttl if val is MISS else None)
         return val
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
-        self._mem.set(key, value, ttl)
-        self._dirty.add(key)
+        entry = self._mem.set(key, value, ttl)
+        with self._dirty_lock:
+            self._dirty[key] = entry
+            pending = len(self._dirty)
+        if pending >= MAX_DIRTY:
+            self.flush()
+        elif pending >= FLUSH_THRESHOLD:
+            _wake_flusher()
+
+    def get_or_load(
+        self, key: str, loader: Callable[[], Any], ttl: float | None = None,
+    ) -> Any:
+        """Return the cached value for ``key``, loading it once on a miss.
+
+        Concurrent callers for the same uncached key share a single
+        ``loader`` call.  A loader result of :data:`MISS` is stored as a
+        negative entry; ``None`` is returned without being cached.
+        """
+        val = self.get(key)
+        if val is not None:
+            return val
+
+        def _load() -> Any:
+            val = self.get(key)
+            if val is not None:
+                return val
+            val = loader()
+            if val is MISS:
+                self.set_miss(key)
+            elif val is not None:
+                self.set(key, val, ttl)
+            return val
+
+        return self._flight.do(key, _load)
+
+    def set_miss(self, key: str) -> None:
+        """Remember that ``key`` has no value, for this namespace's ``miss_ttl``."""
+        self.set(key, MISS, self._miss_ttl)
+
+    @property
+    def dirty_count(self) -> int:
+        with self._dirty_lock:
+            return len(self._dirty)
 
     def flush(self) -> None:
-        for key in list(self._dirty):
-            entry = self._mem._data.get(key)
-            if entry is not None:
-                self._disk.set(key, entry.value, entry.ttl)
-        self._dirty.clear()
+        with self._flush_lock:
+            with self._dirty_lock:
+                pending = list(self._dirty.items())
+            if not pending:
+                return
+
+            now = time.time()
+            items = []
+            for key, entry in pending:
+                remaining = entry.ttl - (now - entry.created)
+                if remaining > 0:
+                    items.append((key, entry.value, remaining))
+
+            done = 0
+            try:
+                for done in range(0, len(items), FLUSH_BATCH):
+                    self._disk.set_many(items[done:done + FLUSH_BATCH])
+                done = len(items)
+            finally:
+                # Drop what is now on disk or already expired, unless it was
+                # overwritten meanwhile; a failed batch stays dirty.
+                unwritten = {k for k, _, _ in items[done:]}
+                with self._dirty_lock:
+                    for key, entry in pending:
+                        if key not in unwritten and self._dirty.get(key) is entry:
+                            del self._dirty[key]
 
     def evict(self, max_age: float | None = None) -> int:
         self._mem.clear()
@@ -243,7 +673,8 @@ class Cache:
     def clear(self) -> None:
         self._mem.clear()
         self._disk.clear()
-        self._dirty.clear()
+        with self._dirty_lock:
+            self._dirty.clear()
 
     @property
     def stats(self) -> CacheStats:
@@ -266,6 +697,9 @@ def get_cache(namespace: str) -> Cache:
                 namespace=namespace,
                 max_mem=cfg.get("max_mem", 128),
                 default_ttl=cfg.get("default_ttl", 86400),
+                backend=cfg.get("backend", "sqlite"),
+                miss_ttl=cfg.get("miss_ttl", 3600),
+                policy=cfg.get("policy", "lru"),
             )
             _caches[namespace] = cache
     return cache
@@ -277,16 +711,26 @@ def get_url_hash(url: str) -> str:
     return hashlib.md5(url.encode()).hexdigest()
 
 
+def metadata_key(url: str) -> str:
+    """Canonical ``yt_metadata`` key: the video id when the URL has one.
+
+    ``youtu.be/ID``, ``watch?v=ID`` and ``music.youtube.com`` links all
+    resolve to the same entry; anything else is keyed by the raw URL.
+    """
+    return extract_video_id(url) or url
+
+
 def get_cached_metadata(url: str) -> dict | None:
     try:
-        return get_cache("yt_metadata").get(url)
+        val = get_cache("yt_metadata").get(metadata_key(url))
+        return None if val is MISS else val
     except Exception:
         return None
 
 
 def cache_metadata(url: str, metadata: dict, ttl: float | None = None) -> None:
     try:
-        get_cache("yt_metadata").set(url, metadata, ttl)
+        get_cache("yt_metadata").set(metadata_key(url), metadata, ttl)
     except Exception:
         pass
 
@@ -309,13 +753,31 @@ def get_cache_size() -> str:
     return f"{total / (1024 * 1024):.1f} MB"
 
 
+def cache_usage() -> dict[str, tuple[int, int]]:
+    """Return ``{namespace: (used_bytes, budget_bytes)}``, images included."""
+    from tetodl.core.cover.image import img_cache_bytes
+
+    usage = {}
+    for ns in _CACHE_CFG:
+        stats = get_cache(ns).stats
+        usage[ns] = (stats.disk_bytes, stats.budget_bytes)
+    usage["images"] = (img_cache_bytes(), namespace_budget("images"))
+    return usage
+
+
 def reset_cache() -> bool:
+    from tetodl.core.cover.image import clear_img_cache
+
     root = Path(CACHE_DIR) / "cache"
     try:
-        if root.is_dir():
-            shutil.rmtree(root)
+        clear_img_cache()
         with _caches_lock:
+            for cache in _caches.values():
+                with cache._flush_lock:
+                    cache._disk.close()
             _caches.clear()
+        if root.is_dir():
+            shutil.rmtree(root)
         gc.collect()
         return True
     except OSError:
@@ -329,21 +791,89 @@ def evict_cache(max_age: float | None = None) -> int:
         total += _caches[ns].evict(max_age)
     for ns in _CACHE_CFG:
         if ns not in _caches:
-            c = _DiskCache(ns, _CACHE_CFG[ns].get("default_ttl", 86400))
+            cfg = _CACHE_CFG[ns]
+            backend = _DISK_BACKENDS.get(cfg.get("backend", "sqlite"), _DiskCache)
+            c = backend(ns, cfg.get("default_ttl", 86400), cfg.get("policy", "lru"))
             total += c.evict(max_age)
+            c.close()
     from tetodl.core.cover.image import evict_img_cache
     total += evict_img_cache(max_age)
     return total
 
 
-# ── flush on exit ───────────────────────────────────────────────────────
+# ── write-behind flusher ────────────────────────────────────────────────
+
+class _Flusher(threading.Thread):
+    def __init__(self, interval: float) -> None:
+        super().__init__(name="cache-flusher", daemon=True)
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            flush_all()
 
-def _flush_all() -> None:
-    for cache in _caches.values():
+    def wake(self) -> None:
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        self.join(timeout=5)
+
+
+_flusher: _Flusher | None = None
+_flusher_lock = threading.Lock()
+
+
+def start_flusher(interval: float | None = None, threshold: int | None = None) -> None:
+    """Start (or retune) the background write-behind flusher.
+
+    Dirty entries are persisted every ``interval`` seconds, or sooner once
+    a namespace holds ``threshold`` dirty keys.
+    """
+    global _flusher, FLUSH_THRESHOLD
+    if threshold is not None:
+        FLUSH_THRESHOLD = threshold
+    with _flusher_lock:
+        if _flusher is not None and _flusher.is_alive():
+            if interval is not None:
+                _flusher.interval = interval
+            return
+        _flusher = _Flusher(interval if interval is not None else FLUSH_INTERVAL)
+        _flusher.start()
+
+
+def stop_flusher() -> None:
+    """Stop the background flusher and persist whatever is still dirty."""
+    global _flusher
+    with _flusher_lock:
+        flusher, _flusher = _flusher, None
+    if flusher is not None:
+        flusher.stop()
+    flush_all()
+
+
+def _wake_flusher() -> None:
+    flusher = _flusher
+    if flusher is not None:
+        flusher.wake()
+
+
+def flush_all() -> None:
+    """Persist dirty entries of every open namespace.
+
+    Also serves as the flush-on-idle hook for long-running hosts such as
+    the daemon, which call it whenever their task queue drains.
+    """
+    for cache in list(_caches.values()):
         try:
             cache.flush()
         except Exception:
             pass
 
 
-atexit.register(_flush_all)
+atexit.register(stop_flusher)
@@ -61,10 +61,20 @@ progress_style: str = "minimal"
 media_scanner_enabled: bool = False
 jitter_min: float = JITTER[0]
 jitter_max: float = JITTER[1]
+request_burst: int = 2
 max_retries: int = 3
 async_workers: int = 3
+download_workers: int = 1
+enrich_workers: int = 2
+postprocess_workers: int = 2
+stage_queue_size: int = 4
+async_workers_max: int = 8
+match_workers: int = 4
 daemon_default_temp: bool = True
 daemon_cleanup_interval: int = 3600
+cache_budget_mb: int = 512
+cache_flush_interval: float = 30.0
+cache_flush_threshold: int = 64
 
 verified_dependencies: bool = False
 
@@ -111,9 +121,12 @@ def load_config():
     global max_video_resolution, video_container, video_codec, audio_quality
     global progress_style, header_style, skip_existing_files
     global verified_dependencies, max_retries
-    global jitter_min, jitter_max
+    global jitter_min, jitter_max, request_burst
     global media_scanner_enabled, daemon_default_temp
-    global daemon_cleanup_interval, language
+    global daemon_cleanup_interval, cache_budget_mb, language
+    global cache_flush_interval, cache_flush_threshold
+    global download_workers, enrich_workers, postprocess_workers, stage_queue_size
+    global async_workers_max, match_workers
 
     if not os.path.exists(CONFIG_PATH):
         with traced('no config.json, using defaults'):
@@ -140,10 +153,20 @@ def load_config():
         verified_dependencies = data.get("verified_dependencies", verified_dependencies)
         jitter_min = data.get("jitter_min", JITTER[0])
         jitter_max = data.get("jitter_max", JITTER[1])
+        request_burst = data.get("request_burst", 2)
         max_retries = data.get("max_retries", 3)
         media_scanner_enabled = data.get("media_scanner_enabled", False)
         daemon_default_temp = data.get("daemon_default_temp", True)
         daemon_cleanup_interval = data.get("daemon_cleanup_interval", 3600)
+        cache_budget_mb = data.get("cache_budget_mb", 512)
+        cache_flush_interval = data.get("cache_flush_interval", 30.0)
+        cache_flush_threshold = data.get("cache_flush_threshold", 64)
+        download_workers = data.get("download_workers", 1)
+        enrich_workers = data.get("enrich_workers", 2)
+        postprocess_workers = data.get("postprocess_workers", 2)
+        stage_queue_size = data.get("stage_queue_size", 4)
+        async_workers_max = data.get("async_workers_max", 8)
+        match_workers = data.get("match_workers", 4)
 
         saved_lang = data.get("language")
         if saved_lang:
@@ -213,8 +236,15 @@ def load_app_config() -> AppConfig:
         media_scanner_enabled=media_scanner_enabled,
         jitter_min=jitter_min,
         jitter_max=jitter_max,
+        request_burst=request_burst,
         max_retries=max_retries,
         async_workers=async_workers,
+        download_workers=download_workers,
+        enrich_workers=enrich_workers,
+        postprocess_workers=postprocess_workers,
+        stage_queue_size=stage_queue_size,
+        async_workers_max=async_workers_max,
+        match_workers=match_workers,
         daemon_default_temp=daemon_default_temp,
         daemon_cleanup_interval=daemon_cleanup_interval,
         verified_dependencies=verified_dependencies,
@@ -260,12 +290,22 @@ def save_config():
         "skip_existing_files": skip_existing_files,
         "jitter_min": jitter_min,
         "jitter_max": jitter_max,
+        "request_burst": request_burst,
         "max_retries": max_retries,
         "media_scanner_enabled": media_scanner_enabled,
         "verified_dependencies": verified_dependencies,
         "language": language,
         "daemon_default_temp": daemon_default_temp,
         "daemon_cleanup_interval": daemon_cleanup_interval,
+        "cache_budget_mb": cache_budget_mb,
+        "cache_flush_interval": cache_flush_interval,
+        "cache_flush_threshold": cache_flush_threshold,
+        "download_workers": download_workers,
+        "enrich_workers": enrich_workers,
+        "postprocess_workers": postprocess_workers,
+        "stage_queue_size": stage_queue_size,
+        "async_workers_max": async_workers_max,
+        "match_workers": match_workers,
     }
 
     try:
@@ -343,7 +383,8 @@ def initialize_config():
     """One-shot configuration initialisation: load, create directories, clean up.
 
     Performs the complete startup sequence:
-    1. Loads settings from disk via :func:`load_config`.
+    1. Loads settings from disk via :func:`load_config` and applies the
+       disk-cache byte budget (``cache_budget_mb``).
     2. Creates the music and video root directories if they do not exist.
     3. Removes any ``.nomedia`` files from those roots.
     4. Cleans up ghost (stale) subfolder entries via :func:`cleanup_ghost_subfolders`.
@@ -368,7 +409,9 @@ def initialize_config():
     :func:`reset_to_defaults` : Reinitialise with factory defaults.
     """
     from ...utils.files import remove_nomedia_file
+    from .cache import set_cache_budget
     load_config()
+    set_cache_budget(cache_budget_mb * 1024 * 1024)
 
     # Create root directories
     os.makedirs(music_root, exist_ok=True)
@@ -906,9 +949,10 @@ def reset_config():
 def wipe_registry():
     """Delete the registry database file.
 
-    Removes the file at :data:`~tetodl.constants.REGISTRY_PATH`.  The
-    registry tracks previously downloaded files to enable skip-existing
-    and re-download detection.
+    Removes the legacy JSON file at :data:`~tetodl.constants.REGISTRY_PATH`
+    together with the SQLite database (and its WAL/SHM side files) stored
+    next to it.  The registry tracks previously downloaded files to enable
+    skip-existing and re-download detection.
 
     Parameters
     ----------
@@ -917,8 +961,8 @@ def wipe_registry():
     Returns
     -------
     bool
-        ``True`` if the file was successfully deleted, ``False`` if it did
-        not exist or if an error occurred.
+        ``True`` if any registry file was successfully deleted, ``False``
+        if none existed or if an error occurred.
 
     Example
     -------
@@ -931,13 +975,16 @@ def wipe_registry():
     :class:`tetodl.core.registry.RegistryManager` : Registry logic.
     :data:`~tetodl.constants.REGISTRY_PATH` : Registry file location.
     """
-    try:
-        if os.path.exists(REGISTRY_PATH):
-            os.remove(REGISTRY_PATH)
-            return True
-    except Exception:
-        pass
-    return False
+    db_path = os.path.splitext(REGISTRY_PATH)[0] + ".db"
+    removed = False
+    for path in (REGISTRY_PATH, db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+                removed = True
+        except Exception:
+            pass
+    return removed
 
 def perform_full_wipe():
     """Perform a complete wipe of all persistent application data.
@@ -1,8 +1,15 @@
 """
 Download history tracking system
+
+History is stored as append-only JSON Lines logs, one file per month
+(``history/YYYY-MM.jsonl`` next to ``HISTORY_PATH``).  Adding an entry
+appends a single line; a re-download of the same ID appends a tombstone
+for the superseded record instead of rewriting the file.  Logs whose dead
+records outweigh the live ones are compacted in a background thread.
 """
 import json
 import os
+import threading
 from collections import Counter
 from datetime import datetime
 from typing import Any
@@ -16,39 +23,211 @@ from .registry import registry
 
 HISTORY_PATH = env.get('history_path')
 
+# Compact a log once it holds at least this many dead records
+# and they outnumber the live ones.
+COMPACT_MIN_DEAD = 256
+
 # Module-level history list
 _download_history: list = []
 
+# id -> (log file name, byte offset, entry) of the live record
+_index: dict[str, tuple[str, int, dict]] = {}
+_live: Counter = Counter()
+_dead: Counter = Counter()
+_lock = threading.RLock()
+_compactor: threading.Thread | None = None
 
-# --- LOAD, SAVE, RESET, ADD  ---
 
-def load_history():
-    """Load download history from file"""
+def history_log_dir() -> str:
+    """Return the directory holding the monthly history logs."""
+    return os.path.splitext(HISTORY_PATH)[0]
+
+
+def _log_name(timestamp: str | None = None) -> str:
+    month = (timestamp or "")[:7] or datetime.now().strftime("%Y-%m")
+    return f"{month}.jsonl"
+
+
+def _log_files() -> list[str]:
+    log_dir = history_log_dir()
+    if not os.path.isdir(log_dir):
+        return []
+    return sorted(f for f in os.listdir(log_dir) if f.endswith(".jsonl"))
+
+
+def _encode(record: dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _iter_log(name: str):
+    """Yield ``(offset, record)`` for every line of a log; torn lines yield ``None``."""
+    offset = 0
+    with open(os.path.join(history_log_dir(), name), "rb") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield offset, record
+            offset += len(line)
+
+
+def _remove_entry(entry: dict):
+    # Re-downloads are usually recent, so scan from the end.
+    for i in range(len(_download_history) - 1, -1, -1):
+        if _download_history[i] is entry:
+            del _download_history[i]
+            return
+
+
+def _clear_state():
     global _download_history
-    if not os.path.exists(HISTORY_PATH):
-        _download_history = []
+    _download_history = []
+    _index.clear()
+    _live.clear()
+    _dead.clear()
+
+
+def _import_legacy():
+    """Move a legacy ``history.json`` list into the monthly logs (one-time)."""
+    if not os.path.isfile(HISTORY_PATH):
         return
     try:
         with open(HISTORY_PATH, "r") as f:
-            _download_history = json.load(f)
+            legacy = json.load(f)
     except Exception:
-        _download_history = []
+        legacy = []
+
+    by_month: dict[str, list[bytes]] = {}
+    for entry in legacy if isinstance(legacy, list) else []:
+        by_month.setdefault(_log_name(entry.get('timestamp')), []).append(_encode(entry))
 
-def save_history():
-    """Save download history to file"""
     try:
-        with open(HISTORY_PATH, "w") as f:
-            json.dump(_download_history, f, indent=2)
-    except Exception as e:
+        os.makedirs(history_log_dir(), exist_ok=True)
+        for name, lines in by_month.items():
+            with open(os.path.join(history_log_dir(), name), "ab") as f:
+                f.write(b"".join(lines))
+        os.replace(HISTORY_PATH, HISTORY_PATH + ".migrated")
+    except OSError as e:
         console.err(Keys.core.failed_save_history(error=e))
 
+
+# --- LOAD, SAVE, RESET, ADD  ---
+
+def load_history():
+    """Load download history from the monthly logs"""
+    global _download_history
+    with _lock:
+        _import_legacy()
+        _clear_state()
+
+        live: dict[tuple[str, int], dict] = {}
+        for name in _log_files():
+            try:
+                records = list(_iter_log(name))
+            except OSError:
+                continue
+            for offset, record in records:
+                if not isinstance(record, dict):
+                    _dead[name] += 1
+                    continue
+                if '_del' in record:
+                    _dead[name] += 1
+                    continue
+
+                vid = record.get('id')
+                if vid and vid in _index:
+                    old_name, old_offset, _ = _index.pop(vid)
+                    live.pop((old_name, old_offset), None)
+                    _live[old_name] -= 1
+                    _dead[old_name] += 1
+                live[(name, offset)] = record
+                _live[name] += 1
+                if vid:
+                    _index[vid] = (name, offset, record)
+
+        _download_history = list(live.values())
+    _maybe_compact()
+
+
+def save_history():
+    """Rewrite the history logs from the in-memory list (full checkpoint)"""
+    with _lock:
+        by_month: dict[str, list[dict]] = {}
+        for entry in _download_history:
+            by_month.setdefault(_log_name(entry.get('timestamp')), []).append(entry)
+
+        try:
+            os.makedirs(history_log_dir(), exist_ok=True)
+            for name in _log_files():
+                if name not in by_month:
+                    os.remove(os.path.join(history_log_dir(), name))
+            _index.clear()
+            _live.clear()
+            _dead.clear()
+            for name, entries in by_month.items():
+                _rewrite_log(name, entries)
+        except Exception as e:
+            console.err(Keys.core.failed_save_history(error=e))
+
+
+def _rewrite_log(name: str, entries: list[dict]):
+    """Atomically replace one log with ``entries`` and re-index it."""
+    path = os.path.join(history_log_dir(), name)
+    tmp_path = path + ".tmp"
+    offset = 0
+    with open(tmp_path, "wb") as f:
+        for entry in entries:
+            data = _encode(entry)
+            f.write(data)
+            if entry.get('id'):
+                _index[entry['id']] = (name, offset, entry)
+            offset += len(data)
+    os.replace(tmp_path, path)
+    _live[name] = len(entries)
+    _dead.pop(name, None)
+
+
+def compact_history():
+    """Drop tombstones and superseded records from every log that has any"""
+    with _lock:
+        for name in [n for n, count in _dead.items() if count > 0]:
+            try:
+                kept = [
+                    record for offset, record in _iter_log(name)
+                    if isinstance(record, dict) and '_del' not in record
+                    and (not record.get('id') or _index.get(record['id'], ("", -1))[:2] == (name, offset))
+                ]
+                # Re-point the index at the in-memory entries, not the re-parsed copies.
+                kept = [_index[r['id']][2] if r.get('id') else r for r in kept]
+                _rewrite_log(name, kept)
+            except OSError:
+                continue
+
+
+def _maybe_compact():
+    global _compactor
+    with _lock:
+        if _compactor is not None and _compactor.is_alive():
+            return
+        if not any(
+            dead >= COMPACT_MIN_DEAD and dead > _live[name]
+            for name, dead in _dead.items()
+        ):
+            return
+        _compactor = threading.Thread(target=compact_history, name="history-compact", daemon=True)
+        _compactor.start()
+
+
 def reset_history():
     """Clear all download history"""
-    global _download_history
     try:
-        if os.path.exists(HISTORY_PATH):
-            os.remove(HISTORY_PATH)
-        _download_history = []
+        with _lock:
+            for name in _log_files():
+                os.remove(os.path.join(history_log_dir(), name))
+            if os.path.exists(HISTORY_PATH):
+                os.remove(HISTORY_PATH)
+            _clear_state()
         return True
     except Exception as e:
         console.err(Keys.core.failed_delete_history(error=e))
@@ -60,8 +239,6 @@ def add_to_history(
         download_type, duration, metadata=None, spotify_id=None
     ):
     """Add entry to download history"""
-    global _download_history
-
     entry = {
         'id': id,
         'file_path': file_path,
@@ -75,14 +252,32 @@ def add_to_history(
         'date_display': datetime.now().strftime("%d %b %y, %H.%M")
     }
 
-    if id:
-        _download_history = [
-            x for x in _download_history 
-            if x.get('id') != id
-        ]
+    name = _log_name(entry['timestamp'])
+    with _lock:
+        old = _index.get(id) if id else None
+        line = _encode(entry)
+        # The tombstone and its replacement land in a single write.
+        tombstone = _encode({'_del': id, '_at': [old[0], old[1]]}) if old is not None else b""
+
+        try:
+            os.makedirs(history_log_dir(), exist_ok=True)
+            with open(os.path.join(history_log_dir(), name), "ab") as f:
+                offset = f.seek(0, os.SEEK_END) + len(tombstone)
+                f.write(tombstone + line)
+        except Exception as e:
+            console.err(Keys.core.failed_save_history(error=e))
+            offset = -1
 
-    _download_history.append(entry)
-    save_history()
+        if old is not None:
+            _remove_entry(old[2])
+            _live[old[0]] -= 1
+            _dead[old[0]] += 1
+            _dead[name] += 1
+        _download_history.append(entry)
+        _live[name] += 1
+        if id:
+            _index[id] = (name, offset, entry)
+    _maybe_compact()
 
     if success and id and file_path:
         if metadata is None:
@@ -0,0 +1,261 @@
+# core/journal.py
+"""
+Playlist job journal backed by SQLite (WAL mode).
+
+One job per (source URL, target dir) records every playlist item as it
+moves through the staged executor: ``pending`` → ``downloaded`` →
+``enriched`` → ``done`` (or ``failed``), along with the resolved URL and
+whatever is needed to pick the item up again at the stage it reached.
+A rerun of an interrupted playlist reads the journal instead of
+re-expanding the listing and only redoes the unfinished stages.
+
+A job is dropped once a run consumed its whole listing and every item
+is ``done`` or ``failed``; the next run re-expands the listing, which
+retries failed items and picks up new ones.  Jobs untouched for
+:data:`JOB_TTL` are not resumed either.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from ...core.domain.env import env
+
+JOURNAL_PATH = os.path.join(os.path.dirname(env.get('registry_path') or ""), "jobs.db")
+
+PENDING = "pending"
+DOWNLOADED = "downloaded"
+ENRICHED = "enriched"
+DONE = "done"
+FAILED = "failed"
+
+# States an item can still make progress from.
+IN_PROGRESS = (PENDING, DOWNLOADED, ENRICHED)
+
+JOB_TTL = 7 * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    source     TEXT NOT NULL,
+    target_dir TEXT NOT NULL,
+    selection  TEXT NOT NULL DEFAULT '',
+    title      TEXT NOT NULL DEFAULT '',
+    listed     INTEGER NOT NULL DEFAULT 0,
+    updated    REAL NOT NULL,
+    PRIMARY KEY (source, target_dir)
+);
+
+CREATE TABLE IF NOT EXISTS items (
+    source     TEXT NOT NULL,
+    target_dir TEXT NOT NULL,
+    idx        INTEGER NOT NULL,
+    url        TEXT NOT NULL,
+    state      TEXT NOT NULL,
+    data       TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (source, target_dir, idx)
+);
+"""
+
+
+class Job:
+    """Journal handle for one playlist run.
+
+    ``items`` maps the 1-based playlist index to
+    ``{"url", "state", "data"}`` as loaded when the job was opened, and is
+    kept in step with :meth:`mark`.
+    """
+
+    def __init__(self, journal: "JobJournal", source: str, target_dir: str,
+                 title: str, listed: bool, items: dict[int, dict]):
+        self._journal = journal
+        self.source = source
+        self.target_dir = target_dir
+        self.title = title
+        self.listed = listed
+        self.items = items
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.source, self.target_dir
+
+    def entries(self) -> list[tuple[int, str]]:
+        """Journalled ``(index, url)`` pairs in playlist order."""
+        return [(i, self.items[i]["url"]) for i in sorted(self.items)]
+
+    def unfinished(self) -> int:
+        return sum(1 for item in self.items.values() if item["state"] != DONE)
+
+    def pending(self) -> int:
+        """Items an interrupted run left at a resumable stage."""
+        return sum(1 for item in self.items.values() if item["state"] in IN_PROGRESS)
+
+    def mark(self, index: int, url: str, state: str, **data) -> None:
+        """Record *state* for item *index*; *data* is merged into what the
+        item already carries."""
+        item = self.items.get(index)
+        merged = dict(item["data"]) if item else {}
+        merged.update(data)
+        self.items[index] = {"url": url, "state": state, "data": merged}
+        self._journal._write_item(self, index, url, state, merged)
+
+    def record_listing(self, entries: list[tuple[int, str, dict]]) -> None:
+        """Journal a complete listing of ``(index, url, data)`` up front."""
+        for index, url, data in entries:
+            self.items[index] = {"url": url, "state": PENDING, "data": dict(data)}
+        self._journal._write_items(self, entries)
+        self.mark_listed()
+
+    def mark_listed(self) -> None:
+        """Record that the whole listing has been journalled."""
+        self.listed = True
+        self._journal._touch(self, listed=True)
+
+    def close(self) -> bool:
+        """Drop the job if nothing is left to resume; return True if dropped.
+
+        Called when a run finishes, so ``failed`` items count as final.
+        """
+        if not self.listed or self.pending():
+            return False
+        self._journal.discard(self.source, self.target_dir)
+        return True
+
+
+class JobJournal:
+    def __init__(self, db_path: str | None = None):
+        self.db_path = db_path or JOURNAL_PATH
+        self._lock = threading.RLock()
+        self._conn = self._connect(self.db_path)
+
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def find(self, source: str, target_dir: str, selection: str = "") -> Job | None:
+        """Return the journalled job for *source* into *target_dir*, or None.
+
+        A job recorded for a different ``--items`` *selection*, or not
+        updated for :data:`JOB_TTL`, is not resumable and is ignored.
+        """
+        target_dir = os.path.abspath(target_dir)
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT selection, title, listed, updated FROM jobs "
+                    "WHERE source = ? AND target_dir = ?",
+                    (source, target_dir),
+                ).fetchone()
+                if row is None or row[0] != selection or time.time() - row[3] > JOB_TTL:
+                    return None
+                rows = self._conn.execute(
+                    "SELECT idx, url, state, data FROM items WHERE source = ? AND target_dir = ?",
+                    (source, target_dir),
+                ).fetchall()
+            except sqlite3.Error:
+                return None
+        items = {}
+        for idx, url, state, data in rows:
+            try:
+                decoded = json.loads(data)
+            except ValueError:
+                decoded = {}
+            items[idx] = {"url": url, "state": state, "data": decoded}
+        return Job(self, source, target_dir, row[1], bool(row[2]), items)
+
+    def open(self, source: str, target_dir: str, selection: str = "", title: str = "") -> Job:
+        """Resume the job for *source* into *target_dir*, or start a new one."""
+        job = self.find(source, target_dir, selection)
+        if job is not None:
+            if title and title != job.title:
+                job.title = title
+                self._touch(job)
+            return job
+
+        target_dir = os.path.abspath(target_dir)
+        self.discard(source, target_dir)
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT INTO jobs (source, target_dir, selection, title, listed, updated) "
+                        "VALUES (?, ?, ?, ?, 0, ?)",
+                        (source, target_dir, selection, title, time.time()),
+                    )
+            except sqlite3.Error:
+                pass
+        return Job(self, source, target_dir, title, False, {})
+
+    def discard(self, source: str, target_dir: str) -> None:
+        target_dir = os.path.abspath(target_dir)
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM items WHERE source = ? AND target_dir = ?", (source, target_dir),
+                    )
+                    self._conn.execute(
+                        "DELETE FROM jobs WHERE source = ? AND target_dir = ?", (source, target_dir),
+                    )
+            except sqlite3.Error:
+                pass
+
+    def _write_item(self, job: Job, index: int, url: str, state: str, data: dict) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO items (source, target_dir, idx, url, state, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (*job.key, index, url, state, json.dumps(data, default=str)),
+                    )
+                    self._conn.execute(
+                        "UPDATE jobs SET updated = ? WHERE source = ? AND target_dir = ?",
+                        (time.time(), *job.key),
+                    )
+            except sqlite3.Error:
+                pass
+
+    def _write_items(self, job: Job, entries: list[tuple[int, str, dict]]) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO items (source, target_dir, idx, url, state, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [(*job.key, index, url, PENDING, json.dumps(data, default=str))
+                         for index, url, data in entries],
+                    )
+            except sqlite3.Error:
+                pass
+
+    def _touch(self, job: Job, listed: bool = False) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE jobs SET title = ?, listed = MAX(listed, ?), updated = ? "
+                        "WHERE source = ? AND target_dir = ?",
+                        (job.title, int(listed), time.time(), *job.key),
+                    )
+            except sqlite3.Error:
+                pass
+
+    def reset(self) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM items")
+                    self._conn.execute("DELETE FROM jobs")
+            except sqlite3.Error:
+                pass
+
+
+journal = JobJournal()
@@ -225,12 +225,33 @@ class SystemConfig(BaseModel):
         Minimum jitter seconds between downloads (default ``3.0``).
     jitter_max : float, optional
         Maximum jitter seconds between downloads (default ``5.0``).
+    request_burst : int, optional
+        YouTube requests allowed back to back before jitter pacing
+        applies (default ``2``).
     max_retries : int, optional
         Maximum number of retries on download failure
         (default ``3``).
     async_workers : int, optional
-        Number of concurrent asynchronous workers
+        Number of concurrent asynchronous workers to start with
         (default ``3``).
+    async_workers_max : int, optional
+        Ceiling the adaptive controller may raise async workers to
+        (default ``8``).
+    match_workers : int, optional
+        Spotify tracks searched on YouTube Music at once
+        (default ``4``).
+    download_workers : int, optional
+        Playlist items extracted and downloaded at once in sequential
+        mode (default ``1``).
+    enrich_workers : int, optional
+        Playlist items resolving cover / metadata providers at once
+        (default ``2``).
+    postprocess_workers : int, optional
+        Playlist items being tagged and finalised at once
+        (default ``2``).
+    stage_queue_size : int, optional
+        Items buffered between playlist stages before the upstream
+        stage waits (default ``4``).
 
     Example
     -------
@@ -246,8 +267,15 @@ class SystemConfig(BaseModel):
     media_scanner_enabled: bool = False
     jitter_min: float = 3.0
     jitter_max: float = 5.0
+    request_burst: int = 2
     max_retries: int = 3
     async_workers: int = 3
+    async_workers_max: int = 8
+    match_workers: int = 4
+    download_workers: int = 1
+    enrich_workers: int = 2
+    postprocess_workers: int = 2
+    stage_queue_size: int = 4
 
 
 class DaemonConfig(BaseModel):
@@ -349,10 +377,26 @@ class AppConfig(BaseModel):
         Minimum jitter seconds between downloads (default ``3.0``).
     jitter_max : float, optional
         Maximum jitter seconds between downloads (default ``5.0``).
+    request_burst : int, optional
+        YouTube requests allowed back to back before pacing applies
+        (default ``2``).
     max_retries : int, optional
         Maximum retry attempts on download failure (default ``3``).
     async_workers : int, optional
         Number of concurrent async workers (default ``3``).
+    async_workers_max : int, optional
+        Upper bound for adaptive async concurrency (default ``8``).
+    match_workers : int, optional
+        Spotify tracks matched on YouTube Music at once (default ``4``).
+    download_workers : int, optional
+        Playlist items downloaded at once in sequential mode
+        (default ``1``).
+    enrich_workers : int, optional
+        Playlist items resolving enrichment at once (default ``2``).
+    postprocess_workers : int, optional
+        Playlist items tagged and finalised at once (default ``2``).
+    stage_queue_size : int, optional
+        Items buffered between playlist stages (default ``4``).
     daemon_default_temp : bool, optional
         Use the system temporary directory for daemon staging
         (default ``True``).
@@ -448,10 +492,24 @@ class AppConfig(BaseModel):
     """Minimum jitter seconds between downloads."""
     jitter_max: float = 5.0
     """Maximum jitter seconds between downloads."""
+    request_burst: int = 2
+    """YouTube requests allowed back to back before pacing applies."""
     max_retries: int = 3
     """Maximum retry attempts on download failure."""
     async_workers: int = 3
     """Number of concurrent async workers."""
+    async_workers_max: int = 8
+    """Upper bound for adaptive async concurrency."""
+    match_workers: int = 4
+    """Spotify tracks matched on YouTube Music at once."""
+    download_workers: int = 1
+    """Playlist items extracted and downloaded at once (sequential mode)."""
+    enrich_workers: int = 2
+    """Playlist items resolving cover / metadata providers at once."""
+    postprocess_workers: int = 2
+    """Playlist items being tagged and finalised at once."""
+    stage_queue_size: int = 4
+    """Items buffered between playlist stages before upstream waits."""
 
     # Daemon
     daemon_default_temp: bool = True
@@ -628,8 +686,15 @@ class AppConfig(BaseModel):
             media_scanner_enabled=self.media_scanner_enabled,
             jitter_min=self.jitter_min,
             jitter_max=self.jitter_max,
+            request_burst=self.request_burst,
             max_retries=self.max_retries,
             async_workers=self.async_workers,
+            async_workers_max=self.async_workers_max,
+            match_workers=self.match_workers,
+            download_workers=self.download_workers,
+            enrich_workers=self.enrich_workers,
+            postprocess_workers=self.postprocess_workers,
+            stage_queue_size=self.stage_queue_size,
         )
 
     @property
@@ -1364,13 +1429,30 @@ class PipelineContext:
     metadata_mode: bool = False
     lyrics_mode: bool = False
 
+    # Journalled playlist items keep .part files so a rerun resumes them
+    keep_partial: bool = False
+
+    # Staged playlists: 1-based playlist position, and the journal state
+    # the item was resumed from (None when it starts over)
+    playlist_index: int | None = None
+    resumed_state: str | None = None
+
+    # Concurrent playlists: DiskBudget the download reserves its estimated
+    # size against, and a callback(nbytes) fired once the bytes are on disk
+    # and only merging / re-encoding is left
+    disk_budget: Any = None
+    transfer_done: Any = None
+
     # Populated by steps
     media_info: MediaInfo | None = None
+    raw_info: Any = None  # yt-dlp info dict kept so DownloadStep skips re-extraction
     classification: Classification | None = None
     downloaded_file: DownloadedFile | None = None
     cover_result: CoverResult | None = None
     enrichment_data: Any = None  # CoverData from ResolveEnrichmentStep
+    enrichment_future: Any = None  # Future[CoverData | None] from start_enrichment
     lyrics_embedded: bool = False
+    tag_transaction: Any = None  # TagTransaction committed by FinalizeStep
     error: str | None = None
 
 
@@ -1,151 +1,435 @@
 # core/registry.py
+"""
+Download registry backed by SQLite (WAL mode).
+
+Every registration is a single indexed upsert instead of a full rewrite
+of ``registry.json``.  A legacy ``registry.json`` found next to the
+database is imported once and renamed to ``registry.json.migrated``.
+"""
 import json
 import os
+import sqlite3
+import threading
 
 from tetodl.utils.tracer import trace
 
 from ...core.domain.env import env
 
 REGISTRY_PATH = env.get('registry_path')
+# Host parameters per ``IN (...)`` lookup, under SQLite's default limit.
+_IN_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    video_id   TEXT NOT NULL,
+    c_type     TEXT NOT NULL,
+    title      TEXT,
+    artist     TEXT,
+    album      TEXT,
+    count      INTEGER NOT NULL DEFAULT 0,
+    spotify_id TEXT,
+    PRIMARY KEY (video_id, c_type)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_spotify ON entries (spotify_id);
+
+CREATE TABLE IF NOT EXISTS paths (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_id TEXT NOT NULL,
+    c_type   TEXT NOT NULL,
+    path     TEXT NOT NULL,
+    dir      TEXT NOT NULL,
+    UNIQUE (video_id, c_type, path)
+);
+CREATE INDEX IF NOT EXISTS idx_paths_dir ON paths (dir);
+CREATE INDEX IF NOT EXISTS idx_paths_path ON paths (path);
+
+CREATE TABLE IF NOT EXISTS spotify (
+    spotify_id TEXT PRIMARY KEY,
+    video_id   TEXT NOT NULL
+);
+"""
+
+
+def registry_db_path() -> str:
+    """Return the SQLite database path that sits next to ``REGISTRY_PATH``."""
+    return os.path.splitext(REGISTRY_PATH)[0] + ".db"
+
+
+def _category(content_type: str) -> str:
+    lowered = content_type.lower()
+    return 'audio' if 'audio' in lowered or 'music' in lowered else 'video'
 
 
 class RegistryManager:
     def __init__(self):
-        self.data: dict[str, dict] = {"youtube": {}, "spotify": {}}
+        self.db_path = registry_db_path()
+        self._lock = threading.RLock()
+        self._conn = self._connect(self.db_path)
         self.load()
 
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error:
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.executescript(_SCHEMA)
+        return conn
+
     def load(self):
-        if os.path.exists(REGISTRY_PATH):
-            try:
-                with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-                    raw = json.load(f)
-                if "youtube" not in raw:
-                    self.data = {"youtube": raw, "spotify": {}}
-                else:
-                    self.data = raw
-            except Exception:
-                self.data = {"youtube": {}, "spotify": {}}
-
-    def save(self):
+        """Import a legacy ``registry.json`` into the database (one-time)."""
+        if not os.path.exists(REGISTRY_PATH):
+            return
         try:
-            with open(REGISTRY_PATH, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, separators=(',', ':'))
+            with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
         except Exception:
+            raw = {}
+        if "youtube" not in raw:
+            raw = {"youtube": raw, "spotify": {}}
+
+        try:
+            with self._lock, self._conn:
+                for video_id, content_types in raw.get("youtube", {}).items():
+                    for c_type, entry in content_types.items():
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO entries "
+                            "(video_id, c_type, title, artist, album, count, spotify_id) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (video_id, c_type, entry.get('t'), entry.get('a'),
+                             entry.get('l'), entry.get('c', 0), entry.get('s')),
+                        )
+                        self._conn.executemany(
+                            "INSERT OR IGNORE INTO paths (video_id, c_type, path, dir) "
+                            "VALUES (?, ?, ?, ?)",
+                            [(video_id, c_type, p, os.path.dirname(p))
+                             for p in entry.get('paths', [])],
+                        )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO spotify (spotify_id, video_id) VALUES (?, ?)",
+                    list(raw.get("spotify", {}).items()),
+                )
+        except sqlite3.Error:
+            return
+
+        try:
+            os.replace(REGISTRY_PATH, REGISTRY_PATH + ".migrated")
+        except OSError:
             pass
 
+    @property
+    def data(self) -> dict[str, dict]:
+        """Snapshot of the whole registry in the legacy ``registry.json`` shape."""
+        youtube: dict[str, dict] = {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT video_id, c_type, title, artist, album, count, spotify_id FROM entries"
+            ).fetchall()
+            for video_id, c_type, title, artist, album, count, spotify_id in rows:
+                entry: dict = {'paths': []}
+                for key, value in (
+                    ('t', title), ('a', artist), ('l', album), ('c', count), ('s', spotify_id),
+                ):
+                    if value is not None:
+                        entry[key] = value
+                youtube.setdefault(video_id, {})[c_type] = entry
+
+            for video_id, c_type, path in self._conn.execute(
+                "SELECT video_id, c_type, path FROM paths ORDER BY id"
+            ):
+                listed = youtube.get(video_id, {}).get(c_type)
+                if listed is not None:
+                    listed['paths'].append(path)
+
+            spotify = dict(self._conn.execute("SELECT spotify_id, video_id FROM spotify"))
+
+        return {"youtube": youtube, "spotify": spotify}
+
     def register_download(self, video_id, file_path, content_type, metadata, spotify_id=None):
         if not video_id or not content_type:
             return
 
-        c_type = 'audio' if 'audio' in content_type.lower() or 'music' in content_type.lower() else 'video'
+        c_type = _category(content_type)
         abs_path = os.path.abspath(file_path)
-        youtube = self.data.setdefault("youtube", {})
-        spotify_index = self.data.setdefault("spotify", {})
-
-        if video_id not in youtube:
-            youtube[video_id] = {}
-
-        if c_type not in youtube[video_id]:
-            youtube[video_id][c_type] = {
-                'paths': [],
-                't': metadata.get('title', 'Unknown'),
-                'a': metadata.get('artist', 'Unknown'),
-                'l': metadata.get('album', 'Unknown'),
-                'c': 0,
-            }
-
-        entry = youtube[video_id][c_type]
-
-        if abs_path not in entry['paths']:
-            entry['paths'].append(abs_path)
-
-        entry['c'] = entry.get('c', 0) + 1
-        entry['t'] = metadata.get('title', entry.get('t'))
-        entry['a'] = metadata.get('artist', entry.get('a'))
 
-        if spotify_id:
-            entry['s'] = spotify_id
-            spotify_index[spotify_id] = video_id
-
-        self.save()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO entries "
+                    "(video_id, c_type, title, artist, album, count, spotify_id) "
+                    "VALUES (?, ?, ?, ?, ?, 1, ?) "
+                    "ON CONFLICT (video_id, c_type) DO UPDATE SET "
+                    "count = count + 1, "
+                    "title = CASE WHEN ? THEN excluded.title ELSE title END, "
+                    "artist = CASE WHEN ? THEN excluded.artist ELSE artist END, "
+                    "spotify_id = COALESCE(excluded.spotify_id, spotify_id)",
+                    (
+                        video_id, c_type,
+                        metadata.get('title', 'Unknown'),
+                        metadata.get('artist', 'Unknown'),
+                        metadata.get('album', 'Unknown'),
+                        spotify_id or None,
+                        'title' in metadata,
+                        'artist' in metadata,
+                    ),
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO paths (video_id, c_type, path, dir) VALUES (?, ?, ?, ?)",
+                    (video_id, c_type, abs_path, os.path.dirname(abs_path)),
+                )
+                if spotify_id:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO spotify (spotify_id, video_id) VALUES (?, ?)",
+                        (spotify_id, video_id),
+                    )
+        except sqlite3.Error:
+            pass
 
     @trace
     def check_existing(self, video_id=None, content_type=None, target_folder=None, spotify_id=None):
         if not content_type:
             return False, None
 
-        c_type = 'audio' if 'audio' in content_type.lower() or 'music' in content_type.lower() else 'video'
+        c_type = _category(content_type)
         abs_target_folder = os.path.abspath(target_folder) if target_folder else ""
 
-        youtube = self.data.get("youtube", {})
-        spotify_index = self.data.get("spotify", {})
+        with self._lock:
+            found_vid = None
+            if video_id and self._conn.execute(
+                "SELECT 1 FROM entries WHERE video_id = ? LIMIT 1", (video_id,)
+            ).fetchone():
+                found_vid = video_id
 
-        found_vid = None
-        if video_id and video_id in youtube:
-            found_vid = video_id
+            if found_vid is None and spotify_id:
+                row = self._conn.execute(
+                    "SELECT video_id FROM spotify WHERE spotify_id = ?", (spotify_id,)
+                ).fetchone()
+                if row:
+                    found_vid = row[0]
 
-        if found_vid is None and spotify_id and spotify_id in spotify_index:
-            found_vid = spotify_index[spotify_id]
+            if found_vid is None:
+                return False, None
 
-        if found_vid and c_type in youtube.get(found_vid, {}):
-            return self._check_entry_paths(
-                youtube[found_vid][c_type], found_vid, c_type, abs_target_folder,
-            )
+            entry = self._conn.execute(
+                "SELECT title, artist FROM entries WHERE video_id = ? AND c_type = ?",
+                (found_vid, c_type),
+            ).fetchone()
+            if entry is None:
+                return False, None
 
-        return False, None
+            return self._check_entry_paths(entry, found_vid, c_type, abs_target_folder)
 
     def _check_entry_paths(self, entry, video_id, c_type, abs_target_folder):
-        stored_paths = entry.get('paths', [])
-        valid_paths = []
-        found_in_target = False
+        stored = self._conn.execute(
+            "SELECT id, path, dir FROM paths WHERE video_id = ? AND c_type = ? ORDER BY id",
+            (video_id, c_type),
+        ).fetchall()
+        stale_ids = []
         found_path_str = ""
 
-        for path in stored_paths:
+        for row_id, path, file_dir in stored:
             if os.path.exists(path):
-                valid_paths.append(path)
-                file_dir = os.path.dirname(path)
-                if file_dir == abs_target_folder:
-                    found_in_target = True
+                if file_dir == abs_target_folder and not found_path_str:
                     found_path_str = path
+            else:
+                stale_ids.append((row_id,))
 
-        if len(valid_paths) != len(stored_paths):
-            entry['paths'] = valid_paths
-            if not valid_paths:
-                del self.data["youtube"][video_id][c_type]
-                if not self.data["youtube"][video_id]:
-                    del self.data["youtube"][video_id]
-            self.save()
+        if stale_ids:
+            try:
+                with self._conn:
+                    self._conn.executemany("DELETE FROM paths WHERE id = ?", stale_ids)
+                    if len(stale_ids) == len(stored):
+                        self._conn.execute(
+                            "DELETE FROM entries WHERE video_id = ? AND c_type = ?",
+                            (video_id, c_type),
+                        )
+            except sqlite3.Error:
+                pass
 
-        if found_in_target:
+        if found_path_str:
             return True, {
                 'file_path': found_path_str,
-                'title': entry.get('t'),
-                'artist': entry.get('a'),
+                'title': entry[0],
+                'artist': entry[1],
             }
 
         return False, None
 
+    @trace
+    def check_existing_many(self, ids, content_type, dirs, by_spotify=False):
+        """Answer ``check_existing`` for a whole batch of IDs in one pass.
+
+        Candidate paths come from the ``dir`` index (one query for all
+        ``dirs``) and are verified against a single listing per directory
+        instead of one ``stat`` per stored path.  Stale rows are pruned in
+        one transaction.
+
+        Returns ``{id: {'file_path', 'title', 'artist'}}`` for every ID
+        that has a file in one of ``dirs``; the earliest dir wins.
+        """
+        wanted = {i for i in ids if i}
+        if not wanted or not content_type or not dirs:
+            return {}
+
+        c_type = _category(content_type)
+        abs_dirs = list(dict.fromkeys(os.path.abspath(d) for d in dirs))
+        rank = {d: n for n, d in enumerate(abs_dirs)}
+        marks = ",".join("?" * len(abs_dirs))
+
+        with self._lock:
+            if by_spotify:
+                alias: dict[str, str] = {}
+                keys = list(wanted)
+                for start in range(0, len(keys), _IN_CHUNK):
+                    chunk = keys[start:start + _IN_CHUNK]
+                    for spotify_id, video_id in self._conn.execute(
+                        "SELECT spotify_id, video_id FROM spotify "
+                        f"WHERE spotify_id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ):
+                        alias[video_id] = spotify_id
+            else:
+                alias = {i: i for i in wanted}
+
+            rows = self._conn.execute(
+                "SELECT p.id, p.video_id, p.path, p.dir, e.title, e.artist "
+                "FROM paths p JOIN entries e "
+                "ON e.video_id = p.video_id AND e.c_type = p.c_type "
+                f"WHERE p.c_type = ? AND p.dir IN ({marks}) ORDER BY p.id",
+                (c_type, *abs_dirs),
+            ).fetchall()
+
+            listings: dict[str, set[str]] = {}
+            found: dict[str, tuple[int, dict]] = {}
+            stale: list[tuple[str, int]] = []
+
+            for row_id, video_id, path, file_dir, title, artist in rows:
+                key = alias.get(video_id)
+                if key is None:
+                    continue
+                if file_dir not in listings:
+                    try:
+                        listings[file_dir] = set(os.listdir(file_dir))
+                    except OSError:
+                        listings[file_dir] = set()
+                if os.path.basename(path) not in listings[file_dir]:
+                    stale.append((video_id, row_id))
+                    continue
+                if key not in found or rank[file_dir] < found[key][0]:
+                    found[key] = (rank[file_dir], {
+                        'file_path': path, 'title': title, 'artist': artist,
+                    })
+
+            if stale:
+                self._prune_paths(stale, c_type)
+
+        return {key: meta for key, (_, meta) in found.items()}
+
+    def _prune_paths(self, stale, c_type):
+        """Delete stale path rows and any entry left without paths."""
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM paths WHERE id = ?", [(row_id,) for _, row_id in stale]
+                )
+                self._conn.executemany(
+                    "DELETE FROM entries WHERE video_id = ? AND c_type = ? AND NOT EXISTS "
+                    "(SELECT 1 FROM paths WHERE paths.video_id = entries.video_id "
+                    "AND paths.c_type = entries.c_type)",
+                    [(video_id, c_type) for video_id in {v for v, _ in stale}],
+                )
+        except sqlite3.Error:
+            pass
+
+    def lookup_path(self, file_path):
+        """Return ``(video_id, c_type)`` registered for ``file_path``, or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT video_id, c_type FROM paths WHERE path = ? LIMIT 1",
+                (os.path.abspath(file_path),),
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def has_entries(self):
+        """Return ``True`` when at least one download is registered."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM entries LIMIT 1").fetchone()
+        return row is not None
+
     def update_path(self, old_path, new_path):
         old_abs = os.path.abspath(old_path)
         new_abs = os.path.abspath(new_path)
 
-        updated = False
-        youtube = self.data.get("youtube", {})
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE OR IGNORE paths SET path = ?, dir = ? WHERE path = ?",
+                    (new_abs, os.path.dirname(new_abs), old_abs),
+                )
+                self._conn.execute("DELETE FROM paths WHERE path = ?", (old_abs,))
+        except sqlite3.Error:
+            pass
 
-        for vid, data in youtube.items():
-            for c_type, entry in data.items():
-                if 'paths' in entry:
-                    if old_abs in entry['paths']:
-                        entry['paths'] = [p for p in entry['paths'] if p != old_abs]
-                        if new_abs not in entry['paths']:
-                            entry['paths'].append(new_abs)
-                        updated = True
+    def relocate(self, old_dir, new_dir, filenames=None):
+        """Rewrite every path under ``old_dir`` to live under ``new_dir``.
+
+        Covers files in ``old_dir`` and its subdirectories, or only the
+        direct children named in ``filenames`` when given.  Runs as one
+        transaction; returns the number of paths moved.
+        """
+        old_abs = os.path.abspath(old_dir)
+        new_abs = os.path.abspath(new_dir)
+        if old_abs == new_abs:
+            return 0
+
+        with self._lock:
+            if filenames is not None:
+                names = set(filenames)
+                rows = [
+                    row for row in self._conn.execute(
+                        "SELECT id, path FROM paths WHERE dir = ?", (old_abs,)
+                    )
+                    if os.path.basename(row[1]) in names
+                ]
+            else:
+                prefix = old_abs.rstrip(os.sep) + os.sep
+                # Range scan on the dir index: old_dir itself plus every subdirectory.
+                rows = self._conn.execute(
+                    "SELECT id, path FROM paths WHERE dir = ? OR (dir >= ? AND dir < ?)",
+                    (old_abs, prefix, prefix[:-1] + chr(ord(os.sep) + 1)),
+                ).fetchall()
+            if not rows:
+                return 0
+
+            moves = []
+            for row_id, path in rows:
+                new_path = os.path.join(new_abs, os.path.relpath(path, old_abs))
+                moves.append((new_path, os.path.dirname(new_path), row_id))
 
-        if updated:
-            self.save()
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "UPDATE OR IGNORE paths SET path = ?, dir = ? WHERE id = ?", moves,
+                    )
+                    # Rows the UPDATE skipped already have the target path registered.
+                    self._conn.executemany(
+                        "DELETE FROM paths WHERE id = ? AND path = ?", rows,
+                    )
+            except sqlite3.Error:
+                return 0
+        return len(rows)
 
     def reset(self):
-        self.data = {"youtube": {}, "spotify": {}}
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM paths")
+                    self._conn.execute("DELETE FROM entries")
+                    self._conn.execute("DELETE FROM spotify")
+            except sqlite3.Error:
+                pass
         if os.path.exists(REGISTRY_PATH):
             try:
                 os.remove(REGISTRY_PATH)
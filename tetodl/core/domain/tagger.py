@@ -29,7 +29,6 @@ try:
         USLT,
         ID3NoHeaderError,
     )
-    from mutagen.mp3 import MP3
 
     # Import MP4/M4A Handlers
     from mutagen.mp4 import MP4, MP4Cover
@@ -38,104 +37,6 @@ try:
 except ImportError:
     HAS_MUTAGEN = False
 
-@trace
-def embed_lyrics(file_path: str, lyrics_text: str) -> bool:
-    """
-    Embeds lyrics into the audio file based on its format.
-    
-    Supported Formats:
-    - MP3: Uses ID3 USLT frame (Unsynchronized Lyric Text).
-    - M4A: Uses iTunes '©lyr' atom.
-    - FLAC: Uses Vorbis 'LYRICS' comment.
-    """
-    if not HAS_MUTAGEN:
-        console.err(Keys.tagger.mutagen_not_found_lyrics)
-        return False
-
-    if not os.path.exists(file_path):
-        console.err(Keys.tagger.file_not_found(path=file_path))
-        return False
-
-    ext = os.path.splitext(file_path)[1].lower()
-
-    try:
-        audio: ID3 | MP4 | FLAC
-        # === MP3 (USLT Frame) ===
-        if ext == '.mp3':
-            try:
-                audio = ID3(file_path)
-            except ID3NoHeaderError:
-                audio = ID3()
-            
-            # USLT parameters: encoding=3 (UTF-8), lang='eng', desc='Lyrics'
-            audio.add(USLT(encoding=3, lang='eng', desc='Lyrics', text=lyrics_text))
-            audio.save(file_path)
-            return True
-
-        # === M4A (iTunes Atom) ===
-        elif ext == '.m4a':
-            audio = MP4(file_path)
-            # iTunes atom for lyrics is ©lyr
-            audio['\xa9lyr'] = lyrics_text
-            audio.save()
-            return True
-            
-        # === FLAC (Vorbis Comment) ===
-        elif ext == '.flac':
-            audio = FLAC(file_path)
-            audio['LYRICS'] = lyrics_text
-            audio.save()
-            return True
-            
-    except Exception as e:
-        console.err(Keys.tagger.failed_embed_lyrics(error=e))
-        return False
-        
-    return False
-
-@trace
-def _open_audio(audio_path: str, audio_format: str):
-    """Open audio file and return format-specific handler."""
-    if audio_format == 'mp3':
-        try:
-            audio: MP3 | ID3 = MP3(audio_path, ID3=ID3)
-        except Exception:
-            audio = ID3(audio_path)
-        if isinstance(audio, MP3):
-            try:
-                audio.add_tags()
-            except ID3NoHeaderError:
-                pass
-        return audio
-    elif audio_format == 'm4a':
-        return MP4(audio_path)
-    return None
-
-
-def _save_audio(audio, audio_format: str, audio_path: str):
-    if audio_format == 'mp3':
-        audio.save()
-    elif audio_format == 'm4a':
-        audio.save()
-
-
-def _embed_cover_mp3(tag_container: ID3, thumbnail_path: str):
-    with open(thumbnail_path, 'rb') as albumart:
-        tag_container.add(
-            APIC(
-                encoding=3,
-                mime='image/jpeg',
-                type=3,
-                desc='Cover',
-                data=albumart.read()
-            )
-        )
-
-
-def _embed_cover_m4a(audio_m4a: MP4, thumbnail_path: str):
-    with open(thumbnail_path, 'rb') as f:
-        audio_m4a['covr'] = [MP4Cover(f.read(), imageformat=MP4Cover.FORMAT_JPEG)]
-
 
 def _embed_tags_mp3(tag_container: ID3, metadata: dict[str, Any]):
     if metadata.get('title'):
@@ -191,6 +92,154 @@ def _embed_tags_m4a(audio_m4a: MP4, metadata: dict[str, Any]):
             pass
 
 
+# Space reserved after the tags on every save, so later re-tags (a new
+# cover, corrected text) fit in place instead of rewriting the audio data.
+TAG_PADDING = 64 * 1024
+# Below this, padding is grown back to TAG_PADDING; above it, a re-tag
+# that used some of the reserved space still saves in place.
+TAG_PADDING_MIN = TAG_PADDING // 2
+
+
+def _reserve_padding(info) -> int:
+    """mutagen padding policy: keep existing padding when it leaves room
+    for another re-tag and isn't wasteful, otherwise resize it to
+    :data:`TAG_PADDING`."""
+    if TAG_PADDING_MIN <= info.padding <= TAG_PADDING * 4:
+        return info.padding
+    return TAG_PADDING
+
+
+class TagTransaction:
+    """Collects cover art, text tags and lyrics for one audio file and
+    writes them with a single mutagen open and save.
+
+    Pipeline steps stage their changes with :meth:`set_cover`,
+    :meth:`set_tags` and :meth:`set_lyrics`; :meth:`commit` applies them
+    all at once.  Text tags from later calls override earlier ones, empty
+    values never overwrite.
+    """
+
+    def __init__(self, audio_path: str, audio_format: str | None = None) -> None:
+        self.audio_path = audio_path
+        ext = os.path.splitext(audio_path)[1].lower().lstrip('.')
+        self.audio_format = ext if ext in ('mp3', 'm4a', 'flac') else (audio_format or ext)
+        self._cover: bytes | None = None
+        self._tags: dict[str, Any] = {}
+        self._lyrics: str | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self._cover is not None or bool(self._tags) or self._lyrics is not None
+
+    @property
+    def has_cover(self) -> bool:
+        return self._cover is not None
+
+    @property
+    def has_lyrics(self) -> bool:
+        return self._lyrics is not None
+
+    def set_cover(self, thumbnail_path: str) -> bool:
+        """Stage cover art; the image is read now, so the file may be
+        cleaned up before :meth:`commit`."""
+        if self.audio_format not in ('mp3', 'm4a'):
+            return False
+        try:
+            with open(thumbnail_path, 'rb') as f:
+                self._cover = f.read()
+        except OSError:
+            return False
+        return True
+
+    def set_tags(self, metadata: dict[str, Any]) -> None:
+        self._tags.update({k: v for k, v in metadata.items() if v})
+
+    def set_lyrics(self, lyrics_text: str) -> None:
+        self._lyrics = lyrics_text
+
+    @trace
+    def commit(self) -> bool:
+        """Write every staged change in one save.  Returns ``True`` when
+        nothing was pending."""
+        if not self.pending:
+            return True
+        if not HAS_MUTAGEN:
+            console.err(Keys.tagger.mutagen_not_found_metadata)
+            return False
+        if not os.path.exists(self.audio_path):
+            console.err(Keys.tagger.file_not_found(path=self.audio_path))
+            return False
+
+        try:
+            if self.audio_format == 'mp3':
+                self._commit_mp3()
+            elif self.audio_format == 'm4a':
+                self._commit_m4a()
+            elif self.audio_format == 'flac' and not self._cover and not self._tags:
+                audio_flac = FLAC(self.audio_path)
+                audio_flac['LYRICS'] = self._lyrics
+                audio_flac.save(padding=_reserve_padding)
+            else:
+                return False
+        except Exception as e:
+            if self._lyrics is not None and not self._cover and not self._tags:
+                console.err(Keys.tagger.failed_embed_lyrics(error=e))
+            else:
+                console.err(Keys.tagger.metadata_embedding_error(error=e))
+            return False
+
+        self._cover, self._tags, self._lyrics = None, {}, None
+        return True
+
+    def _commit_mp3(self) -> None:
+        try:
+            tags = ID3(self.audio_path)
+        except ID3NoHeaderError:
+            tags = ID3()
+        if self._cover is not None:
+            tags.add(APIC(encoding=3, mime='image/jpeg', type=3, desc='Cover', data=self._cover))
+        if self._tags:
+            _embed_tags_mp3(tags, self._tags)
+        if self._lyrics is not None:
+            # USLT parameters: encoding=3 (UTF-8), lang='eng', desc='Lyrics'
+            tags.add(USLT(encoding=3, lang='eng', desc='Lyrics', text=self._lyrics))
+        tags.save(self.audio_path, padding=_reserve_padding)
+
+    def _commit_m4a(self) -> None:
+        audio_m4a = MP4(self.audio_path)
+        if self._cover is not None:
+            audio_m4a['covr'] = [MP4Cover(self._cover, imageformat=MP4Cover.FORMAT_JPEG)]
+        if self._tags:
+            _embed_tags_m4a(audio_m4a, self._tags)
+        if self._lyrics is not None:
+            # iTunes atom for lyrics is ©lyr
+            audio_m4a['\xa9lyr'] = self._lyrics
+        audio_m4a.save(padding=_reserve_padding)
+
+
+@trace
+def embed_lyrics(file_path: str, lyrics_text: str) -> bool:
+    """
+    Embeds lyrics into the audio file based on its format.
+
+    Supported Formats:
+    - MP3: Uses ID3 USLT frame (Unsynchronized Lyric Text).
+    - M4A: Uses iTunes '©lyr' atom.
+    - FLAC: Uses Vorbis 'LYRICS' comment.
+    """
+    if not HAS_MUTAGEN:
+        console.err(Keys.tagger.mutagen_not_found_lyrics)
+        return False
+
+    if not os.path.exists(file_path):
+        console.err(Keys.tagger.file_not_found(path=file_path))
+        return False
+
+    tx = TagTransaction(file_path)
+    tx.set_lyrics(lyrics_text)
+    return tx.commit()
+
+
 @trace
 def embed_cover(audio_path: str, thumbnail_path: str, audio_format: str) -> bool:
     """Embed cover art image only (no text tags)."""
@@ -200,24 +249,8 @@ def embed_cover(audio_path: str, thumbnail_path: str, audio_format: str) -> bool
     if not os.path.exists(audio_path) or not os.path.exists(thumbnail_path):
         return False
 
-    try:
-        if audio_format == 'mp3':
-            audio = _open_audio(audio_path, audio_format)
-            tag_container = audio.tags if isinstance(audio, MP3) else audio
-            if tag_container is not None:
-                _embed_cover_mp3(tag_container, thumbnail_path)
-            _save_audio(audio, audio_format, audio_path)
-            return True
-
-        elif audio_format == 'm4a':
-            audio_m4a = _open_audio(audio_path, audio_format)
-            _embed_cover_m4a(audio_m4a, thumbnail_path)
-            _save_audio(audio_m4a, audio_format, audio_path)
-            return True
-
-    except Exception as e:
-        console.err(Keys.tagger.metadata_embedding_error(error=e))
-    return False
+    tx = TagTransaction(audio_path, audio_format)
+    return tx.set_cover(thumbnail_path) and tx.commit()
 
 
 @trace
@@ -231,24 +264,11 @@ def embed_metadata_tags(audio_path: str, audio_format: str, metadata: dict[str,
     if not metadata:
         return True
 
-    try:
-        if audio_format == 'mp3':
-            audio = _open_audio(audio_path, audio_format)
-            tag_container = audio.tags if isinstance(audio, MP3) else audio
-            if tag_container is not None:
-                _embed_tags_mp3(tag_container, metadata)
-            _save_audio(audio, audio_format, audio_path)
-            return True
-
-        elif audio_format == 'm4a':
-            audio_m4a = _open_audio(audio_path, audio_format)
-            _embed_tags_m4a(audio_m4a, metadata)
-            _save_audio(audio_m4a, audio_format, audio_path)
-            return True
-
-    except Exception as e:
-        console.err(Keys.tagger.metadata_embedding_error(error=e))
-    return False
+    tx = TagTransaction(audio_path, audio_format)
+    if tx.audio_format not in ('mp3', 'm4a'):
+        return False
+    tx.set_tags(metadata)
+    return tx.commit()
 
 
 @trace
@@ -258,8 +278,16 @@ def embed_metadata(
     audio_format: str,
     metadata: dict[str, Any] | None = None
 ) -> bool:
-    """Embed cover art + metadata (wrapper around embed_cover + embed_metadata_tags)."""
-    ok = embed_cover(audio_path, thumbnail_path, audio_format)
+    """Embed cover art + metadata in a single save."""
+    if not HAS_MUTAGEN:
+        console.err(Keys.tagger.mutagen_not_found_metadata)
+        return False
+    if not os.path.exists(audio_path) or not os.path.exists(thumbnail_path):
+        return False
+
+    tx = TagTransaction(audio_path, audio_format)
+    if not tx.set_cover(thumbnail_path):
+        return False
     if metadata:
-        ok = embed_metadata_tags(audio_path, audio_format, metadata) and ok
-    return ok
\ No newline at end of file
+        tx.set_tags(metadata)
+    return tx.commit()
@@ -25,6 +25,10 @@ class Extractor(ABC):
     Subclasses must override :meth:`handles` and :meth:`extract`.
     """
 
+    raw_info: dict | None = None
+    """Raw yt-dlp info dict from the last :meth:`extract`, when the
+    extractor has one that a download can be started from directly."""
+
     @staticmethod
     @abstractmethod
     def handles(url: str) -> bool:
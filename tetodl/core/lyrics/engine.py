@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from tetodl.core.domain.cache import get_cache
+from typing import Any
+
+from tetodl.core.domain.cache import MISS, get_cache
 from tetodl.core.lyrics.matcher import MIN_SCORE, calculate_score
 from tetodl.core.lyrics.models import LyricsData, LyricsQuery
 from tetodl.core.lyrics.providers import get_lyrics_providers
@@ -35,19 +37,23 @@ def search_lyrics(artist: str, title: str, duration: float = 0.0) -> str | None:
 
     cache = get_cache("lyrics")
     cache_key = f"lyr:{artist}||{title}"
-    cached = cache.get(cache_key)
-    if cached is not None:
-        return cached
+    lyrics = cache.get_or_load(cache_key, lambda: _search_providers(query, swapped))
+    return None if lyrics is MISS else lyrics
+
 
+def _search_providers(query: LyricsQuery, swapped: LyricsQuery) -> Any:
+    """Best lyrics found; :data:`MISS` only when every provider answered,
+    ``None`` (not cached) when any of them failed."""
     all_providers = get_lyrics_providers()
     lrclib_provider = next((p for p in all_providers if type(p).__name__ == "LRCLIBProvider"), None)
+    failed = False
 
     lrclib_candidates: list[LyricsData] = []
     if lrclib_provider is not None:
         try:
             lrclib_candidates = lrclib_provider.search(query)
         except Exception:
-            lrclib_candidates = []
+            failed = True
 
     best = _pick_best(lrclib_candidates, query, fallback_query=swapped)
 
@@ -59,12 +65,10 @@ def search_lyrics(artist: str, title: str, duration: float = 0.0) -> str | None:
         try:
             aligned = scrape_with_anchor(clean_artist, clean_title, anchor)
             if aligned:
-                cache.set(cache_key, aligned)
                 return aligned
         except Exception:
             pass
 
-        cache.set(cache_key, anchor)
         return anchor
 
     for provider in all_providers:
@@ -73,11 +77,10 @@ def search_lyrics(artist: str, title: str, duration: float = 0.0) -> str | None:
         try:
             candidates = provider.search(query)
         except Exception:
+            failed = True
             continue
         best = _pick_best(candidates, query, fallback_query=swapped)
         if best is not None:
-            cache.set(cache_key, best.plain_lyrics)
             return best.plain_lyrics
 
-    cache.set(cache_key, None)
-    return None
+    return None if failed else MISS
@@ -37,6 +37,7 @@ def _clean_genius_lyrics(lyrics_text: str) -> str:
 def _search_genius(artist: str, title: str) -> tuple[str | None, str | None, str | None]:
     target_title = clean_title(title, artist)
     clean_artist = artist.replace(" - Topic", "").strip()
+    error: Exception | None = None
 
     for search_query in get_search_queries(artist, title):
         try:
@@ -46,6 +47,7 @@ def _search_genius(artist: str, title: str) -> tuple[str | None, str | None, str
                 headers=_GENIUS_HEADERS,
                 timeout=10,
             )
+            resp.raise_for_status()
             data = resp.json()
 
             hits = []
@@ -68,29 +70,31 @@ def _search_genius(artist: str, title: str) -> tuple[str | None, str | None, str
                 if _is_valid_match(target_title, hit_title, search_artist=clean_artist, result_artist=hit_artist):
                     return result["url"], hit_artist, hit_title
 
-        except Exception:
+        except Exception as e:
+            error = e
             continue
 
+    # No match, but a query failed: that is not a definite miss.
+    if error is not None:
+        raise error
     return None, None, None
 
 
 def _scrape_lyrics(page_url: str) -> str | None:
-    try:
-        resp = get_session().get(page_url, headers=_GENIUS_HEADERS, timeout=10)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        lyrics_divs = soup.find_all("div", attrs={"data-lyrics-container": "true"})
-        if not lyrics_divs:
-            return None
-
-        lyrics_text = ""
-        for div in lyrics_divs:
-            for br in div.find_all("br"):
-                br.replace_with("\n")
-            lyrics_text += div.get_text() + "\n\n"
-        return lyrics_text.strip()
-    except Exception:
+    resp = get_session().get(page_url, headers=_GENIUS_HEADERS, timeout=10)
+    resp.raise_for_status()
+    soup = BeautifulSoup(resp.text, "html.parser")
+    lyrics_divs = soup.find_all("div", attrs={"data-lyrics-container": "true"})
+    if not lyrics_divs:
         return None
 
+    lyrics_text = ""
+    for div in lyrics_divs:
+        for br in div.find_all("br"):
+            br.replace_with("\n")
+        lyrics_text += div.get_text() + "\n\n"
+    return lyrics_text.strip()
+
 
 def _align_with_anchor(raw_lyrics: str, anchor: str) -> str:
     if not raw_lyrics or not anchor:
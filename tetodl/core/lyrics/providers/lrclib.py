@@ -23,8 +23,14 @@ class LRCLIBProvider(LyricsProvider):
         if query.artist:
             strategies.append({"artist_name": query.artist})
 
+        error: Exception | None = None
         for params in strategies:
-            for item in self._fetch(params):
+            try:
+                items = self._fetch(params)
+            except Exception as e:
+                error = e
+                continue
+            for item in items:
                 key = (item.get("artistName") or "", item.get("trackName") or "")
                 if key in seen:
                     continue
@@ -43,23 +49,21 @@ class LRCLIBProvider(LyricsProvider):
                     duration=float(item.get("duration") or 0),
                 ))
 
+        # Nothing found, but a strategy failed: that is not a definite miss.
+        if not results and error is not None:
+            raise error
         return results
 
     def _fetch(self, params: dict[str, str]) -> list[dict]:
         if not params:
             return []
-        try:
-            resp = get_session().get(
-                f"{self.BASE_URL}/search",
-                params=params,
-                headers=get_headers(),
-                timeout=10,
-            )
-            if resp.status_code != 200:
-                return []
-            data = resp.json()
-            if isinstance(data, list):
-                return data
-        except Exception:
-            pass
-        return []
+        # Request errors propagate so the engine does not cache them as misses.
+        resp = get_session().get(
+            f"{self.BASE_URL}/search",
+            params=params,
+            headers=get_headers(),
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        return data if isinstance(data, list) else []
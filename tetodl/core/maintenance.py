@@ -9,7 +9,7 @@ from pathlib import Path
 
 from ..core.domain.config import reset_config
 from ..core.domain.env import env
-from ..core.domain.history import reset_history
+from ..core.domain.history import history_log_dir, reset_history
 from ..core.domain.registry import registry
 from ..utils.console import console
 from ..utils.files import TempManager
@@ -325,22 +325,26 @@ def reset_data(targets: list[str]):
     if not danger_targets:
         return
 
-    _history_path = env.get("history_path")
+    _history_path = history_log_dir()
     _config_path = env.get("config_path")
-    _registry_path = env.get("registry_path")
 
     files_to_check = {
         'history': _history_path,
         'config': _config_path,
-        'registry': _registry_path
     }
     
     valid_targets = []
     nothing_to_clean = []
     
     for t in danger_targets:
-        path = files_to_check.get(t)
-        if path and os.path.exists(path):
+        # The registry database is created on startup, so its file
+        # existing says nothing about whether there is anything to wipe.
+        if t == 'registry':
+            has_data = registry.has_entries()
+        else:
+            path = files_to_check.get(t)
+            has_data = bool(path and os.path.exists(path))
+        if has_data:
             valid_targets.append(t)
         else:
             nothing_to_clean.append(t)
@@ -0,0 +1,250 @@
+"""
+AdaptiveLimiter — AIMD control of how many downloads run at once.
+
+The limit grows by one while aggregate throughput keeps rising and errors
+stay rare, and is cut multiplicatively on throttling (HTTP 429/403, bot
+checks), a burst of extractor errors or a throughput collapse.  The limit
+reached is remembered per host, so the next playlist from the same site
+starts where the last one settled instead of at a guessed constant.
+
+A slot covers the transfer only: it can be given back as soon as the bytes
+are on disk, so merging and re-encoding never hold up the next download.
+:class:`DiskBudget` additionally keeps the transfers in flight from
+together outgrowing the free space of the target directory.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from tetodl.utils.console import console
+
+INCREASE_GAIN = 1.05      # throughput must beat the last window by 5% to grow
+COLLAPSE_RATIO = 0.5      # ...and halving it counts as congestion
+DECREASE_FACTOR = 0.5
+ERROR_RATE_LIMIT = 0.25
+DISK_HEADROOM = 512 * 1024 * 1024  # never plan to fill the disk past this
+
+_THROTTLE_RE = re.compile(
+    r"HTTP Error (?:429|403)|Too Many Requests|rate.?limit|Sign in to confirm",
+    re.IGNORECASE,
+)
+
+
+def is_throttled(error: str | None) -> bool:
+    """True when *error* looks like the site pushing back on request rate."""
+    if not error:
+        return False
+    return bool(_THROTTLE_RE.search(error))
+
+
+@dataclass
+class SlotOutcome:
+    """Filled in by the caller inside :meth:`AdaptiveLimiter.slot`."""
+    nbytes: int = 0
+    error: str | None = None
+    started: float = 0.0
+    finished: float = 0.0
+    _release: Callable[[], None] | None = field(default=None, repr=False)
+
+    def release(self) -> None:
+        """Give the slot back before the block ends, once only local work
+        (merging, re-encoding) is left for this item."""
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        initial: int,
+        maximum: int,
+        minimum: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._active = 0
+        self._window: list[SlotOutcome] = []
+        self._last_rate: float | None = None
+
+    @contextmanager
+    def slot(self) -> Iterator[SlotOutcome]:
+        """Wait for a free slot under the current limit and hold it.
+
+        Set ``nbytes`` and ``error`` on the yielded outcome; an exception
+        leaving the block counts as an error.
+        """
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        outcome = SlotOutcome(started=self._clock())
+
+        def _release() -> None:
+            outcome.finished = self._clock()
+            with self._cond:
+                self._active -= 1
+                self._record(outcome)
+                self._cond.notify_all()
+
+        outcome._release = _release
+        try:
+            yield outcome
+        except BaseException as exc:
+            outcome.error = outcome.error or str(exc) or type(exc).__name__
+            raise
+        finally:
+            outcome.release()
+
+    def _record(self, outcome: SlotOutcome) -> None:
+        samples = self._window
+        samples.append(outcome)
+
+        # Throttling is acted on at once; everything else is judged per
+        # window of as many completions as there are slots.
+        if is_throttled(outcome.error):
+            self._decrease("throttled")
+            return
+        if len(samples) < max(2, self.limit):
+            return
+
+        errors = sum(1 for s in samples if s.error)
+        span = max(s.finished for s in samples) - min(s.started for s in samples)
+        rate = sum(s.nbytes for s in samples) / span if span > 0 else 0.0
+        last = self._last_rate
+        self._window = []
+
+        if errors / len(samples) > ERROR_RATE_LIMIT:
+            self._decrease(f"{errors}/{len(samples)} errors")
+        elif last is not None and rate < last * COLLAPSE_RATIO:
+            self._decrease("throughput collapsed")
+        elif last is None or rate > last * INCREASE_GAIN:
+            self._last_rate = rate
+            if self.limit < self.maximum:
+                self.limit += 1
+                console.debug(f"Concurrency raised to {self.limit}")
+        else:
+            self._last_rate = rate
+
+    def _decrease(self, reason: str) -> None:
+        self.limit = max(self.minimum, int(self.limit * DECREASE_FACTOR))
+        self._window = []
+        self._last_rate = None
+        console.debug(f"Concurrency lowered to {self.limit} ({reason})")
+
+
+class DiskBudget:
+    """Reserve estimated download sizes against the free space under *path*.
+
+    A reservation that does not fit waits for others to finish; one that
+    does not fit even with nothing else in flight is refused.  Free space
+    is re-read on every check, so bytes already written by running
+    downloads are counted twice — erring on the side of waiting.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        headroom: int = DISK_HEADROOM,
+        free: Callable[[str], int | None] | None = None,
+    ) -> None:
+        self.path = path
+        self.headroom = headroom
+        self._free = free or _free_bytes
+        self._cond = threading.Condition()
+        self._reserved = 0
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[bool]:
+        """Hold *nbytes* of the free space; yields False if it can never fit."""
+        nbytes = max(0, int(nbytes))
+        with self._cond:
+            while self._reserved and not self._fits(nbytes):
+                self._cond.wait(1.0)
+            fits = self._fits(nbytes)
+            if fits:
+                self._reserved += nbytes
+        if not fits:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with self._cond:
+                self._reserved -= nbytes
+                self._cond.notify_all()
+
+    def _fits(self, nbytes: int) -> bool:
+        if not nbytes:
+            return True
+        free = self._free(self.path)
+        if free is None:
+            return True
+        return self._reserved + nbytes <= free - self.headroom
+
+
+def _free_bytes(path: str) -> int | None:
+    while path and not os.path.isdir(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    try:
+        return shutil.disk_usage(path or ".").free
+    except OSError:
+        return None
+
+
+def estimate_size(raw: dict | None) -> int:
+    """Bytes a download of the extracted *raw* info dict will need on disk.
+
+    Formats that are merged are counted twice: the parts and the merged
+    file coexist until the merge finishes.
+    """
+    if not isinstance(raw, dict):
+        return 0
+    formats = raw.get("requested_formats") or [raw]
+    total = 0
+    for fmt in formats:
+        size = fmt.get("filesize") or fmt.get("filesize_approx")
+        if not size and fmt.get("tbr") and raw.get("duration"):
+            size = fmt["tbr"] * 1000 / 8 * raw["duration"]
+        total += int(size or 0)
+    return total * 2 if len(formats) > 1 else total
+
+
+def url_host(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+def remembered_limit(host: str) -> int | None:
+    """Concurrency a previous playlist from *host* settled on."""
+    from tetodl.core.domain.cache import get_cache
+    try:
+        value = get_cache("concurrency").get(host) if host else None
+    except Exception:
+        return None
+    return value if isinstance(value, int) else None
+
+
+def remember_limit(host: str, limit: int) -> None:
+    from tetodl.core.domain.cache import get_cache
+    if not host:
+        return
+    try:
+        get_cache("concurrency").set(host, int(limit))
+    except Exception:
+        pass
@@ -1,29 +1,67 @@
+import collections
+import itertools
 import os
-import random
 import shutil
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any
+from urllib.parse import quote_plus
 
 from yt_dlp.utils import sanitize_filename
 
 from tetodl.core.domain.config import add_user_subfolder
+from tetodl.core.cover import CoverData
 from tetodl.core.domain.env import env
-from tetodl.core.domain.models import AppConfig, DownloadResult, DownloadSession
+from tetodl.core.domain.journal import DONE, DOWNLOADED, ENRICHED, FAILED, PENDING, Job, journal
+from tetodl.core.domain.models import (
+    AppConfig,
+    DownloadedFile,
+    DownloadResult,
+    DownloadSession,
+    PipelineContext,
+)
 from tetodl.core.domain.registry import registry
+from tetodl.core.pipeline.concurrency import (
+    AdaptiveLimiter,
+    DiskBudget,
+    remember_limit,
+    remembered_limit,
+    url_host,
+)
 from tetodl.core.pipeline.metadata import resolve_artist_title
 from tetodl.core.pipeline.runner import MediaPipeline
+from tetodl.core.pipeline.staged import Stage, StagedExecutor
 from tetodl.core.domain.provider import NullUI, UIProvider
 from tetodl.utils.console import console
 from tetodl.utils.files import create_zip_archive, remove_nomedia_file
 from tetodl.utils.formatters import color
 from tetodl.utils.i18n_keys import Keys
+from tetodl.utils.logger import is_debug
 from tetodl.utils.network import (
     check_internet,
     is_valid_youtube_url,
     is_youtube_music_url,
 )
-from tetodl.utils.processing import extract_all_urls_from_content, extract_video_id
+from tetodl.utils.processing import expand_content, extract_video_id, format_playlist_items
+from tetodl.utils.ratelimit import configure_youtube_pacing, pace_youtube
 from tetodl.utils.tracer import traced
+from tetodl.utils.ydl_pool import pooled_ydl
+
+# Registry lookups are batched per this many playlist entries as the
+# listing streams in, instead of once for the whole playlist up front.
+_PRECHECK_CHUNK = 25
+
+# Spotify albums are looked up as a whole: YouTube Music albums first, then
+# YouTube playlists (an artist's "Topic" channel publishes each album as
+# one).  At most this many candidate albums are opened.
+_ALBUM_SEARCHES = (
+    "https://music.youtube.com/search?q={query}#albums",
+    "https://www.youtube.com/results?search_query={query}&sp=EgIQAw%3D%3D",
+)
+_ALBUM_CANDIDATES = 2
+_ALBUM_DURATION_TOLERANCE_MS = 5000
 
 
 def _resolve_enrichment_flags(
@@ -93,6 +131,176 @@ def download_video_youtube(
     )
 
 
+# YouTube Music match scoring.  Every candidate is reduced to one
+# _Candidate record up front; _rank then maps it to the tier the original
+# first-match-wins walk would have picked it at, so one pass over the list
+# finds the winner.
+_BLOCKED_KW = ("live", "lyrics", "acoustic", "cover", "karaoke", "instrumental", "lirik", "terjemahan", "subtitle")
+_LYRICS_KW = ("lyrics", "lirik", "terjemahan", "subtitle")
+_TITLE_SEPARATORS = (" - ", " – ", " — ")
+_DURATION_TOLERANCE_MS = 15000
+_DURATION_WIDE_MS = 45000
+_NO_TIER = 99
+
+_PHASE_TIERS = (
+    "topic+dur+overlap+clean",
+    "topic+dur+overlap",
+    "topic+dur+artist_uploader",
+    "dur+artist_uploader+artist_title",
+    "dur+overlap>=0.5",
+    "dur+overlap>=0.3",
+    "dur_wide+overlap>=0.5",
+    "dur_wide+artist_uploader+artist_title",
+)
+_FINAL_TIERS = (
+    "dur+artist_uploader+artist_title",
+    "dur_wide+lyrics_kw",
+    "dur+artist_uploader",
+    "dur+artist_title",
+    "clean+overlap>=0.5",
+    "overlap>=0.5",
+    "overlap>=0.3",
+    "last resort",
+)
+
+# Phase 2 goes out alongside phase 1 while phase 1 has recently been
+# settling fewer than this share of searches on its own.
+_SPECULATE_BELOW = 0.5
+_phase1_hit_rate = 1.0
+_phase1_lock = threading.Lock()
+_search_pool: ThreadPoolExecutor | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _Candidate:
+    url: str
+    title: str
+    uploader: str
+    duration: float | None
+    topic: bool
+    dur_ok: bool
+    dur_wide: bool
+    overlap: float
+    clean: bool
+    artist_uploader: bool
+    artist_title: bool
+    lyrics_kw: bool
+
+
+def _candidate(entry: dict, artist: str, title_words: list[str], target_duration_ms: int | None) -> _Candidate:
+    """Compute every matching feature of a search *entry* once."""
+    title = entry.get("title") or ""
+    lower = title.lower()
+    uploader = entry.get("uploader") or entry.get("channel") or ""
+    duration = entry.get("duration")
+
+    if not target_duration_ms or target_duration_ms <= 0:
+        dur_ok = dur_wide = True
+    elif duration is None:
+        dur_ok = dur_wide = False
+    else:
+        diff = abs(duration * 1000 - target_duration_ms)
+        dur_ok = diff <= _DURATION_TOLERANCE_MS
+        dur_wide = diff <= _DURATION_WIDE_MS
+
+    # "Artist - Title" uploads: the clean check drops a leading artist,
+    # the word overlap looks at whatever follows the first separator.
+    stripped = lower
+    after_sep = lower
+    for sep in _TITLE_SEPARATORS:
+        if artist and stripped is lower and lower.startswith(artist + sep):
+            stripped = lower[len(artist) + len(sep):]
+        if after_sep is lower and sep in lower:
+            after_sep = lower.split(sep, 1)[1]
+
+    if title_words:
+        overlap = sum(1 for w in title_words if w in after_sep) / len(title_words)
+    else:
+        overlap = 1.0
+
+    return _Candidate(
+        url=entry.get("url") or "",
+        title=title,
+        uploader=uploader,
+        duration=duration,
+        topic=uploader.endswith(" - Topic"),
+        dur_ok=dur_ok,
+        dur_wide=dur_wide,
+        overlap=overlap,
+        clean="(" not in stripped and "[" not in stripped,
+        artist_uploader=bool(artist) and artist in uploader.lower(),
+        artist_title=bool(artist) and artist in lower,
+        lyrics_kw=any(kw in lower for kw in _LYRICS_KW),
+    )
+
+
+def _rank(c: _Candidate, final: bool = False) -> int:
+    """1-based tier of *c* within a search phase (``_PHASE_TIERS``) or the
+    final pass over all candidates (``_FINAL_TIERS``); lower is better,
+    ``_NO_TIER`` when it qualifies for none."""
+    if final:
+        if c.dur_ok and c.artist_uploader and c.artist_title:
+            return 1
+        if c.dur_wide and c.lyrics_kw:
+            return 2
+        if c.dur_ok and c.artist_uploader:
+            return 3
+        if c.dur_ok and c.artist_title:
+            return 4
+        if c.clean and c.overlap >= 0.5:
+            return 5
+        if c.overlap >= 0.5:
+            return 6
+        if c.overlap >= 0.3:
+            return 7
+        return 8
+    if c.dur_ok:
+        if c.topic and c.overlap >= 0.5 and c.clean:
+            return 1
+        if c.topic and c.overlap >= 0.3:
+            return 2
+        if c.topic and c.artist_uploader:
+            return 3
+        if c.artist_uploader and c.artist_title:
+            return 4
+        if c.overlap >= 0.5:
+            return 5
+        if c.overlap >= 0.3:
+            return 6
+    if c.dur_wide:
+        if c.overlap >= 0.5:
+            return 7
+        if c.artist_uploader and c.artist_title:
+            return 8
+    return _NO_TIER
+
+
+def _best(candidates: list[_Candidate], final: bool = False) -> tuple[int, _Candidate] | None:
+    """Best-ranked candidate and its tier; earlier results win ties."""
+    best: tuple[int, _Candidate] | None = None
+    for c in candidates:
+        tier = _rank(c, final)
+        if tier < _NO_TIER and (best is None or tier < best[0]):
+            best = (tier, c)
+            if tier == 1:
+                break
+    return best
+
+
+def _note_phase1(hit: bool) -> None:
+    global _phase1_hit_rate
+    with _phase1_lock:
+        _phase1_hit_rate = 0.8 * _phase1_hit_rate + 0.2 * hit
+
+
+def _search_executor() -> ThreadPoolExecutor:
+    global _search_pool
+    with _phase1_lock:
+        if _search_pool is None:
+            _search_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ytm-search")
+        return _search_pool
+
+
 def _search_ytmusic(
     query: str, target_duration_ms: int | None = None,
 ) -> str | None:
@@ -108,204 +316,242 @@ def _search_ytmusic(
 
     artist_from_query = (query.split(" - ", 1)[1] if " - " in query else "").lower()
     spotify_title = query.split(" - ", 1)[0] if " - " in query else ""
+    title_words = spotify_title.lower().split()
 
-    _BLOCKED = ("live", "lyrics", "acoustic", "cover", "karaoke", "instrumental", "lirik", "terjemahan", "subtitle")
-    _LYRICS_KW = ("lyrics", "lirik", "terjemahan", "subtitle")
-
-    def _is_topic(entry: dict) -> bool:
-        uploader = entry.get("uploader") or entry.get("channel") or ""
-        return uploader.endswith(" - Topic")
-
-    def _has_blocked_kw(title: str) -> bool:
-        lower = title.lower()
-        for kw in _BLOCKED:
-            if kw in lower:
-                return True
-        return False
-
-    def _has_lyrics_kw(title: str) -> bool:
-        lower = title.lower()
-        for kw in _LYRICS_KW:
-            if kw in lower:
-                return True
-        return False
-
-    def _title_clean(title: str) -> bool:
-        lower = title.lower()
-        for sep in (" - ", " \u2013 ", " \u2014 "):
-            if artist_from_query and lower.startswith(artist_from_query + sep):
-                lower = lower[len(artist_from_query) + len(sep):]
-                break
-        if "(" in lower or "[" in lower:
-            return False
-        return True
-
-    def _duration_ok(entry: dict, tolerance_ms: int = 15000) -> bool:
-        if not target_duration_ms or target_duration_ms <= 0:
-            return True
-        duration = entry.get("duration")
-        if duration is None:
-            return False
-        diff = abs(duration * 1000 - target_duration_ms)
-        return diff <= tolerance_ms
-
-    def _artist_in_uploader(entry: dict) -> bool:
-        if not artist_from_query:
-            return False
-        uploader = (entry.get("uploader") or entry.get("channel") or "").lower()
-        return artist_from_query in uploader
-
-    def _artist_in_title(yt_title: str) -> bool:
-        if not artist_from_query:
-            return False
-        return artist_from_query in yt_title.lower()
-
-    def _title_word_overlap(yt_title: str) -> float:
-        if not spotify_title:
-            return 1.0
-        yt_clean = yt_title.lower()
-        for sep in (" - ", " \u2013 ", " \u2014 "):
-            if sep in yt_clean:
-                yt_clean = yt_clean.split(sep, 1)[1]
-                break
-        sp_words = spotify_title.lower().split()
-        if not sp_words:
-            return 1.0
-        matched = sum(1 for w in sp_words if w in yt_clean)
-        return matched / len(sp_words)
-
-    def _search(search_url: str) -> list[dict]:
+    def _search(search_url: str) -> list[_Candidate]:
         try:
-            with yt.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
+            pace_youtube()
+            with pooled_ydl("flat", opts, yt.YoutubeDL) as ydl:
                 result = ydl.extract_info(search_url, download=False)
-            candidates: list[dict] = []
-            for entry in result.get("entries") or []:  # type: ignore[union-attr]
-                entry_url = entry.get("url") or ""
-                if "/watch?" not in entry_url:
-                    continue
-                candidates.append(entry)  # type: ignore[arg-type]
-            return candidates
+            return [
+                _candidate(entry, artist_from_query, title_words, target_duration_ms)
+                for entry in result.get("entries") or []  # type: ignore[union-attr]
+                if "/watch?" in (entry.get("url") or "")
+            ]
         except Exception:
             return []
 
-    def _log_candidates(phase: str, candidates: list[dict]) -> None:
+    def _log_candidates(phase: str, candidates: list[_Candidate]) -> None:
+        if not is_debug():
+            return
         console.debug(f"===== Phase {phase} =====")
         if not candidates:
             console.debug("No candidates")
             return
         console.debug(f"{len(candidates)} candidates:")
-        for i, entry in enumerate(candidates):
-            title = entry.get("title", "?")
-            dur = entry.get("duration")
-            uploader = entry.get("uploader") or entry.get("channel") or "?"
-            dur_str = f"{dur}s ({dur * 1000}ms)" if dur else "N/A"
-            topic = " [TOPIC]" if _is_topic(entry) else ""
-            overlap = _title_word_overlap(title)
-            dur_ok = _duration_ok(entry)
-            clean = _title_clean(title)
-            blocked = _has_blocked_kw(title)
-            console.debug(f"  [{i}] {title}{topic}")
-            console.debug(f"      uploader={uploader}, duration={dur_str}, overlap={overlap:.2f}, dur_ok={dur_ok}, clean={clean}, blocked={blocked}")
-
-    def _match(tier: int, label: str, entry: dict) -> str | None:
-        url = entry.get("url", "")
-        console.debug(f"  TIER {tier} ({label}): {entry.get('title')!r} -> {url}")
-        return url
+        for i, c in enumerate(candidates):
+            dur_str = f"{c.duration}s ({c.duration * 1000}ms)" if c.duration else "N/A"
+            topic = " [TOPIC]" if c.topic else ""
+            blocked = any(kw in c.title.lower() for kw in _BLOCKED_KW)
+            console.debug(f"  [{i}] {c.title}{topic}")
+            console.debug(f"      uploader={c.uploader or '?'}, duration={dur_str}, overlap={c.overlap:.2f}, dur_ok={c.dur_ok}, clean={c.clean}, blocked={blocked}")
+
+    def _match(tier: int, label: str, c: _Candidate) -> str | None:
+        console.debug(f"  TIER {tier} ({label}): {c.title!r} -> {c.url}")
+        return c.url
 
     query_topic = f"ytsearch10:{query} topic"
+    query_general = f"ytsearch10:{query}"
+
+    # When phase 1 has mostly been coming up empty lately, the phase 2
+    # query is sent right away instead of after phase 1 has failed.
+    speculative = None
+    if _phase1_hit_rate < _SPECULATE_BELOW:
+        console.debug(f"Phase 2 search (speculative): {query_general!r}")
+        speculative = _search_executor().submit(_search, query_general)
+
     console.debug(f"Phase 1 search: {query_topic!r}")
     candidates1 = _search(query_topic)
     _log_candidates("1 (topic)", candidates1)
-
-    if candidates1:
-        for entry in candidates1:
-            if _is_topic(entry) and _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.5 and _title_clean(entry.get("title", "")):
-                return _match(1, "topic+dur+overlap+clean", entry)
-        for entry in candidates1:
-            if _is_topic(entry) and _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.3:
-                return _match(2, "topic+dur+overlap", entry)
-        for entry in candidates1:
-            if _is_topic(entry) and _duration_ok(entry) and _artist_in_uploader(entry):
-                return _match(3, "topic+dur+artist_uploader", entry)
-        for entry in candidates1:
-            if _duration_ok(entry) and _artist_in_uploader(entry) and _artist_in_title(entry.get("title", "")):
-                return _match(4, "dur+artist_uploader+artist_title", entry)
-        for entry in candidates1:
-            if _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.5:
-                return _match(5, "dur+overlap>=0.5", entry)
-        for entry in candidates1:
-            if _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.3:
-                return _match(6, "dur+overlap>=0.3", entry)
-        for entry in candidates1:
-            if _duration_ok(entry, 45000) and _title_word_overlap(entry.get("title", "")) >= 0.5:
-                return _match(7, "dur_wide+overlap>=0.5", entry)
-        for entry in candidates1:
-            if _duration_ok(entry, 45000) and _artist_in_uploader(entry) and _artist_in_title(entry.get("title", "")):
-                return _match(8, "dur_wide+artist_uploader+artist_title", entry)
-
-    query_general = f"ytsearch10:{query}"
-    console.debug(f"Phase 2 search: {query_general!r}")
-    candidates2 = _search(query_general)
+    found = _best(candidates1)
+    _note_phase1(found is not None)
+    if found:
+        if speculative is not None:
+            speculative.cancel()
+        tier, c = found
+        return _match(tier, _PHASE_TIERS[tier - 1], c)
+
+    if speculative is not None:
+        candidates2 = speculative.result()
+    else:
+        console.debug(f"Phase 2 search: {query_general!r}")
+        candidates2 = _search(query_general)
     _log_candidates("2 (general)", candidates2)
-
-    if candidates2:
-        for entry in candidates2:
-            if _is_topic(entry) and _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.5 and _title_clean(entry.get("title", "")):
-                return _match(9, "topic+dur+overlap+clean", entry)
-        for entry in candidates2:
-            if _is_topic(entry) and _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.3:
-                return _match(10, "topic+dur+overlap", entry)
-        for entry in candidates2:
-            if _is_topic(entry) and _duration_ok(entry) and _artist_in_uploader(entry):
-                return _match(11, "topic+dur+artist_uploader", entry)
-        for entry in candidates2:
-            if _duration_ok(entry) and _artist_in_uploader(entry) and _artist_in_title(entry.get("title", "")):
-                return _match(12, "dur+artist_uploader+artist_title", entry)
-        for entry in candidates2:
-            if _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.5:
-                return _match(13, "dur+overlap>=0.5", entry)
-        for entry in candidates2:
-            if _duration_ok(entry) and _title_word_overlap(entry.get("title", "")) >= 0.3:
-                return _match(14, "dur+overlap>=0.3", entry)
-        for entry in candidates2:
-            if _duration_ok(entry, 45000) and _title_word_overlap(entry.get("title", "")) >= 0.5:
-                return _match(15, "dur_wide+overlap>=0.5", entry)
-        for entry in candidates2:
-            if _duration_ok(entry, 45000) and _artist_in_uploader(entry) and _artist_in_title(entry.get("title", "")):
-                return _match(16, "dur_wide+artist_uploader+artist_title", entry)
+    found = _best(candidates2)
+    if found:
+        tier, c = found
+        return _match(tier + 8, _PHASE_TIERS[tier - 1], c)
 
     all_candidates = candidates1 + candidates2
     console.debug(f"Phase 3: {len(all_candidates)} total candidates")
     _log_candidates("3 (nekat)", all_candidates)
-
-    if all_candidates:
-        for entry in all_candidates:
-            if _duration_ok(entry) and _artist_in_uploader(entry) and _artist_in_title(entry.get("title", "")):
-                return _match(17, "dur+artist_uploader+artist_title", entry)
-        for entry in all_candidates:
-            if _duration_ok(entry, 45000) and _has_lyrics_kw(entry.get("title", "")):
-                return _match(18, "dur_wide+lyrics_kw", entry)
-        for entry in all_candidates:
-            if _duration_ok(entry) and _artist_in_uploader(entry):
-                return _match(19, "dur+artist_uploader", entry)
-        for entry in all_candidates:
-            if _duration_ok(entry) and _artist_in_title(entry.get("title", "")):
-                return _match(20, "dur+artist_title", entry)
-        for entry in all_candidates:
-            if _title_clean(entry.get("title", "")) and _title_word_overlap(entry.get("title", "")) >= 0.5:
-                return _match(21, "clean+overlap>=0.5", entry)
-        for entry in all_candidates:
-            if _title_word_overlap(entry.get("title", "")) >= 0.5:
-                return _match(22, "overlap>=0.5", entry)
-        for entry in all_candidates:
-            if _title_word_overlap(entry.get("title", "")) >= 0.3:
-                return _match(23, "overlap>=0.3", entry)
-        return _match(24, "last resort", all_candidates[0])
+    found = _best(all_candidates, final=True)
+    if found:
+        tier, c = found
+        return _match(tier + 16, _FINAL_TIERS[tier - 1], c)
 
     console.debug("No candidates found, returning None")
     return None
 
 
+def _word_overlap(reference: str, candidate: str) -> float:
+    """Share of the words of *reference* that occur in *candidate*."""
+    words = reference.lower().split()
+    if not words:
+        return 1.0
+    candidate = candidate.lower()
+    return sum(1 for w in words if w in candidate) / len(words)
+
+
+def _match_album(album: str, tracks: list) -> dict[str, str]:
+    """Map the Spotify album *tracks* onto one YouTube Music album.
+
+    Searches for the album once, opens the best-titled candidates and maps
+    tracks by position and duration, falling back to title within the
+    album for tracks that moved.  A candidate is accepted when at least
+    half the tracks map.  Returns ``{spotify_id: url}`` for the mapped
+    tracks; the rest are left to per-track search.
+    """
+    import yt_dlp as yt
+
+    opts: dict = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": True,
+        "simulate": True,
+        "cachedir": env.get('ytdlp_cache_dir'),
+    }
+    artist = tracks[0].artist if tracks else ""
+    query = quote_plus(f"{album} {artist}".strip())
+
+    def _entries(url: str) -> list[dict]:
+        try:
+            pace_youtube()
+            with pooled_ydl("flat", opts, yt.YoutubeDL) as ydl:
+                result = ydl.extract_info(url, download=False)
+        except Exception:
+            return []
+        return list((result or {}).get("entries") or [])
+
+    opened = 0
+    for search in _ALBUM_SEARCHES:
+        for candidate in _entries(search.format(query=query)):
+            if _word_overlap(album, candidate.get("title") or "") < 0.5 or not candidate.get("url"):
+                continue
+            if opened == _ALBUM_CANDIDATES:
+                return {}
+            opened += 1
+            mapped = _map_album_tracks(tracks, _entries(candidate["url"]))
+            console.debug(f"Album candidate {candidate.get('title')!r}: {len(mapped)}/{len(tracks)} tracks mapped")
+            if len(mapped) * 2 >= len(tracks):
+                return mapped
+    return {}
+
+
+def _map_album_tracks(tracks: list, entries: list[dict]) -> dict[str, str]:
+    entries = [e for e in entries if "/watch?" in (e.get("url") or "")]
+    mapped: dict[str, str] = {}
+    used: set[int] = set()
+
+    def _fits(track, entry: dict, same_position: bool) -> bool:
+        duration = entry.get("duration")
+        if track.duration_ms and duration is not None:
+            if abs(duration * 1000 - track.duration_ms) > _ALBUM_DURATION_TOLERANCE_MS:
+                return False
+            if same_position:
+                return True
+        return _word_overlap(track.title, entry.get("title") or "") >= 0.5
+
+    for position, track in enumerate(tracks):
+        if not track.spotify_id:
+            continue
+        others = (k for k in range(len(entries)) if k != position)
+        for k in itertools.chain([position], others):
+            if k >= len(entries) or k in used:
+                continue
+            if _fits(track, entries[k], k == position):
+                mapped[track.spotify_id] = entries[k]["url"]
+                used.add(k)
+                break
+    return mapped
+
+
+def _uncached(tracks: list) -> int:
+    """Number of *tracks* without a YouTube match in the ``yt_match`` cache."""
+    from tetodl.core.domain.cache import MISS, get_cache
+
+    yt_match_cache = get_cache("yt_match")
+    count = 0
+    for t in tracks:
+        cached = yt_match_cache.get(t.spotify_id) if t.spotify_id else None
+        if not cached or cached is MISS:
+            count += 1
+    return count
+
+
+def _match_tracks(
+    tracks: list, resolver, workers: int, known: dict[str, str] | None = None,
+) -> Iterator[tuple[int, str, dict]]:
+    """Match Spotify *tracks* to YouTube Music URLs on up to *workers* threads.
+
+    Yields ``(position, url, data)`` in track order (1-based positions;
+    tracks without a match are left out) as soon as a match and every one
+    before it are known, so downloads start while later tracks are still
+    being searched.  ``data`` carries the Spotify fields the pipeline
+    context takes.  Searches share the global YouTube pacing and every
+    result, hit or miss, goes into the ``yt_match`` cache right away.
+    Tracks in *known* (``{spotify_id: url}``, e.g. from the album matcher)
+    are not searched.
+    """
+    from tetodl.core.domain.cache import MISS, get_cache
+
+    yt_match_cache = get_cache("yt_match")
+    known = known or {}
+
+    def _match(t) -> tuple[str, dict] | None:
+        sid = t.spotify_id
+        query = f"{t.title} - {t.artist}"
+        cached = yt_match_cache.get(sid) if sid else None
+        if cached is MISS and sid not in known:
+            found = None
+        elif cached and cached is not MISS:
+            found = cached["y"]
+            t.cover_url = cached.get("c") or t.cover_url
+        else:
+            found = known.get(sid) or _search_ytmusic(query, target_duration_ms=t.duration_ms)
+            if found and not t.cover_url and sid:
+                t.cover_url = resolver.fetch_track_cover(sid)
+            if sid:
+                if found:
+                    yt_match_cache.set(sid, {"y": found, "c": t.cover_url or ""})
+                else:
+                    yt_match_cache.set_miss(sid)
+        if not found:
+            console.warn(Keys.download.youtube.could_not_find_youtube_result(query=query))
+            return None
+        return found, {
+            "cover_url": t.cover_url or "", "spotify_title": t.title,
+            "spotify_artist": t.artist, "spotify_id": sid or "",
+        }
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="match")
+    pending: collections.deque = collections.deque()
+    todo = enumerate(tracks, 1)
+    try:
+        # Keep a bounded window of searches in flight ahead of the consumer.
+        for position, t in itertools.islice(todo, 2 * max(1, workers)):
+            pending.append((position, pool.submit(_match, t)))
+        while pending:
+            position, future = pending.popleft()
+            for nxt, t in itertools.islice(todo, 1):
+                pending.append((nxt, pool.submit(_match, t)))
+            result = future.result()
+            if result is not None:
+                yield position, *result
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def download_spotify(
     url: str,
     session: DownloadSession,
@@ -314,7 +560,12 @@ def download_spotify(
 ) -> DownloadResult:
     from tetodl.core.clients.spotify import SpotifyResolver
     from tetodl.core.clients.spotify.errors import SpotifyParseError
-    from tetodl.core.domain.cache import get_cache
+
+    configure_youtube_pacing(config.jitter_min, config.jitter_max, config.request_burst)
+    selection = format_playlist_items(session.playlist_items) if session.playlist_items else ""
+    job = journal.find(url, config.music_root, selection)
+    if job is not None and job.listed and job.pending():
+        return _resume_spotify(job, session, config, ui)
 
     resolver = SpotifyResolver()
     try:
@@ -326,6 +577,7 @@ def download_spotify(
     if not tracks:
         return DownloadResult(success=False, reason="no_tracks", file_path=None)
 
+    album_tracks = tracks if resolver.url_type(url) == "album" else []
     if session.playlist_items:
         tracks = [t for i, t in enumerate(tracks, 1) if i in session.playlist_items]
         if not tracks:
@@ -343,22 +595,17 @@ def download_spotify(
         if group_name:
             precheck_dirs.append(os.path.join(config.music_root, group_name))
 
+    existing = registry.check_existing_many(
+        [t.spotify_id for t in tracks], "audio", precheck_dirs, by_spotify=True,
+    )
+
     remaining_tracks: list = []
     skip_quiet = 0
     for t in tracks:
-        if t.spotify_id:
-            found_existing = False
-            for d in precheck_dirs:
-                exists, _ = registry.check_existing(
-                    content_type="audio", target_folder=d, spotify_id=t.spotify_id,
-                )
-                if exists:
-                    found_existing = True
-                    break
-            if found_existing:
-                console.warn(Keys.download.youtube.skipping_existing_track(title=t.title))
-                skip_quiet += 1
-                continue
+        if t.spotify_id in existing:
+            console.warn(Keys.download.youtube.skipping_existing_track(title=t.title))
+            skip_quiet += 1
+            continue
         remaining_tracks.append(t)
 
     if skip_quiet:
@@ -366,67 +613,35 @@ def download_spotify(
 
     if not remaining_tracks:
         console.err(Keys.download.youtube.all_tracks_already_downloaded)
-        existing_path = None
-        for t in tracks:
-            if t.spotify_id:
-                for d in precheck_dirs:
-                    exists, meta = registry.check_existing(
-                        content_type="audio", target_folder=d, spotify_id=t.spotify_id,
-                    )
-                    if exists and meta:
-                        existing_path = meta.get("file_path")
-                        break
-            if existing_path:
-                break
+        existing_path = next(
+            (existing[t.spotify_id].get("file_path") for t in tracks if t.spotify_id in existing),
+            None,
+        )
         return DownloadResult(
             success=False, reason="all_existing",
             file_path=existing_path, skipped=True,
         )
 
-    yt_match_cache = get_cache("yt_match")
-    yt_urls: list[str] = []
-    cover_urls: list[str] = []
-    spotify_titles: list[str] = []
-    spotify_artists: list[str] = []
-    spotify_ids: list[str] = []
-
     with console.spin(Keys.download.spotify.searching_ytmusic):
-        for t in remaining_tracks:
-            sid = t.spotify_id
-            cached = yt_match_cache.get(sid) if sid else None
-            if cached:
-                yt_urls.append(cached["y"])
-                cover_urls.append(cached.get("c") or t.cover_url or "")
-                spotify_titles.append(t.title)
-                spotify_artists.append(t.artist)
-                spotify_ids.append(sid or "")
-                continue
-
-            query = f"{t.title} - {t.artist}"
-            found = _search_ytmusic(query, target_duration_ms=t.duration_ms)
-            if found:
-                yt_urls.append(found)
-                if not t.cover_url and sid:
-                    t.cover_url = resolver.fetch_track_cover(sid)
-                cover_urls.append(t.cover_url or "")
-                spotify_titles.append(t.title)
-                spotify_artists.append(t.artist)
-                spotify_ids.append(sid or "")
-                if sid:
-                    yt_match_cache.set(sid, {"y": found, "c": t.cover_url or ""})
-            else:
-                console.warn(Keys.download.youtube.could_not_find_youtube_result(query=query))
-
-    if not yt_urls:
+        # One album lookup replaces per-track searches for an album; it
+        # maps by position, so it always sees the full tracklist.
+        album_map: dict[str, str] = {}
+        if album_tracks and container_name and _uncached(remaining_tracks) > 1:
+            album_map = _match_album(container_name, album_tracks)
+        matches = _match_tracks(remaining_tracks, resolver, config.match_workers, album_map)
+        head = list(itertools.islice(matches, 2))
+
+    if not head:
         console.err(Keys.download.youtube.no_tracks_resolved)
         return DownloadResult(success=False, reason="no_results", file_path=None)
 
     enrichment_flags = _resolve_enrichment_flags(session, True, "audio")
 
-    if len(yt_urls) == 1:
+    if len(head) == 1:
+        _, yt_url, data = head[0]
         return _handle_single(
-            url=yt_urls[0],
-            cover_url=cover_urls[0] or None,
+            url=yt_url,
+            cover_url=data["cover_url"] or None,
             target_dir=config.music_root,
             config=config,
             media_type="audio",
@@ -435,17 +650,21 @@ def download_spotify(
             ui=ui,
             cut_range=session.cut_range,
             simple=config.simple_mode,
-            spotify_title=spotify_titles[0] if spotify_titles else None,
-            spotify_artist=spotify_artists[0] if spotify_artists else None,
-            spotify_id=spotify_ids[0] if spotify_ids else None,
+            spotify_title=data["spotify_title"] or None,
+            spotify_artist=data["spotify_artist"] or None,
+            spotify_id=data["spotify_id"] or None,
             enrichment_flags=enrichment_flags,
         )
 
+    # Matches stream into the download stages while later tracks are still
+    # being searched; the journal records each one as it arrives, so an
+    # interrupted run resumes without resolving and matching them again.
+    job = journal.open(url, config.music_root, selection, container_name or "Spotify Playlist")
+
     return _handle_playlist(
-        urls=yt_urls,
-        cover_urls=cover_urls,
+        urls=itertools.chain(head, matches),
         content_title=container_name or "Spotify Playlist",
-        total_items=len(yt_urls),
+        total_items=len(remaining_tracks),
         target_dir=config.music_root,
         config=config,
         session=session,
@@ -459,10 +678,39 @@ def download_spotify(
         share_mode=session.share_after_download,
         simple=config.simple_mode,
         zip_mode=config.zip_mode,
-        spotify_titles=spotify_titles,
-        spotify_artists=spotify_artists,
-        spotify_ids=spotify_ids,
         enrichment_flags=enrichment_flags,
+        job=job,
+    )
+
+
+def _resume_spotify(
+    job: Job,
+    session: DownloadSession,
+    config: AppConfig,
+    ui: UIProvider,
+) -> DownloadResult:
+    console.ok(Keys.download.youtube.resuming_job(
+        title=job.title, remaining=job.unfinished(), total=len(job.items),
+    ))
+    entries = [(index, url, job.items[index]["data"]) for index, url in job.entries()]
+    return _handle_playlist(
+        urls=entries,
+        content_title=job.title,
+        total_items=len(entries),
+        target_dir=config.music_root,
+        config=config,
+        session=session,
+        media_type="audio",
+        registry_media_type="audio",
+        is_youtube_music=True,
+        ui=ui,
+        cut_range=session.cut_range,
+        group_folder=session.group_folder,
+        share_mode=session.share_after_download,
+        simple=config.simple_mode,
+        zip_mode=config.zip_mode,
+        enrichment_flags=_resolve_enrichment_flags(session, True, "audio"),
+        job=job,
     )
 
 
@@ -502,11 +750,11 @@ def download_spotify_thumbnail(
     filename = f"{sanitize_filename(f'{track.artist} - {track.title}')}.{target_format}"
     filepath = os.path.join(target_dir, filename)
 
-    data = CoverService().fetch(track.cover_url)
+    service = CoverService()
+    data = service.fetch(track.cover_url)
     if data is None:
         return DownloadResult(success=False, reason="download_failed")
-    with open(filepath, "wb") as f:
-        f.write(data)
+    service.save(data, filepath, target_format=target_format, fallback=False)
 
     return DownloadResult(success=True, file_path=filepath, file_count=1)
 
@@ -528,6 +776,7 @@ def _execute(
     simple = config.simple_mode
     zip_mode = config.zip_mode
     is_youtube_music = is_youtube_music_url(url) if check_youtube_music and url else False
+    configure_youtube_pacing(config.jitter_min, config.jitter_max, config.request_burst)
 
     extracted_label = "track" if media_type == "audio" else "video"
 
@@ -571,33 +820,56 @@ def _execute(
     if env.get('is_termux'):
         remove_nomedia_file(target_dir)
 
+    playlist_kw: dict = dict(
+        target_dir=target_dir,
+        config=config,
+        session=session,
+        media_type=media_type,
+        registry_media_type=registry_media_type,
+        is_youtube_music=is_youtube_music,
+        ui=ui,
+        cut_range=cut_range,
+        group_folder=group_folder,
+        share_mode=share_mode,
+        simple=simple,
+        zip_mode=zip_mode,
+        enrichment_flags=enrichment_flags,
+    )
+    selection = format_playlist_items(playlist_items) if playlist_items else ""
+    job = journal.find(url, target_dir, selection)
+    if job is not None and job.listed and job.pending():
+        # An interrupted run of this playlist: the journal already holds
+        # the listing, so skip expansion and redo only unfinished items.
+        console.ok(Keys.download.youtube.resuming_job(
+            title=job.title, remaining=job.unfinished(), total=len(job.items),
+        ))
+        return _handle_playlist(
+            urls=job.entries(), content_title=job.title,
+            total_items=len(job.items), job=job, **playlist_kw,
+        )
+
     with traced('expanding URLs'), console.spin(Keys.download.youtube.extracting):
-        urls, content_title, total_items = extract_all_urls_from_content(url)
-    console.ok(Keys.download.youtube.extracted(count=total_items, type=extracted_label))
+        listing = expand_content(url, playlist_items=playlist_items)
+        # Peek far enough to tell a one-entry listing from a playlist; the
+        # rest of the entries stream into the playlist executor.
+        head = list(itertools.islice(listing.entries, 2))
+    if listing.count is not None:
+        extracted_count: int | str = listing.count
+    else:
+        extracted_count = len(head) if len(head) < 2 else "?"
+    console.ok(Keys.download.youtube.extracted(count=extracted_count, type=extracted_label))
 
-    if total_items > 1:
+    if listing.is_playlist and (playlist_items or len(head) > 1):
         return _handle_playlist(
-            urls=urls,
-            content_title=content_title,
-            total_items=total_items,
-            target_dir=target_dir,
-            config=config,
-            session=session,
-            media_type=media_type,
-            registry_media_type=registry_media_type,
-            is_youtube_music=is_youtube_music,
-            ui=ui,
-            cut_range=cut_range,
-            playlist_items=playlist_items,
-            group_folder=group_folder,
-            share_mode=share_mode,
-            simple=simple,
-            zip_mode=zip_mode,
-            enrichment_flags=enrichment_flags,
+            urls=itertools.chain(head, listing.entries),
+            content_title=listing.title,
+            total_items=listing.count,
+            job=journal.open(url, target_dir, selection, listing.title),
+            **playlist_kw,
         )
 
     return _handle_single(
-        url=urls[0],
+        url=head[0][1] if head else url,
         target_dir=target_dir,
         config=config,
         media_type=media_type,
@@ -687,9 +959,9 @@ def _handle_single(
 
 
 def _handle_playlist(
-    urls: list[str],
+    urls: Iterable,
     content_title: str,
-    total_items: int,
+    total_items: int | None,
     target_dir: str,
     config: AppConfig,
     session: DownloadSession,
@@ -708,6 +980,7 @@ def _handle_playlist(
     spotify_artists: list[str] | None = None,
     spotify_ids: list[str] | None = None,
     enrichment_flags: dict | None = None,
+    job: Job | None = None,
 ) -> DownloadResult:
     if cut_range:
         console.warn(color("Warning: '--cut' flag is ignored for playlists.", "y"))
@@ -715,7 +988,7 @@ def _handle_playlist(
 
     console.proc(
         Keys.download.youtube.found_playlist(
-            count=total_items, type="track" if media_type == "audio" else "video",
+            count=total_items if total_items is not None else "?", type="track" if media_type == "audio" else "video",
             title=content_title,
         )
     )
@@ -757,11 +1030,11 @@ def _handle_playlist(
     if final_dir != target_dir and not os.path.exists(final_dir):
         os.makedirs(final_dir, exist_ok=True)
 
-    async_mode = session.async_mode and media_type == "audio"
-
-    if async_mode:
+    if session.async_mode:
         success, skipped, failed = _playlist_concurrent(
             urls=urls,
+            total=total_items,
+            job=job,
             cover_urls=cover_urls,
             target_dir=final_dir,
             alt_dirs=alt_dirs,
@@ -780,6 +1053,8 @@ def _handle_playlist(
     else:
         success, skipped, failed = _playlist_sequential(
             urls=urls,
+            total=total_items,
+            job=job,
             cover_urls=cover_urls,
             target_dir=final_dir,
             config=config,
@@ -797,6 +1072,9 @@ def _handle_playlist(
             enrichment_flags=enrichment_flags,
         )
 
+    if job is not None:
+        job.close()
+
     if is_staging and success == 0:
         if os.path.exists(final_dir) and not os.listdir(final_dir):
             console.warn(Keys.media.all_items_exist)
@@ -832,7 +1110,7 @@ def _handle_playlist(
 
 
 def _playlist_sequential(
-    urls: list[str],
+    urls: Iterable,
     target_dir: str,
     config: AppConfig,
     media_type: str,
@@ -848,82 +1126,49 @@ def _playlist_sequential(
     spotify_artists: list[str] | None = None,
     spotify_ids: list[str] | None = None,
     enrichment_flags: dict | None = None,
+    total: int | None = None,
+    job: Job | None = None,
 ) -> tuple[int, int, int]:
-    total = len(urls)
-    success_count = 0
-    failed_count = 0
-    skipped_count = 0
-    ordered_files: list[str] = []
-
-    allowed = playlist_items
-
     dirs_to_check = [target_dir]
     if alt_dirs:
         dirs_to_check.extend(alt_dirs)
 
-    for i, url in enumerate(urls, 1):
-        if allowed is not None and i not in allowed:
-            console.warn(Keys.media.skipping_item(index=i))
-            continue
-
-        console.proc(Keys.download.youtube.progress(current=i, total=total))
-
-        if _skip_registry_check(url, registry_media_type, dirs_to_check, ordered_files):
-            skipped_count += 1
-            time.sleep(0.1)
-            continue
-
-        console.warn(Keys.download.youtube.downloading_url(
-            url=url, type=media_type,
-        ))
-
-        result = _pipeline_item(
-            url=url,
-            cover_url=cover_urls[i - 1] if cover_urls else None,
-            target_dir=target_dir,
-            config=config,
-            media_type=media_type,
-            registry_media_type=registry_media_type,
-            is_youtube_music=is_youtube_music,
-            ui=ui,
-            cut_range=cut_range,
-            download_type="Playlist Track" if media_type == "audio" else "Playlist Video",
-            spotify_title=spotify_titles[i - 1] if spotify_titles else None,
-            spotify_artist=spotify_artists[i - 1] if spotify_artists else None,
-            spotify_id=spotify_ids[i - 1] if spotify_ids else None,
-            enrichment_flags=enrichment_flags,
-        )
-
-        if result is None:
-            failed_count += 1
-        elif result.get("skipped"):
-            console.warn(Keys.download.youtube.file_exists_playlist(title=result.get("title", "")))
-            skipped_count += 1
-        else:
-            console.ok(Keys.download.youtube.success(title=result.get("title", "")))
-            success_count += 1
-            fpath = result.get("file_path")
-            if fpath:
-                ordered_files.append(os.path.basename(fpath))
-
-        if i < total:
-            jitter = random.uniform(config.jitter_min, config.jitter_max)
-            console.proc(Keys.download.youtube.wait_jitter(jitter_min=int(config.jitter_min), jitter_max=int(config.jitter_max)))
-            time.sleep(jitter)
+    records = _playlist_staged(
+        urls=urls,
+        total=total,
+        job=job,
+        target_dir=target_dir,
+        config=config,
+        media_type=media_type,
+        is_youtube_music=is_youtube_music,
+        registry_media_type=registry_media_type,
+        dirs_to_check=dirs_to_check,
+        download_workers=config.download_workers,
+        announce=True,
+        cut_range=cut_range,
+        playlist_items=playlist_items,
+        cover_urls=cover_urls,
+        spotify_titles=spotify_titles,
+        spotify_artists=spotify_artists,
+        spotify_ids=spotify_ids,
+        enrichment_flags=enrichment_flags,
+    )
+    success_count, skipped_count, failed_count = _tally(records)
 
+    ordered_files = [os.path.basename(r["file_path"]) for r in records if r.get("file_path")]
     if config.create_m3u and ordered_files:
         from tetodl.utils.files import create_m3u8_playlist
         create_m3u8_playlist(target_dir, m3u_name, ordered_files)
 
     console.ok(Keys.download.youtube.summary(
         success=success_count, skipped=skipped_count,
-        failed=failed_count, total=total, type=media_type,
+        failed=failed_count, total=total or len(records), type=media_type,
     ))
     return success_count, skipped_count, failed_count
 
 
 def _playlist_concurrent(
-    urls: list[str],
+    urls: Iterable,
     target_dir: str,
     alt_dirs: list[str],
     config: AppConfig,
@@ -938,132 +1183,313 @@ def _playlist_concurrent(
     spotify_artists: list[str] | None = None,
     spotify_ids: list[str] | None = None,
     enrichment_flags: dict | None = None,
+    total: int | None = None,
+    job: Job | None = None,
 ) -> tuple[int, int, int]:
-    max_workers = config.async_workers
-    if max_workers > 5:
+    # Concurrency starts where the last playlist from this host settled
+    # (or at async_workers) and adapts from there; see AdaptiveLimiter.
+    # Downloads also reserve their estimated size against the free space
+    # in target_dir, which matters once videos run side by side.
+    urls = iter(urls)
+    head = list(itertools.islice(urls, 1))
+    host = url_host(_entry_url(head[0])) if head else ""
+    urls = itertools.chain(head, urls)
+    max_workers = max(config.async_workers, config.async_workers_max)
+    limiter = AdaptiveLimiter(remembered_limit(host) or config.async_workers, max_workers)
+    if limiter.limit > 5:
         console.warn(color("Warning: High concurrency (>5) increases risk of IP Ban.", "y"))
 
-    console.proc(Keys.media.async_mode(count=max_workers))
-    total = len(urls)
-    success_count = 0
-    skipped_count = 0
-    failed_count = 0
-    results_store: list[str | None] = [None] * total
-
-    def _task(index: int, url: str) -> dict:
-        if playlist_items is not None and (index + 1) not in playlist_items:
-            return {"status": "success", "skipped": True, "index": index}
-
-        time.sleep(random.uniform(config.jitter_min, config.jitter_max))
-
-        if _skip_registry_check(url, registry_media_type, [target_dir] + alt_dirs):
-            return {"status": "success", "skipped": True, "index": index}
-
-        result = _pipeline_item(
-            url=url, cover_url=cover_urls[index] if cover_urls else None,
-            target_dir=target_dir, config=config,
-            media_type=media_type, registry_media_type=registry_media_type,
-            is_youtube_music=is_youtube_music, ui=ui, cut_range=cut_range,
-            download_type="Playlist Track" if media_type == "audio" else "Playlist Video",
-            spotify_title=spotify_titles[index] if spotify_titles else None,
-            spotify_artist=spotify_artists[index] if spotify_artists else None,
-            spotify_id=spotify_ids[index] if spotify_ids else None,
-            enrichment_flags=enrichment_flags,
-        )
-
-        if result is None:
-            return {"status": "error", "index": index}
-        return {
-            "status": "success",
-            "skipped": False,
-            "index": index,
-            "file_path": result.get("file_path"),
-            "title": result.get("title"),
-        }
+    console.proc(Keys.media.async_mode(count=limiter.limit))
 
     with console.context(is_quiet=True):
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {executor.submit(_task, i, url): i for i, url in enumerate(urls)}
-
         try:
-            for future in as_completed(future_map):
-                r = future.result()
-                if r["status"] == "success":
-                    if r.get("skipped"):
-                        skipped_count += 1
-                    else:
-                        success_count += 1
-                    fp = r.get("file_path")
-                    if fp:
-                        results_store[r["index"]] = os.path.basename(fp)
-                else:
-                    failed_count += 1
+            records = _playlist_staged(
+                urls=urls,
+                total=total,
+                job=job,
+                target_dir=target_dir,
+                config=config,
+                media_type=media_type,
+                is_youtube_music=is_youtube_music,
+                registry_media_type=registry_media_type,
+                dirs_to_check=[target_dir] + alt_dirs,
+                download_workers=max_workers,
+                limiter=limiter,
+                disk_budget=DiskBudget(target_dir),
+                announce=False,
+                cut_range=cut_range,
+                playlist_items=playlist_items,
+                cover_urls=cover_urls,
+                spotify_titles=spotify_titles,
+                spotify_artists=spotify_artists,
+                spotify_ids=spotify_ids,
+                enrichment_flags=enrichment_flags,
+            )
         except KeyboardInterrupt:
             console.err(Keys.media.stopping_threads)
-            executor.shutdown(wait=False)
             raise
-
-    ordered = [f for f in results_store if f is not None]
+        finally:
+            remember_limit(host, limiter.limit)
+
+    success_count, skipped_count, failed_count = _tally(records)
+    # Registry hits are left out of the async-mode playlist, as before.
+    ordered = [
+        os.path.basename(r["file_path"]) for r in records
+        if r.get("file_path") and not r.get("skipped")
+    ]
     if config.create_m3u and ordered:
         from tetodl.utils.files import create_m3u8_playlist
         create_m3u8_playlist(target_dir, "Playlist", ordered)
 
     console.ok(Keys.download.youtube.summary(
         success=success_count, skipped=skipped_count,
-        failed=failed_count, total=total, type=media_type,
+        failed=failed_count, total=total or len(records), type=media_type,
     ))
     return success_count, skipped_count, failed_count
 
 
-def _pipeline_item(
-    url: str,
+def _playlist_staged(
+    urls: Iterable,
     target_dir: str,
     config: AppConfig,
     media_type: str,
-    registry_media_type: str,
     is_youtube_music: bool,
-    ui: UIProvider,
+    registry_media_type: str,
+    dirs_to_check: list[str],
+    download_workers: int,
+    announce: bool = True,
     cut_range: tuple[float, float] | None = None,
-    download_type: str = "Single Track",
-    cover_url: str | None = None,
-    spotify_title: str | None = None,
-    spotify_artist: str | None = None,
-    spotify_id: str | None = None,
+    playlist_items: set[int] | None = None,
+    cover_urls: list[str] | None = None,
+    spotify_titles: list[str] | None = None,
+    spotify_artists: list[str] | None = None,
+    spotify_ids: list[str] | None = None,
     enrichment_flags: dict | None = None,
-) -> dict | None:
+    total: int | None = None,
+    job: Job | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    disk_budget: DiskBudget | None = None,
+) -> list[dict]:
+    """Run playlist items through download, enrichment and post-processing
+    stages on separate worker pools, so item N+1 downloads while item N is
+    being tagged.
+
+    *urls* may be a lazy iterable of URLs, of ``(index, url)`` pairs
+    (1-based playlist positions, as yielded by ``expand_content``) or of
+    ``(index, url, data)`` triples whose *data* supplies the per-item
+    ``cover_url`` / ``spotify_*`` fields; it is consumed while earlier
+    items download, and registry hits are filtered out a chunk at a time
+    as entries arrive.
+
+    With a *limiter*, the download stage runs *download_workers* threads
+    but only as many transfers at once as the limiter currently allows; a
+    slot is handed back as soon as the bytes are on disk, so merging and
+    re-encoding do not count against it.  A *disk_budget* holds each
+    download's estimated size until the download step is done.
+
+    With a journal *job*, every stage transition is recorded; items the
+    journal already has as done are skipped, and items that were
+    downloaded (or enriched) pick up at the next stage.
+
+    Returns one record per selected item in playlist order:
+    ``{"status", "skipped", "file_path", "title"}``.
+    """
     pipeline = MediaPipeline(config=config)
+    download_type = "Playlist Track" if media_type == "audio" else "Playlist Video"
+    records: dict[int, dict] = {}
+    fed: list[int] = []
+
+    def _mark(ctx: PipelineContext, state: str, **data) -> None:
+        if job is not None and ctx.playlist_index is not None:
+            job.mark(ctx.playlist_index, ctx.url, state, **data)
+
+    def _selected():
+        for i, item in enumerate(urls):
+            if not isinstance(item, tuple):
+                item = (i + 1, item)
+            index, url = item[:2]
+            if playlist_items is not None and index not in playlist_items:
+                if announce:
+                    console.warn(Keys.media.skipping_item(index=index))
+                continue
+            yield i, index, url, item[2] if len(item) > 2 else {}
+
+    def _contexts():
+        entries = _selected()
+        while chunk := list(itertools.islice(entries, _PRECHECK_CHUNK)):
+            existing = _registry_precheck([e[2] for e in chunk], registry_media_type, dirs_to_check)
+            for i, index, url, data in chunk:
+                item = job.items.get(index) if job is not None else None
+                if item and item["state"] == DONE and _journal_file_exists(item):
+                    records[i] = {"status": "success", "skipped": True, "file_path": item["data"]["file_path"]}
+                    continue
+                hit = _skip_registry_check(url, existing)
+                if hit is not None:
+                    records[i] = {"status": "success", "skipped": True, "file_path": hit.get("file_path")}
+                    if job is not None:
+                        job.mark(index, url, DONE, file_path=hit.get("file_path"))
+                    continue
+                yield _context(i, index, url, data, item)
+        if job is not None:
+            job.mark_listed()
 
-    ctx_kw: dict = dict(
-        media_type=media_type,
-        is_youtube_music=is_youtube_music,
-        cut_range=cut_range,
-        download_type_label=download_type,
-        cover_url=cover_url,
-        spotify_title=spotify_title,
-        spotify_artist=spotify_artist,
-        spotify_id=spotify_id,
+    def _context(i: int, index: int, url: str, data: dict, item: dict | None) -> PipelineContext:
+        ctx_kw: dict = dict(
+            media_type=media_type,
+            is_youtube_music=is_youtube_music,
+            cut_range=cut_range,
+            download_type_label=download_type,
+            cover_url=data.get("cover_url") or (cover_urls[i] if cover_urls else None),
+            spotify_title=data.get("spotify_title") or (spotify_titles[i] if spotify_titles else None),
+            spotify_artist=data.get("spotify_artist") or (spotify_artists[i] if spotify_artists else None),
+            spotify_id=data.get("spotify_id") or (spotify_ids[i] if spotify_ids else None),
+            keep_partial=job is not None,
+            playlist_index=index,
+        )
+        if enrichment_flags:
+            ctx_kw.update(enrichment_flags)
+        ctx = pipeline.context(url, target_dir, **ctx_kw)
+        fed.append(i)
+        if item and _resume_context(ctx, item):
+            ctx.resumed_state = item["state"]
+        elif item is None or item["state"] != PENDING:
+            _mark(ctx, PENDING, spotify_title=ctx.spotify_title, spotify_artist=ctx.spotify_artist,
+                  spotify_id=ctx.spotify_id, cover_url=ctx.cover_url)
+        return ctx
+
+    def _download(ctx: PipelineContext) -> PipelineContext:
+        if ctx.downloaded_file is not None:
+            return ctx  # resumed from the journal
+        # Requests to YouTube are paced by the shared token bucket inside
+        # the extract and download steps; nothing sleeps here.
+        if announce:
+            console.proc(Keys.download.youtube.progress(
+                current=ctx.playlist_index, total=total if total is not None else "?",
+            ))
+            console.warn(Keys.download.youtube.downloading_url(url=ctx.url, type=media_type))
+        ctx.disk_budget = disk_budget
+        if limiter is None:
+            ctx = pipeline.acquire(ctx)
+        else:
+            with limiter.slot() as outcome:
+                def _transferred(nbytes: int) -> None:
+                    outcome.nbytes = nbytes
+                    outcome.release()
+
+                ctx.transfer_done = _transferred
+                ctx = pipeline.acquire(ctx)
+                outcome.error = ctx.error
+                if ctx.downloaded_file is not None and not outcome.nbytes:
+                    outcome.nbytes = _file_size(ctx.downloaded_file.path)
+        ctx.disk_budget = ctx.transfer_done = None
+        if ctx.classification and ctx.classification.existing_result:
+            _mark(ctx, DONE, file_path=ctx.classification.existing_result.file_path)
+        elif ctx.downloaded_file is not None:
+            _mark(ctx, DOWNLOADED, file=ctx.downloaded_file.model_dump(mode="json"))
+        return ctx
+
+    def _enrich(ctx: PipelineContext) -> PipelineContext:
+        if pipeline.halted(ctx) or ctx.resumed_state == ENRICHED:
+            return ctx
+        ctx = pipeline.enrich(ctx)
+        data = ctx.enrichment_data
+        enrichment = asdict(data) if is_dataclass(data) and not isinstance(data, type) else None
+        _mark(ctx, ENRICHED, enrichment=enrichment)
+        return ctx
+
+    def _postprocess(ctx: PipelineContext) -> PipelineContext:
+        if pipeline.halted(ctx):
+            return ctx
+        ctx = pipeline.postprocess(ctx)
+        if ctx.downloaded_file is not None:
+            _mark(ctx, DONE, file_path=ctx.downloaded_file.path)
+            if announce:
+                console.ok(Keys.download.youtube.success(title=ctx.downloaded_file.title))
+        return ctx
+
+    executor = StagedExecutor(
+        [
+            Stage("download", _download, download_workers),
+            Stage("enrich", _enrich, config.enrich_workers),
+            Stage("postprocess", _postprocess, config.postprocess_workers),
+        ],
+        queue_size=config.stage_queue_size,
     )
-    if enrichment_flags:
-        ctx_kw.update(enrichment_flags)
+    for res in executor.run(_contexts()):
+        ctx = res.value
+        if res.error is not None:
+            console.err(Keys.download.youtube.error_downloading(
+                type=media_type, error=str(res.error),
+            ))
+            record: dict[str, Any] = {"status": "error"}
+        elif ctx.classification and ctx.classification.existing_result:
+            title = ctx.classification.existing_result.title or ""
+            if announce:
+                console.warn(Keys.download.youtube.file_exists_playlist(title=title))
+            record = {
+                "status": "success", "skipped": True,
+                "file_path": ctx.classification.existing_result.file_path,
+            }
+        elif ctx.downloaded_file is None:
+            record = {"status": "error"}
+        else:
+            record = {
+                "status": "success", "skipped": False,
+                "file_path": ctx.downloaded_file.path,
+                "title": ctx.downloaded_file.title,
+            }
+        if record["status"] == "error" and not isinstance(res.error, CancelledError):
+            _mark(ctx, FAILED, error=str(res.error or ctx.error or ""))
+        records[fed[res.index]] = record
+
+    return [records[i] for i in sorted(records)]
+
+
+def _entry_url(item) -> str:
+    return item[1] if isinstance(item, tuple) else item
+
 
+def _file_size(path: str) -> int:
     try:
-        result = pipeline.run(url, target_dir, **ctx_kw)
-    except KeyboardInterrupt:
-        raise
-    except Exception as exc:
-        console.err(Keys.download.youtube.error_downloading(
-            type=media_type, error=str(exc),
-        ))
-        return None
+        return os.path.getsize(path)
+    except OSError:
+        return 0
 
-    if result.downloaded_file is None:
-        return None
 
-    return {
-        "title": result.downloaded_file.title,
-        "file_path": result.downloaded_file.path,
-        "skipped": False,
-    }
+def _journal_file_exists(item: dict) -> bool:
+    path = item["data"].get("file_path") or (item["data"].get("file") or {}).get("path")
+    return isinstance(path, str) and bool(path) and os.path.exists(path)
+
+
+def _resume_context(ctx: PipelineContext, item: dict) -> bool:
+    """Restore a journalled item's download (and enrichment) onto *ctx*.
+
+    Returns False when the item has to start over: it never finished
+    downloading, or its file is gone.
+    """
+    if item["state"] not in (DOWNLOADED, ENRICHED) or not _journal_file_exists(item):
+        return False
+    data = item["data"]
+    try:
+        downloaded = DownloadedFile.model_validate(data["file"])
+    except Exception:
+        return False
+    if downloaded.info is None:
+        return False
+    enrichment = data.get("enrichment") if item["state"] == ENRICHED else None
+    try:
+        ctx.enrichment_data = CoverData(**enrichment) if enrichment else None
+    except TypeError:
+        return False
+    ctx.media_info = downloaded.info
+    ctx.downloaded_file = downloaded
+    return True
+
+
+def _tally(records: list[dict]) -> tuple[int, int, int]:
+    success = sum(1 for r in records if r["status"] == "success" and not r.get("skipped"))
+    skipped = sum(1 for r in records if r["status"] == "success" and r.get("skipped"))
+    return success, skipped, len(records) - success - skipped
 
 
 def _check_exists(
@@ -1096,22 +1522,19 @@ def _check_exists(
         )
 
 
-def _skip_registry_check(
-    url: str,
+def _registry_precheck(
+    urls: list[str],
     registry_media_type: str,
     dirs_to_check: list[str],
-    ordered_files: list[str] | None = None,
-) -> bool:
+) -> dict[str, dict]:
+    return registry.check_existing_many(
+        [extract_video_id(u) for u in urls], registry_media_type, dirs_to_check,
+    )
+
+
+def _skip_registry_check(url: str, existing: dict[str, dict]) -> dict | None:
     video_id = extract_video_id(url)
-    if not video_id:
-        return False
-    for check_dir in dirs_to_check:
-        exists, metadata = registry.check_existing(video_id, registry_media_type, check_dir)
-        if exists:
-            if ordered_files is not None and metadata.get("file_path"): # pyright: ignore[reportOptionalMemberAccess]
-                ordered_files.append(os.path.basename(metadata["file_path"])) # pyright: ignore[reportOptionalSubscript]
-            return True
-    return False
+    return existing.get(video_id) if video_id else None
 
 
 def _parse_playlist_indices(items: str, total: int) -> set[int]:
@@ -2,6 +2,16 @@ from __future__ import annotations
 
 from tetodl.core.pipeline.cleaners.title import clean_youtube_title
 from tetodl.core.domain.models import CoverResult, MediaInfo, PipelineContext
+from tetodl.core.domain.tagger import TagTransaction
+
+
+def tag_transaction(ctx: PipelineContext) -> TagTransaction:
+    """The item's pending tag writes; steps stage into it and
+    ``FinalizeStep`` saves the file once."""
+    if ctx.tag_transaction is None:
+        assert ctx.downloaded_file is not None
+        ctx.tag_transaction = TagTransaction(ctx.downloaded_file.path, ctx.config.audio_quality)
+    return ctx.tag_transaction
 
 
 def resolve_artist_title(
@@ -0,0 +1,109 @@
+"""
+Enrichment prefetch — start provider lookups as soon as extraction is done.
+
+Cover search, the cover image fetch and the lyrics search only need
+``media_info``, so they run on a small shared pool while the download is
+still in progress.  The later steps join them: ``ResolveEnrichmentStep``
+waits on the search future, while ``CoverStep`` and ``LyricsStep`` hit the
+same single-flight cache entries and either find the result ready or wait
+for the lookup already in flight instead of repeating it.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from tetodl.core.cover import CoverData, CoverQuery, CoverService
+from tetodl.core.domain.models import PipelineContext
+from tetodl.core.lyrics import search_lyrics
+from tetodl.core.pipeline.metadata import resolve_artist_title
+from tetodl.utils.tracer import traced
+
+POOL_SIZE = 4
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_cover_service = CoverService()
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="enrich")
+        return _pool
+
+
+def wants_enrichment(ctx: PipelineContext) -> bool:
+    return any([ctx.cover_mode, ctx.metadata_mode, ctx.lyrics_mode or ctx.config.lyrics_mode])
+
+
+def start_enrichment(ctx: PipelineContext) -> Future | None:
+    """Launch the provider lookups for *ctx* and attach the search future.
+
+    Must run after extraction; returns ``None`` when nothing is enabled or
+    there is nothing to search for.
+    """
+    info = ctx.media_info
+    if info is None or not wants_enrichment(ctx):
+        return None
+    artist, title = resolve_artist_title(info, ctx=ctx)
+    if not artist and not title:
+        return None
+
+    with traced(f'prefetching enrichment — {artist} / {title}'):
+        pool = _executor()
+        future = pool.submit(_search, pool, ctx, artist, title)
+        ctx.enrichment_future = future
+        return future
+
+
+def join_enrichment(ctx: PipelineContext) -> CoverData | None:
+    """Result of the prefetched cover search; ``None`` if it failed."""
+    future = ctx.enrichment_future
+    try:
+        return future.result() if future is not None else None
+    except Exception:
+        return None
+
+
+def _search(pool: ThreadPoolExecutor, ctx: PipelineContext,
+            artist: str, title: str) -> CoverData | None:
+    cover_data = _cover_service.search(CoverQuery(artist=artist, title=title))
+
+    # Image and lyrics go back on the pool as independent lookups; the
+    # search result only decides which URL / query they use.
+    url = _cover_url(ctx, cover_data)
+    if url:
+        pool.submit(_quiet, _cover_service.fetch, url)
+
+    if (ctx.lyrics_mode or ctx.config.lyrics_mode) and ctx.media_type == "audio":
+        info = ctx.media_info
+        assert info is not None
+        if cover_data is not None:
+            l_artist, l_title = cover_data.artist, cover_data.title
+        else:
+            l_artist, l_title = resolve_artist_title(info, ctx, ctx.cover_result)
+        pool.submit(_quiet, search_lyrics, l_artist, l_title, info.duration or 0.0)
+
+    return cover_data
+
+
+def _cover_url(ctx: PipelineContext, cover_data: CoverData | None) -> str | None:
+    """The image ``CoverStep`` will try first, mirroring its priority order."""
+    if not ctx.cover_mode or ctx.media_type != "audio" or ctx.config.audio_quality == "opus":
+        return None
+    if ctx.cover_url:
+        return ctx.cover_url
+    if cover_data is not None and cover_data.url:
+        return cover_data.url
+    info = ctx.media_info
+    return info.thumbnail if info else None
+
+
+def _quiet(fn, *args) -> None:
+    try:
+        fn(*args)
+    except Exception:
+        pass
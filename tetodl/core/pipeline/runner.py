@@ -1,4 +1,5 @@
 from tetodl.core.domain.models import AppConfig, PipelineContext
+from tetodl.core.pipeline.prefetch import start_enrichment
 from tetodl.core.pipeline.stages.classify import ClassifyStep
 from tetodl.core.pipeline.stages.cover import CoverStep, MetadataStep
 from tetodl.core.pipeline.stages.download import DownloadStep
@@ -17,13 +18,28 @@ class MediaPipeline:
 
     @trace
     def run(self, url: str, target_dir: str, **ctx_kw) -> PipelineContext:
-        ctx = PipelineContext(
+        ctx = self.acquire(self.context(url, target_dir, **ctx_kw))
+        if self.halted(ctx):
+            return ctx
+        ctx = self.enrich(ctx)
+        return self.postprocess(ctx)
+
+    def context(self, url: str, target_dir: str, **ctx_kw) -> PipelineContext:
+        return PipelineContext(
             config=self._config,
             url=url,
             target_dir=target_dir,
             **ctx_kw,
         )
 
+    # The three phases below are what the staged playlist executor runs on
+    # separate worker pools; ``run`` simply chains them for a single item.
+
+    def acquire(self, ctx: PipelineContext) -> PipelineContext:
+        """Network phase: extract, classify and download.
+
+        Check :meth:`halted` before running the later phases.
+        """
         ctx = ExtractStep()(ctx)
         if ctx.error:
             with traced(f'extract failed — {ctx.error}'):
@@ -36,6 +52,8 @@ class MediaPipeline:
         if ctx.classification and ctx.classification.existing_result:
             return ctx
 
+        # Provider lookups need only media_info; let them run during the download.
+        start_enrichment(ctx)
         self._show_start(ctx)
 
         with traced('starting download'):
@@ -43,10 +61,22 @@ class MediaPipeline:
         if ctx.error and ctx.downloaded_file is None:
             with traced(f'download failed — {ctx.error}'):
                 return ctx
+        return ctx
+
+    @staticmethod
+    def halted(ctx: PipelineContext) -> bool:
+        """True when :meth:`acquire` ended the item early."""
+        if ctx.classification and ctx.classification.existing_result:
+            return True
+        return bool(ctx.error) and ctx.downloaded_file is None
 
+    def enrich(self, ctx: PipelineContext) -> PipelineContext:
+        """HTTP phase: look up cover / metadata providers."""
         with traced('resolving enrichment'):
-            ctx = ResolveEnrichmentStep()(ctx)
+            return ResolveEnrichmentStep()(ctx)
 
+    def postprocess(self, ctx: PipelineContext) -> PipelineContext:
+        """Local phase: embed cover, tags and lyrics, then record the item."""
         with traced('processing cover'):
             ctx = CoverStep()(ctx)
 
@@ -56,8 +86,7 @@ class MediaPipeline:
         with traced('processing lyrics'):
             ctx = LyricsStep()(ctx)
 
-        ctx = FinalizeStep()(ctx)
-        return ctx
+        return FinalizeStep()(ctx)
 
     def _show_start(self, ctx: PipelineContext) -> None:
         label = ctx.media_type
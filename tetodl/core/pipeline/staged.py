@@ -0,0 +1,145 @@
+"""
+StagedExecutor — run items through a chain of stages, each with its own
+worker pool, joined by bounded queues.
+
+While one item is in a CPU-bound stage the next can already be in a
+network-bound one, so neither the link nor the CPU sits idle between
+items.  Bounded queues keep a fast upstream stage from running far ahead
+of a slow downstream one.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import CancelledError
+from dataclasses import dataclass
+from typing import Any
+
+from tetodl.utils.ydl_pool import close_thread_pool
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One link of a :class:`StagedExecutor` chain.
+
+    ``fn`` receives the item's current value and returns the value handed
+    to the next stage, or ``None`` to finish the item at this stage.
+    """
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+
+
+@dataclass
+class StageResult:
+    """Outcome of one item: its last value, the stage it stopped in, and
+    the exception that stopped it (``None`` on normal completion)."""
+    index: int
+    value: Any
+    stage: str
+    error: BaseException | None = None
+
+
+class StagedExecutor:
+    def __init__(self, stages: list[Stage], queue_size: int = 4) -> None:
+        if not stages:
+            raise ValueError("StagedExecutor needs at least one stage")
+        self._stages = stages
+        self._queue_size = max(1, queue_size)
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop feeding new items; queued items finish as cancelled."""
+        self._cancel.set()
+
+    def run(self, items: Iterable[Any]) -> list[StageResult]:
+        """Push *items* through every stage and return results in input order.
+
+        *items* is consumed lazily from a feeder thread, so a generator
+        that is still producing entries keeps the stages busy meanwhile.
+        Exceptions raised by a stage are recorded on that item's result;
+        an exception from *items* itself is re-raised once in-flight items
+        have drained.
+        """
+        stages = self._stages
+        last = len(stages) - 1
+        workers = [max(1, s.workers) for s in stages]
+        queues: list[queue.Queue] = [queue.Queue(maxsize=self._queue_size) for _ in stages]
+        results: dict[int, StageResult] = {}
+        remaining = list(workers)
+        lock = threading.Lock()
+        finished = threading.Event()
+        feed_error: list[BaseException] = []
+
+        def close(k: int) -> None:
+            for _ in range(workers[k]):
+                queues[k].put(_DONE)
+
+        def feed() -> None:
+            try:
+                for index, value in enumerate(items):
+                    if self._cancel.is_set():
+                        break
+                    queues[0].put((index, value))
+            except Exception as exc:
+                feed_error.append(exc)
+            finally:
+                close(0)
+
+        def work(k: int) -> None:
+            stage = stages[k]
+            q = queues[k]
+            while True:
+                job = q.get()
+                if job is _DONE:
+                    break
+                index, value = job
+                if self._cancel.is_set():
+                    res = StageResult(index, value, stage.name, CancelledError())
+                else:
+                    try:
+                        out = stage.fn(value)
+                    except Exception as exc:
+                        res = StageResult(index, value, stage.name, exc)
+                    else:
+                        if out is not None and k < last:
+                            queues[k + 1].put((index, out))
+                            continue
+                        res = StageResult(index, value if out is None else out, stage.name)
+                with lock:
+                    results[index] = res
+
+            # Worker threads end with the run; release their yt-dlp instances.
+            close_thread_pool()
+            with lock:
+                remaining[k] -= 1
+                drained = remaining[k] == 0
+            if drained:
+                if k == last:
+                    finished.set()
+                else:
+                    close(k + 1)
+
+        threads = [threading.Thread(target=feed, name="stage-feed", daemon=True)]
+        for k, stage in enumerate(stages):
+            threads.extend(
+                threading.Thread(target=work, args=(k,), name=f"stage-{stage.name}-{n}", daemon=True)
+                for n in range(workers[k])
+            )
+        for t in threads:
+            t.start()
+
+        try:
+            while not finished.wait(0.2):
+                pass
+        except BaseException:
+            self.cancel()
+            raise
+
+        if feed_error:
+            raise feed_error[0]
+        return [results[i] for i in sorted(results)]
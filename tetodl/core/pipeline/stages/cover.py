@@ -3,8 +3,8 @@ import os
 from tetodl.core.cover import CoverData, CoverService
 from tetodl.core.domain.models import CoverResult, LyricsMetadata, MediaInfo, PipelineContext
 from tetodl.core.domain.step import PipelineStep
-from tetodl.core.domain.tagger import embed_cover, embed_metadata_tags
 from tetodl.core.pipeline.cleaners.title import clean_youtube_title
+from tetodl.core.pipeline.metadata import tag_transaction
 from tetodl.utils.console import console
 from tetodl.utils.files import clean_temp_files
 from tetodl.utils.i18n_keys import Keys
@@ -116,9 +116,9 @@ class CoverStep(PipelineStep[PipelineContext, PipelineContext]):
         console.proc(Keys.download.youtube.embedding_cover)
         meta = _basic_metadata(info, ctx)
 
-        if embed_cover(ctx.downloaded_file.path, path, ctx.config.audio_quality):
-            embed_metadata_tags(ctx.downloaded_file.path, ctx.config.audio_quality, meta)
-            console.ok(Keys.download.youtube.cover_success)
+        tags = tag_transaction(ctx)
+        if tags.set_cover(path):
+            tags.set_tags(meta)
         else:
             console.err(Keys.download.youtube.cover_failed)
 
@@ -169,9 +169,7 @@ class CoverStep(PipelineStep[PipelineContext, PipelineContext]):
         for url in candidates:
             data = self._cover_service.fetch(url)
             if data is not None:
-                with open(thumb_path, "wb") as f:
-                    f.write(data)
-                return self._cover_service.process(thumb_path, target_format="jpg")
+                return self._cover_service.save(data, thumb_path, target_format="jpg")
         return None
 
 
@@ -192,7 +190,7 @@ class MetadataStep(PipelineStep[PipelineContext, PipelineContext]):
             return ctx
 
         meta = _rich_metadata(cover_data, info, ctx)
-        embed_metadata_tags(ctx.downloaded_file.path, ctx.config.audio_quality, meta)
+        tag_transaction(ctx).set_tags(meta)
 
         if ctx.cover_result is None:
             ctx.cover_result = CoverResult(
@@ -1,16 +1,21 @@
 import glob
 import os
+import re
+import time
+from collections.abc import Callable
+from contextlib import nullcontext
 
 try:
     import yt_dlp as yt
 except ImportError:
     yt = None  # type: ignore[assignment]
 
-from yt_dlp.utils import sanitize_filename
+from yt_dlp.utils import DownloadError, ReExtractInfo, sanitize_filename
 
 from tetodl.core.domain.env import env
 from tetodl.core.domain.models import DownloadedFile, MediaInfo, PipelineContext
 from tetodl.core.domain.step import PipelineStep
+from tetodl.core.pipeline.concurrency import estimate_size
 from tetodl.utils.console import console
 from tetodl.utils.hooks import QuietLogger, get_postprocessor_hook, get_progress_hook
 from tetodl.utils.i18n_keys import Keys
@@ -18,7 +23,27 @@ from tetodl.utils.processing import (
     build_audio_postprocessors,
     get_audio_format_string,
 )
-from tetodl.utils.tracer import trace
+from tetodl.utils.ratelimit import youtube_bucket
+from tetodl.utils.tracer import trace, traced
+from tetodl.utils.ydl_pool import pooled_ydl
+
+# Signed format URLs carry their expiry (``expire=`` query or ``/expire/``
+# path segment).  Leave headroom for the download itself before trusting
+# them; without one, fall back to the extraction time.
+FORMAT_URL_MARGIN = 600
+FORMAT_URL_TTL = 3600
+_EXPIRE_RE = re.compile(r"[?&/]expire[=/](\d+)")
+
+
+def formats_fresh(raw: dict, now: float | None = None) -> bool:
+    """True when the format URLs in *raw* can still be downloaded."""
+    now = time.time() if now is None else now
+    for fmt in raw.get("formats") or ():
+        m = _EXPIRE_RE.search(fmt.get("url") or "")
+        if m:
+            return int(m.group(1)) - now > FORMAT_URL_MARGIN
+    epoch = raw.get("epoch")
+    return isinstance(epoch, (int, float)) and bool(epoch) and now - epoch < FORMAT_URL_TTL
 
 
 class DownloadStep(PipelineStep[PipelineContext, PipelineContext]):
@@ -44,10 +69,12 @@ class DownloadStep(PipelineStep[PipelineContext, PipelineContext]):
             ctx.downloaded_file = result
             return ctx
         except KeyboardInterrupt:
-            self._cleanup_partial(target_dir, safe)
+            if not ctx.keep_partial:
+                self._cleanup_partial(target_dir, safe)
             raise
         except Exception as exc:
-            self._cleanup_partial(target_dir, safe)
+            if not ctx.keep_partial:
+                self._cleanup_partial(target_dir, safe)
             ctx.error = str(exc)
             return ctx
 
@@ -71,9 +98,25 @@ class DownloadStep(PipelineStep[PipelineContext, PipelineContext]):
             opts["download_ranges"] = lambda info, ydl: [{"start_time": start, "end_time": end}]
             opts["force_keyframes_at_cuts"] = True
 
-        console.proc(Keys.download.youtube.downloading_item(title=title))
-        with yt.YoutubeDL(opts) as ydl:  # type: ignore[arg-type]
-            ydl.download([info.url])
+        raw, ctx.raw_info = ctx.raw_info, None
+        budget = ctx.disk_budget
+        with budget.reserve(estimate_size(raw)) if budget else nullcontext(True) as fits:
+            if not fits:
+                raise OSError(f"Not enough free disk space in {target_dir}")
+            transferred = self._watch_transfer(opts, ctx.transfer_done)
+
+            delay = youtube_bucket.reserve()
+            if delay > 0:
+                console.proc(Keys.download.youtube.wait_pacing(seconds=f"{delay:.1f}"))
+                time.sleep(delay)
+            console.proc(Keys.download.youtube.downloading_item(title=title))
+            with pooled_ydl(ctx.media_type, opts, yt.YoutubeDL) as ydl:
+                if isinstance(raw, dict) and formats_fresh(raw):
+                    self._download_from_info(ydl, raw, info.url)
+                else:
+                    ydl.download([info.url])
+            if transferred is not None:
+                transferred()
 
         container = ctx.config.audio_quality if ctx.media_type == "audio" else ctx.config.video_container
         path = os.path.join(target_dir, f"{safe}.{container}")
@@ -90,6 +133,47 @@ class DownloadStep(PipelineStep[PipelineContext, PipelineContext]):
             info=info,
         )
 
+    @staticmethod
+    def _watch_transfer(opts: dict, callback) -> Callable[[], None] | None:
+        """Hook *opts* so *callback* gets the transferred byte count as soon
+        as the first post-processor (merge, re-encode) starts.
+
+        Returns a function that fires it if no post-processor ran.
+        """
+        if callback is None:
+            return None
+        nbytes = 0
+        fired = False
+
+        def _fire() -> None:
+            nonlocal fired
+            if not fired:
+                fired = True
+                callback(nbytes)
+
+        def _progress(d: dict) -> None:
+            nonlocal nbytes
+            if d.get("status") == "finished":
+                nbytes += d.get("total_bytes") or d.get("downloaded_bytes") or 0
+
+        def _postprocessor(d: dict) -> None:
+            if d.get("status") == "started":
+                _fire()
+
+        opts["progress_hooks"] = [*(opts.get("progress_hooks") or ()), _progress]
+        opts["postprocessor_hooks"] = [*(opts.get("postprocessor_hooks") or ()), _postprocessor]
+        return _fire
+
+    @staticmethod
+    def _download_from_info(ydl, raw: dict, url: str) -> None:
+        """Download from the already-extracted info dict, the way yt-dlp's
+        ``--load-info-json`` does; re-extract from *url* if it is rejected."""
+        try:
+            ydl.process_ie_result(ydl.sanitize_info(raw, remove_private_keys=True), download=True)
+        except (DownloadError, ReExtractInfo) as exc:
+            with traced(f'stored formats rejected, re-extracting — {exc}'):
+                ydl.download([url])
+
     def _build_ydl_opts(self, ctx: PipelineContext) -> dict:
         if ctx.media_type == "video":
             return self._video_opts(ctx)
@@ -117,8 +201,6 @@ class DownloadStep(PipelineStep[PipelineContext, PipelineContext]):
             "fragment_retries": config.max_retries,
             "file_access_retries": config.max_retries,
             "extractor_retries": config.max_retries,
-            "sleep_interval": config.jitter_min,
-            "max_sleep_interval": config.jitter_max,
             "cachedir": env.get('ytdlp_cache_dir'),
         }
 
@@ -158,8 +240,6 @@ class DownloadStep(PipelineStep[PipelineContext, PipelineContext]):
             "fragment_retries": config.max_retries,
             "file_access_retries": config.max_retries,
             "extractor_retries": config.max_retries,
-            "sleep_interval": config.jitter_min,
-            "max_sleep_interval": config.jitter_max,
             "cachedir": env.get('ytdlp_cache_dir'),
         }
 
@@ -16,6 +16,8 @@ class ExtractStep(PipelineStep[PipelineContext, PipelineContext]):
 
         try:
             ctx.media_info = extractor.extract(ctx.url)
+            raw = getattr(extractor, "raw_info", None)
+            ctx.raw_info = raw if isinstance(raw, dict) else None
         except PipelineError as exc:
             with traced(f'extract failed — {exc}'):
                 ctx.error = str(exc)
@@ -5,6 +5,8 @@ from tetodl.core.domain.history import add_to_history
 from tetodl.core.domain.models import PipelineContext
 from tetodl.core.domain.step import PipelineStep
 from tetodl.core.pipeline.metadata import resolve_artist_title
+from tetodl.utils.console import console
+from tetodl.utils.i18n_keys import Keys
 from tetodl.utils.processing import extract_video_id
 from tetodl.utils.tracer import trace, traced
 
@@ -15,13 +17,33 @@ class FinalizeStep(PipelineStep[PipelineContext, PipelineContext]):
         if ctx.downloaded_file is None:
             return ctx
 
-        with traced('finalize: cache, history, scanner'):
+        with traced('finalize: tags, cache, history, scanner'):
+            self._write_tags(ctx)
             self._cache(ctx)
             self._add_to_history(ctx)
             self._run_scanner(ctx)
 
         return ctx
 
+    @staticmethod
+    def _write_tags(ctx: PipelineContext) -> None:
+        tags = ctx.tag_transaction
+        if tags is None or not tags.pending:
+            return
+        had_cover, had_lyrics = tags.has_cover, tags.has_lyrics
+        ok = tags.commit()
+        if had_cover:
+            if ok:
+                console.ok(Keys.download.youtube.cover_success)
+            else:
+                console.err(Keys.download.youtube.cover_failed)
+        if had_lyrics:
+            ctx.lyrics_embedded = ok
+            if ok:
+                console.ok(Keys.media.lyrics_embedded_success)
+            else:
+                console.err(Keys.media.failed_to_embed_lyrics)
+
     @staticmethod
     def _cache(ctx: PipelineContext) -> None:
         downloaded = ctx.downloaded_file
@@ -31,15 +53,15 @@ class FinalizeStep(PipelineStep[PipelineContext, PipelineContext]):
         if not info:
             return
         resolved_artist, resolved_title = resolve_artist_title(info, ctx, ctx.cover_result)
-        cache_metadata(ctx.url, {
-            "title": downloaded.title,
-            "duration": downloaded.duration,
-            "uploader": info.uploader,
-            "artist": resolved_artist,
-            "album": info.album or "",
-            "track": resolved_title,
-            "thumbnails": info.thumbnails,
-        })
+        # Keep the extracted fields intact so the extract stage can rebuild
+        # MediaInfo from this record; resolved tags ride alongside.
+        record = info.model_dump(exclude={"is_playlist", "entries"})
+        record.update(
+            duration=downloaded.duration or info.duration,
+            resolved_artist=resolved_artist,
+            resolved_track=resolved_title,
+        )
+        cache_metadata(info.id or ctx.url, record)
 
     @staticmethod
     def _add_to_history(ctx: PipelineContext) -> None:
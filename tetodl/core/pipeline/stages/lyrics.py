@@ -2,9 +2,8 @@ import os
 
 from tetodl.core.domain.models import PipelineContext
 from tetodl.core.domain.step import PipelineStep
-from tetodl.core.domain.tagger import embed_lyrics
 from tetodl.core.lyrics import search_lyrics
-from tetodl.core.pipeline.metadata import resolve_artist_title
+from tetodl.core.pipeline.metadata import resolve_artist_title, tag_transaction
 from tetodl.utils.console import console
 from tetodl.utils.i18n_keys import Keys
 from tetodl.utils.tracer import trace, traced
@@ -39,10 +38,10 @@ class LyricsStep(PipelineStep[PipelineContext, PipelineContext]):
                 console.warn(Keys.media.lyrics_not_found_genius)
                 return ctx
 
-        if embed_lyrics(audio_path, lyrics):
-            with traced('embed successful'):
-                console.ok(Keys.media.lyrics_embedded_success)
-                ctx.lyrics_embedded = True
+        tags = tag_transaction(ctx)
+        if tags.audio_format in ("mp3", "m4a", "flac"):
+            tags.set_lyrics(lyrics)
+            with traced('lyrics staged for embedding'):
                 return ctx
 
         with traced('embed failed'):
@@ -2,6 +2,7 @@ from tetodl.core.cover import CoverQuery, CoverService
 from tetodl.core.domain.models import CoverResult, LyricsMetadata, PipelineContext
 from tetodl.core.domain.step import PipelineStep
 from tetodl.core.pipeline.metadata import resolve_artist_title
+from tetodl.core.pipeline.prefetch import join_enrichment, wants_enrichment
 from tetodl.utils.tracer import trace
 
 
@@ -10,18 +11,20 @@ class ResolveEnrichmentStep(PipelineStep[PipelineContext, PipelineContext]):
 
     @trace
     def __call__(self, ctx: PipelineContext) -> PipelineContext:
-        if not any([ctx.cover_mode, ctx.metadata_mode, ctx.lyrics_mode or ctx.config.lyrics_mode]):
+        if not wants_enrichment(ctx):
             return ctx
 
         info = ctx.media_info
         if info is None:
             return ctx
 
-        artist, title = resolve_artist_title(info, ctx=ctx)
-        if not artist and not title:
-            return ctx
-
-        cover_data = self._cover_service.search(CoverQuery(artist=artist, title=title))
+        if ctx.enrichment_future is not None:
+            cover_data = join_enrichment(ctx)
+        else:
+            artist, title = resolve_artist_title(info, ctx=ctx)
+            if not artist and not title:
+                return ctx
+            cover_data = self._cover_service.search(CoverQuery(artist=artist, title=title))
         ctx.enrichment_data = cover_data
 
         if cover_data and ctx.cover_result is None:
@@ -2,6 +2,8 @@ from tetodl.core.domain.env import env
 from tetodl.core.extractor import Extractor, register_extractor
 from tetodl.core.domain.models import MediaInfo
 from tetodl.core.domain.step import PipelineError
+from tetodl.utils.ratelimit import pace_youtube
+from tetodl.utils.ydl_pool import pooled_ydl
 
 try:
     import yt_dlp as yt
@@ -19,12 +21,13 @@ class SearchExtractor(Extractor):
             raise PipelineError("yt-dlp is not available", "extract")
 
         try:
-            with yt.YoutubeDL({
+            pace_youtube()
+            with pooled_ydl("full", {
                 "quiet": True,
                 "no_warnings": True,
                 "extract_flat": False,
                 "cachedir": env.get('ytdlp_cache_dir'),
-            }) as ydl:
+            }, yt.YoutubeDL) as ydl:
                 raw = ydl.extract_info(url, download=False)
         except Exception as exc:
             raise PipelineError(
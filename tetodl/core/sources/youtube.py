@@ -9,11 +9,38 @@ try:
 except ImportError:
     yt = None  # type: ignore[assignment]
 
+from tetodl.core.domain.cache import cache_metadata, get_cached_metadata
 from tetodl.core.domain.env import env
 from tetodl.core.extractor import Extractor, register_extractor
 from tetodl.core.domain.models import MediaInfo
 from tetodl.core.domain.step import PipelineError
+from tetodl.utils.processing import extract_video_id
 from tetodl.utils.tracer import trace, traced
+from tetodl.utils.ratelimit import pace_youtube
+from tetodl.utils.ydl_pool import pooled_ydl
+
+# Fields of a single-video MediaInfo persisted in the yt_metadata cache.
+_CACHED_FIELDS = tuple(
+    name for name in MediaInfo.model_fields if name not in ("is_playlist", "entries")
+)
+
+
+def _single_video_id(url: str) -> str | None:
+    """Video id for URLs that resolve to one video, ``None`` for playlists."""
+    if "list=" in url or "/playlist" in url:
+        return None
+    return extract_video_id(url)
+
+
+def _from_cache(video_id: str) -> MediaInfo | None:
+    cached = get_cached_metadata(video_id)
+    # Records written before ids were cached lack "id"; re-extract those.
+    if not isinstance(cached, dict) or not cached.get("id") or not cached.get("title"):
+        return None
+    try:
+        return MediaInfo(**{k: cached[k] for k in _CACHED_FIELDS if k in cached})
+    except Exception:
+        return None
 
 
 class YouTubeExtractor(Extractor):
@@ -26,8 +53,19 @@ class YouTubeExtractor(Extractor):
         if yt is None:
             raise PipelineError("yt-dlp is not available", "extract")
 
+        # The download stage resolves format URLs itself, so a fresh cached
+        # record is all the metadata a single video needs.
+        video_id = _single_video_id(url)
+        if video_id:
+            cached = _from_cache(video_id)
+            if cached is not None:
+                with traced(f'metadata cache hit — {video_id}'):
+                    return cached
+
         try:
-            with yt.YoutubeDL({"quiet": True, "no_warnings": True, "extract_flat": False, "cachedir": env.get('ytdlp_cache_dir')}) as ydl:
+            opts = {"quiet": True, "no_warnings": True, "extract_flat": False, "cachedir": env.get('ytdlp_cache_dir')}
+            pace_youtube()
+            with pooled_ydl("full", opts, yt.YoutubeDL) as ydl:
                 raw: Any = ydl.extract_info(url, download=False)
         except Exception as exc:
             with traced(f'extract failed — {exc}'):
@@ -55,7 +93,7 @@ class YouTubeExtractor(Extractor):
 
         is_pl = raw.get("_type") == "playlist" or bool(raw.get("entries"))
         with traced(f'is_playlist={is_pl}, entries={len(entries) if entries else 0}'):
-            return MediaInfo(
+            info = MediaInfo(
                 id=raw.get("id", ""),
                 title=raw.get("title", ""),
                 url=raw.get("webpage_url", url),
@@ -72,5 +110,11 @@ class YouTubeExtractor(Extractor):
                 entries=entries,
             )
 
+        if not is_pl:
+            self.raw_info = raw
+            if video_id and info.id:
+                cache_metadata(info.id, info.model_dump(include=set(_CACHED_FIELDS)))
+        return info
+
 
 register_extractor(YouTubeExtractor)
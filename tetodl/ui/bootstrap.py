@@ -5,6 +5,7 @@ import sys
 import threading
 
 from tetodl.core.domain import config as cfg
+from tetodl.core.domain.cache import start_flusher
 from tetodl.core.domain.config import initialize_config
 from tetodl.core.domain.history import load_history
 from tetodl.core.dependency import get_ytdlp_version_info
@@ -17,6 +18,7 @@ def setup_application(force_recheck=False):
         env.recheck()
     initialize_config()
     load_history()
+    start_flusher(cfg.cache_flush_interval, cfg.cache_flush_threshold)
 
     if force_recheck or not cfg.verified_dependencies:
         from tetodl.ui.tui.verifier import verify_dependencies
@@ -83,10 +83,10 @@ def execute_download(session: DownloadSession):
 
                                         if moved_files:
                                             from tetodl.core.domain.registry import registry
-                                            for new_path in moved_files:
-                                                filename = os.path.basename(new_path)
-                                                old_path = os.path.join(path_to_share, filename)
-                                                registry.update_path(old_path, new_path)
+                                            registry.relocate(
+                                                path_to_share, result.parent_dir,
+                                                filenames=[os.path.basename(p) for p in moved_files],
+                                            )
                                             console.ok(Keys.dispatch.moved_files_and_updated(count=len(moved_files)))
                                         else:
                                             console.neutral(Keys.dispatch.no_files_moved)
@@ -24,6 +24,7 @@ from ...utils.console import console
 from ...utils.i18n_keys import Keys
 from ...core.domain import config as cfg
 from ...core.domain import config as config_mgr
+from ...core.domain.cache import flush_all, start_flusher, stop_flusher
 from ...core.domain.env import env
 from ...core.domain.models import DownloadResult, DownloadSession
 from ...utils.display import get_free_space
@@ -68,8 +69,10 @@ async def cleanup_worker():
 async def lifespan(app: FastAPI):
     os.makedirs(TempManager.get_temp_dir(), exist_ok=True)
     cleanup_task = asyncio.create_task(cleanup_worker())
+    start_flusher(cfg.cache_flush_interval, cfg.cache_flush_threshold)
     yield
     cleanup_task.cancel()
+    stop_flusher()
 
 # --- APP INITIALIZATION ---
 app = FastAPI(
@@ -173,6 +176,10 @@ def background_task_runner(task_id: str, session: DownloadSession, mode: str = '
         except Exception:
             pass
         task_data["logs"] = log_buf.getvalue()[-8000:]
+        # Flush-on-idle: persist new cache entries once the queue drains.
+        # Snapshot: request handlers add tasks to the dict concurrently.
+        if not any(t.get("status") == "processing" for t in list(active_tasks.values())):
+            flush_all()
 
 
 # ==========================================
@@ -30,6 +30,7 @@ from .network import (
     is_youtube_music_url,
 )
 from .processing import (
+    expand_content,
     extract_all_urls_from_content,
     extract_video_id,
 )
@@ -45,6 +46,7 @@ __all__ = [
     'colored_info',
     'colored_switch',
     'detect_system_language',
+    'expand_content',
     'extract_all_urls_from_content',
     'extract_video_id',
 
@@ -12,7 +12,7 @@ from ..utils.console import console
 from ..utils.files import get_free_space
 from ..utils.i18n_keys import Keys
 from ..utils.network import open_url
-from .formatters import clear
+from .formatters import clear, human_size
 
 
 def _assets_dir(is_binary: bool = False) -> Path:
@@ -88,6 +88,14 @@ def show_app_info(
     cpath = str(config_path) if config_path else "N/A"
     dpath = str(data_dir) if data_dir else "N/A"
     cache_sz = f"[cyan]{cache_mod.get_cache_size()}[/]" if cache_mod else "N/A"
+    cache_budget = "N/A"
+    if cache_mod:
+        usage = cache_mod.cache_usage()
+        used = sum(u for u, _ in usage.values())
+        budget = sum(b for _, b in usage.values())
+        cache_budget = f"[cyan]{human_size(used)}[/] / {human_size(budget)}\n" + "\n".join(
+            f"[dim]{ns}: {human_size(u)} / {human_size(b)}[/]" for ns, (u, b) in usage.items()
+        )
     _cfg = config_mod
 
     # --- SECTION 1: SYSTEM INFO ---
@@ -96,6 +104,7 @@ def show_app_info(
     table.add_row("Config Path", cpath)
     table.add_row("Data Path", dpath)
     table.add_row("Cache Size", cache_sz)
+    table.add_row("Cache Budget", cache_budget)
 
     # --- SECTION 2: STORAGE & PATHS ---
     table.add_section()
@@ -4009,6 +4009,26 @@ class _DownloadYoutubeFoundPlaylistCallable:
         """
         return ("download.youtube.found_playlist", {"count": count, "type": type, "title": title})
 
+class _DownloadYoutubeResumingJobCallable:
+    """
+    [Callable Props Type] ResumingJob
+    
+    Original template: "Resuming interrupted job: {title} ({remaining} of {total} items left)"
+    """
+    def __call__(self, *, title: Any, remaining: Any, total: Any) -> tuple[str, dict]:
+        """
+        Formats the translation string.
+        
+        Args:
+            title (Any): Dynamic value for {title}.
+            remaining (Any): Dynamic value for {remaining}.
+            total (Any): Dynamic value for {total}.
+        
+        Returns:
+            tuple[str, dict]: Key path and formatting dictionary.
+        """
+        return ("download.youtube.resuming_job", {"title": title, "remaining": remaining, "total": total})
+
 class _DownloadYoutubeSimpleModeStartCallable:
     """
     [Callable Props Type] SimpleModeStart
@@ -4266,6 +4286,24 @@ class _DownloadYoutubeWaitJitterCallable:
         """
         return ("download.youtube.wait_jitter", {"jitter_min": jitter_min, "jitter_max": jitter_max})
 
+class _DownloadYoutubeWaitPacingCallable:
+    """
+    [Callable Props Type] WaitPacing
+    
+    Original template: "Waiting {seconds}s before the next YouTube request..."
+    """
+    def __call__(self, *, seconds: Any) -> tuple[str, dict]:
+        """
+        Formats the translation string.
+        
+        Args:
+            seconds (Any): Dynamic value for {seconds}.
+        
+        Returns:
+            tuple[str, dict]: Key path and formatting dictionary.
+        """
+        return ("download.youtube.wait_pacing", {"seconds": seconds})
+
 class _DownloadYoutubeSummaryCallable:
     """
     [Callable Props Type] Summary
@@ -4508,6 +4546,12 @@ class _DownloadYoutubeK:
     
     Original template: "Found {count} {type} in playlist/album: {title}"
     """
+    resuming_job: _DownloadYoutubeResumingJobCallable = _DownloadYoutubeResumingJobCallable()
+    """
+    [Callable Props Type] ResumingJob
+    
+    Original template: "Resuming interrupted job: {title} ({remaining} of {total} items left)"
+    """
     simple_mode_start: _DownloadYoutubeSimpleModeStartCallable = _DownloadYoutubeSimpleModeStartCallable()
     """
     [Callable Props Type] SimpleModeStart
@@ -4614,6 +4658,12 @@ class _DownloadYoutubeK:
     
     Original template: "Waiting {jitter_min}-{jitter_max}s before next download..."
     """
+    wait_pacing: _DownloadYoutubeWaitPacingCallable = _DownloadYoutubeWaitPacingCallable()
+    """
+    [Callable Props Type] WaitPacing
+    
+    Original template: "Waiting {seconds}s before the next YouTube request..."
+    """
     summary: _DownloadYoutubeSummaryCallable = _DownloadYoutubeSummaryCallable()
     """
     [Callable Props Type] Summary
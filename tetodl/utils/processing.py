@@ -5,10 +5,13 @@ Absorbs logic from old 'yt_helpers' and 'extract_video_id'.
 import os
 import re
 import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
 
 from tetodl.utils.tracer import trace, traced
 
 from ..utils.network import is_youtube_music_url
+from ..utils.ratelimit import pace_youtube
 
 
 def _default_ytdlp_cache_dir() -> str:
@@ -16,8 +19,10 @@ def _default_ytdlp_cache_dir() -> str:
 
 try:
     import yt_dlp as yt
+    from yt_dlp.utils import PlaylistEntries
 except ImportError:
     yt = None  # type: ignore[assignment]
+    PlaylistEntries = None  # type: ignore[assignment,misc]
 
 # --- ID EXTRACTION  ---
 def extract_video_id(url):
@@ -66,39 +71,99 @@ def build_audio_postprocessors(audio_format, is_youtube_music=False):
     return postprocessors
 
 # --- URL EXTRACTION ---
+@dataclass
+class ContentListing:
+    """Playlist/album/single as returned by :func:`expand_content`.
+
+    ``entries`` yields ``(index, url)`` pairs as the listing pages arrive;
+    ``index`` is the 1-based position in the source playlist.  ``count`` is
+    only known when the site reports the length up front.
+    """
+    title: str
+    entries: Iterator[tuple[int, str]]
+    is_playlist: bool = False
+    count: int | None = None
+
+
+def _entry_urls(ydl, info: dict, is_yt_music: bool) -> Iterator[tuple[int, str]]:
+    base = "https://music.youtube.com/watch?v=" if is_yt_music else "https://www.youtube.com/watch?v="
+    try:
+        # PlaylistEntries honours the 'playlist_items' option and pulls
+        # pages from the extractor only as far as the selection reaches.
+        for index, entry in PlaylistEntries(ydl, info).get_requested_items():
+            if not entry:
+                continue
+            if entry.get('url'):
+                yield index, entry['url']
+            elif entry.get('id'):
+                yield index, f"{base}{entry['id']}"
+    except Exception as exc:
+        with traced(f'listing stopped — {exc}'):
+            return
+    finally:
+        ydl.close()
+
+
+# url / url_transparent hops followed before giving up on a listing.
+_MAX_REDIRECTS = 5
+
+
 @trace
-def extract_all_urls_from_content(url, ytdlp_cache_dir=None):
-    """Extract URLs from Playlist/Album/Single"""
+def expand_content(url, playlist_items=None, ytdlp_cache_dir=None) -> ContentListing:
+    """Expand a Playlist/Album/Single without waiting for the whole listing.
+
+    Only the first page is fetched here; later pages are fetched while
+    ``entries`` is consumed.  *playlist_items* (a set of 1-based indices)
+    is handed to yt-dlp so pages past the selection are never requested.
+    """
     if ytdlp_cache_dir is None:
         ytdlp_cache_dir = _default_ytdlp_cache_dir()
     is_yt_music = is_youtube_music_url(url)
-    ydl_opts = {'extract_flat': True, 'quiet': True, 'no_warnings': True, 'cachedir': ytdlp_cache_dir}
+    ydl_opts = {
+        'extract_flat': True, 'lazy_playlist': True,
+        'quiet': True, 'no_warnings': True, 'cachedir': ytdlp_cache_dir,
+    }
+    if playlist_items:
+        ydl_opts['playlist_items'] = format_playlist_items(playlist_items)
 
+    # Not a pooled instance: the entries generator outlives this call and
+    # is usually drained from another thread.
+    ydl = yt.YoutubeDL(ydl_opts)
     try:
-        with yt.YoutubeDL(ydl_opts) as ydl:  # type: ignore[arg-type]
-            info = ydl.extract_info(url, download=False)
-
-            if 'entries' in info:
-                urls = []
-                for entry in info['entries']:  # type: ignore[union-attr]
-                    if entry.get('url'):
-                        urls.append(entry['url']) # pyright: ignore[reportTypedDictNotRequiredAccess]
-                    elif entry.get('id'):
-                        vid = entry['id']
-                        base = "https://music.youtube.com/watch?v=" if is_yt_music else "https://www.youtube.com/watch?v="
-                        urls.append(f"{base}{vid}")
-
-                title = info.get('title', 'Unknown Playlist')
-                with traced(f'playlist — {title}, {len(urls)} items'):
-                    return urls, title, len(urls)
-            else:
-                target_url = info.get('webpage_url') or info.get('url') or url
-                title = info.get('title', 'Single Track')
-                with traced(f'single — {title}'):
-                    return [target_url], title, 1
+        pace_youtube()
+        info = ydl.extract_info(url, download=False, process=False)
+        # Without processing, redirects (YT Music album browse pages,
+        # /browse/VL… links, list-only watch URLs) come back unresolved.
+        for _ in range(_MAX_REDIRECTS):
+            if info.get('_type') not in ('url', 'url_transparent') or not info.get('url'):
+                break
+            pace_youtube()
+            info = ydl.extract_info(
+                info['url'], download=False, ie_key=info.get('ie_key'), process=False,
+            )
     except Exception as exc:
+        ydl.close()
         with traced(f'failed — {exc}'):
-            return [url], 'Unknown', 1
+            return ContentListing('Unknown', iter([(1, url)]))
+
+    if info.get('entries') is None:
+        ydl.close()
+        target_url = info.get('webpage_url') or info.get('url') or url
+        title = info.get('title', 'Single Track')
+        with traced(f'single — {title}'):
+            return ContentListing(title, iter([(1, target_url)]))
+
+    title = info.get('title') or 'Unknown Playlist'
+    count = info.get('playlist_count')
+    with traced(f'playlist — {title}, {count if count is not None else "?"} items'):
+        return ContentListing(title, _entry_urls(ydl, info, is_yt_music), True, count)
+
+
+def extract_all_urls_from_content(url, ytdlp_cache_dir=None):
+    """Extract URLs from Playlist/Album/Single"""
+    listing = expand_content(url, ytdlp_cache_dir=ytdlp_cache_dir)
+    urls = [entry_url for _, entry_url in listing.entries]
+    return urls, listing.title, len(urls)
 
 
 def get_platform_badge(platform: str, download_type: str | None = None) -> str:
@@ -177,4 +242,24 @@ def parse_playlist_items(items: str) -> set:
     if not selected_indices:
         raise ValueError("No valid items selected.")
         
-    return selected_indices
\ No newline at end of file
+    return selected_indices
+
+
+def format_playlist_items(indices) -> str:
+    """
+    Format a set of indices back into a yt-dlp 'playlist_items' string.
+
+    Consecutive indices collapse into ranges, e.g. {1, 2, 3, 7} -> '1-3,7'.
+    """
+    parts: list[str] = []
+    start = prev = None
+    for i in sorted(indices):
+        if prev is not None and i == prev + 1:
+            prev = i
+            continue
+        if start is not None:
+            parts.append(str(start) if start == prev else f"{start}-{prev}")
+        start = prev = i
+    if start is not None:
+        parts.append(str(start) if start == prev else f"{start}-{prev}")
+    return ",".join(parts)
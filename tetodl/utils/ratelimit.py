@@ -0,0 +1,94 @@
+"""
+Process-wide pacing of requests to YouTube.
+
+One token bucket sits in front of every point that actually talks to
+YouTube — extraction, the start of a download and YouTube Music searches —
+and is shared by all worker threads and, in the daemon, by all jobs.
+Work that makes no request (registry hits, cache hits, tagging) never
+waits, and idle time between requests refills the bucket instead of
+being slept away again.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Token bucket refilled at *rate* tokens per second, holding at most
+    *burst* tokens.  A caller that has to wait also waits a random extra
+    ``0..jitter`` seconds, so requests do not land on a fixed beat.
+
+    A *rate* of 0 disables pacing.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: float = 1.0,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self.rate = max(0.0, rate)
+        self.burst = max(1.0, burst)
+        self.jitter = max(0.0, jitter)
+        self._tokens = self.burst
+        self._stamp = clock()
+
+    def configure(self, rate: float, burst: float, jitter: float = 0.0) -> None:
+        """Change the pacing; tokens already in the bucket are kept."""
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = max(0.0, rate)
+            self.burst = max(1.0, burst)
+            self.jitter = max(0.0, jitter)
+            self._tokens = min(self._tokens, self.burst)
+
+    def _refill(self, now: float) -> None:
+        if self.rate:
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take *tokens* and return how long the caller must wait first.
+
+        The bucket may go negative: later callers queue up behind earlier
+        reservations instead of racing them.
+        """
+        with self._lock:
+            if not self.rate:
+                return 0.0
+            self._refill(self._clock())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate + random.uniform(0.0, self.jitter)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until *tokens* are available; return the seconds waited."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+youtube_bucket = TokenBucket()
+
+
+def configure_youtube_pacing(jitter_min: float, jitter_max: float, burst: float) -> None:
+    """Pace YouTube requests to one per *jitter_min*..*jitter_max* seconds
+    once *burst* back-to-back requests have been spent."""
+    rate = 1.0 / jitter_min if jitter_min > 0 else 0.0
+    youtube_bucket.configure(rate, burst, max(0.0, jitter_max - jitter_min))
+
+
+def pace_youtube() -> float:
+    """Block until the next YouTube request may go out."""
+    return youtube_bucket.acquire()
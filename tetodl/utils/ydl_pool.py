@@ -0,0 +1,131 @@
+"""
+Per-thread pool of ``yt_dlp.YoutubeDL`` instances, keyed by option profile.
+
+Building a YoutubeDL loads every extractor, a cookie jar and an HTTP
+director.  Keeping one instance per worker thread and profile (flat
+extract, full extract, audio download, video download) preserves those,
+along with keep-alive connections and in-memory player caches, across
+playlist items.
+
+Options that differ per item (output template, cut ranges, hooks, logger)
+are not part of the profile: they are swapped into the instance for the
+duration of one ``pooled_ydl`` block and reset afterwards.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+PER_CALL_OPTS = (
+    "outtmpl",
+    "download_ranges",
+    "force_keyframes_at_cuts",
+    "progress_hooks",
+    "postprocessor_hooks",
+    "logger",
+)
+MAX_PER_THREAD = 8
+
+_local = threading.local()
+
+
+def _instances() -> OrderedDict:
+    pool = getattr(_local, "instances", None)
+    if pool is None:
+        pool = _local.instances = OrderedDict()
+        _local.busy = set()
+    return pool
+
+
+def _profile_key(profile: str, opts: dict, factory: Callable) -> tuple:
+    fixed = sorted((k, repr(v)) for k, v in opts.items() if k not in PER_CALL_OPTS)
+    return profile, factory, tuple(fixed)
+
+
+def _apply(ydl: Any, opts: dict) -> None:
+    params = ydl.params
+    for key in ("download_ranges", "force_keyframes_at_cuts", "logger"):
+        if key in opts:
+            params[key] = opts[key]
+    params["outtmpl"] = opts.get("outtmpl", {})
+    ydl._parse_outtmpl()
+    for hook in opts.get("progress_hooks") or ():
+        ydl.add_progress_hook(hook)
+    for hook in opts.get("postprocessor_hooks") or ():
+        ydl.add_postprocessor_hook(hook)
+
+
+def _reset(ydl: Any) -> None:
+    params = ydl.params
+    for key in ("download_ranges", "force_keyframes_at_cuts", "logger"):
+        params.pop(key, None)
+    params["outtmpl"] = {}
+    ydl._parse_outtmpl()
+    ydl._progress_hooks = []
+    ydl._postprocessor_hooks = []
+    for pps in ydl._pps.values():
+        for pp in pps:
+            pp._progress_hooks = []
+
+
+def _close(ydl: Any) -> None:
+    try:
+        ydl.close()
+    except Exception:
+        pass
+
+
+@contextmanager
+def pooled_ydl(profile: str, opts: dict, factory: Callable[[dict], Any]) -> Iterator[Any]:
+    """Yield this thread's YoutubeDL for *profile* with *opts* applied.
+
+    *factory* is ``yt_dlp.YoutubeDL`` as imported by the caller.  A block
+    nested inside another one for the same profile gets a throwaway
+    instance rather than sharing the busy one.
+    """
+    pool = _instances()
+    busy: set = _local.busy
+    key = _profile_key(profile, opts, factory)
+    base = {k: v for k, v in opts.items() if k not in PER_CALL_OPTS}
+
+    if key in busy:
+        ydl = factory(base)
+        _apply(ydl, opts)
+        try:
+            yield ydl
+        finally:
+            _close(ydl)
+        return
+
+    ydl = pool.get(key)
+    if ydl is None:
+        ydl = pool[key] = factory(base)
+        while len(pool) > MAX_PER_THREAD:
+            _, old = pool.popitem(last=False)
+            _close(old)
+    pool.move_to_end(key)
+
+    busy.add(key)
+    try:
+        _apply(ydl, opts)
+        yield ydl
+    finally:
+        try:
+            _reset(ydl)
+        except Exception:
+            # An instance in an unknown state is not worth keeping.
+            pool.pop(key, None)
+            _close(ydl)
+        busy.discard(key)
+
+
+def close_thread_pool() -> None:
+    """Close and drop the calling thread's pooled instances."""
+    pool = _instances()
+    while pool:
+        _, ydl = pool.popitem()
+        _close(ydl)